@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: BLIT schema validation paths
+
+Compares, on N synthetic BLIT objects:
+  - legacy:   `import jsonschema; jsonschema.validate(instance, schema)` per object
+              (what blit_convert.main used to do; requires jsonschema)
+  - compiled: one compiled jsonschema validator reused (requires jsonschema)
+  - builtin:  the pure-Python subset validator from blit_validator
+
+Usage:
+  python3 backlog-item/bench_blit_validate.py [--count 5000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from blit_validator import BlitValidator, load_schema
+
+try:
+    import jsonschema  # type: ignore
+except ImportError:  # pragma: no cover - exercised when jsonschema is absent
+    jsonschema = None
+
+TRACK_STATES = [
+    ('Captured', 'Triaged', 'Not-Started', 'Implicit-Validated'),
+    ('Curated', 'Sized', 'In-Progress', 'Implicit-Validated'),
+    ('Curated', 'AC-Ready', 'Completed', 'Explicit-Accepted'),
+]
+
+
+def make_items(count: int) -> List[Dict]:
+    items = []
+    for n in range(count):
+        source, definition, execution, validation = TRACK_STATES[n % len(TRACK_STATES)]
+        ts = f"2025-01-{n % 28 + 1:02d}T{n % 24:02d}-{n % 60:02d}-{(n // 60) % 60:02d}Z"
+        items.append({
+            "$schema": "blit_schema.json",
+            "schema_version": "1.0",
+            "id": f"BLIT_BENCH{n % 97}_{ts}",
+            "title": f"Synthetic item {n}",
+            "context_unit_id": f"backlog-item-mcu-2025-01-01-{n + 1:03d}",
+            "metadata": {"Created": "2025-01-01T00:00:00Z", "Type": "backlog-item"},
+            "summary": {"objective": "Benchmark", "acceptance_criteria": ["one", "two"]},
+            "source_references": [{"text": "VIBE_NOTE", "href": f"../../VIBE_NOTE.md#note-{ts}"}],
+            "execution_links": {"plan": "", "pop": "", "status": ""},
+            "tracks": {
+                "source_track": source,
+                "definition_track": definition,
+                "execution_track": execution,
+                "validation_track": validation,
+                "docs_track": None,
+                "integration_evidence": None,
+                "defer_track": None,
+                "defer_status": None,
+                "defer_until": "2025-02-01" if n % 5 == 0 else None,
+            },
+            "workstreams": {},
+        })
+    return items
+
+
+def time_path(fn: Callable[[Dict], None], items: List[Dict], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for obj in items:
+            fn(obj)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description='Benchmark BLIT schema validation paths')
+    ap.add_argument('--count', type=int, default=5000, help='Number of synthetic items (default: 5000)')
+    ap.add_argument('--repeat', type=int, default=3, help='Repetitions; best time is reported (default: 3)')
+    args = ap.parse_args()
+
+    schema = load_schema()
+    items = make_items(args.count)
+    paths: Dict[str, Callable[[Dict], None]] = {}
+    if jsonschema is not None:
+        def legacy(obj: Dict) -> None:
+            jsonschema.validate(instance=obj, schema=schema)
+        paths['legacy'] = legacy
+        paths['compiled'] = BlitValidator(schema, backend='jsonschema').validate
+    else:
+        print("jsonschema not installed: legacy/compiled paths skipped")
+    paths['builtin'] = BlitValidator(schema, backend='builtin').validate
+
+    print(f"{'path':<10} {'total (s)':>10} {'per item (us)':>14} {'items/sec':>12}")
+    for name, fn in paths.items():
+        elapsed = time_path(fn, items, args.repeat)
+        print(f"{name:<10} {elapsed:>10.3f} {elapsed / len(items) * 1e6:>14.1f} {len(items) / elapsed:>12.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -12,20 +12,46 @@ Usage examples:
   # Convert JSON back to Markdown
   python3 backlog-item/blit_convert.py json-to-md --path BACKLOGS/ITEMS/BLIT_XXXX.json
 
+  # Bulk conversion across a worker pool (0 = one worker per CPU)
+  python3 backlog-item/blit_convert.py md-to-json --path BACKLOGS/ITEMS --jobs 8
+
+  # Skip items whose output is already newer than the source
+  python3 backlog-item/blit_convert.py md-to-json --path BACKLOGS/ITEMS --incremental
+
+  # Stream the whole backlog to one JSONL bundle (one item per line; '-' = stdout)
+  python3 backlog-item/blit_convert.py md-to-jsonl --path BACKLOGS/ITEMS --out backlog.jsonl
+
+  # Fan a JSONL bundle back out to per-item BLIT_<id>.md files
+  python3 backlog-item/blit_convert.py jsonl-to-md --path backlog.jsonl --out-dir BACKLOGS/ITEMS
+
 Notes:
 - For semantic identity, Markdown files can embed a canonical JSON block:
   <!-- BLIT_CANONICAL_JSON:BEGIN --> ... <!-- BLIT_CANONICAL_JSON:END -->
   When present, md-to-json will read and emit this canonical JSON (sorted keys).
+- Outputs are only rewritten when their bytes change, so repeat runs do not
+  touch mtimes or git status.
+- Items are validated against blit_schema.json via blit_validator (compiled
+  once; jsonschema when installed, otherwise a built-in subset validator).
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import sys
+import tempfile
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple
-import subprocess
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'base' / 'scripts'))
+from mcu_parser import parse_text  # noqa: E402
+from blit_validator import SCHEMA_PATH, BlitValidationError, get_validator  # noqa: E402,F401
+import mcu_profile  # noqa: E402
+from mcu_cli import jobs_arg  # noqa: E402
 
 
 def read_text(p: Path) -> str:
@@ -36,59 +62,24 @@ def write_text(p: Path, s: str) -> None:
     p.write_text(s, encoding="utf-8")
 
 
-def parse_metadata_block(lines: List[str], start_idx: int) -> Dict[str, str]:
-    meta: Dict[str, str] = {}
-    idx = start_idx
-    while idx < len(lines):
-        line = lines[idx]
-        if not line.startswith('- **'):
-            break
-        m = re.match(r"^- \*\*(.+?)\*\*:\s*(.*)$", line)
-        if m:
-            meta[m.group(1)] = m.group(2)
-        idx += 1
-    return meta
-
-
-def parse_list_items(lines: List[str], start_idx: int) -> Tuple[List[str], int]:
-    items: List[str] = []
-    idx = start_idx
-    while idx < len(lines):
-        line = lines[idx].rstrip()
-        if line.startswith('- '):
-            items.append(line[2:].strip())
-            idx += 1
-        else:
-            break
-    return items, idx
-
-
-def parse_source_refs(lines: List[str], start_idx: int) -> Tuple[List[Dict[str, str]], int]:
-    refs: List[Dict[str, str]] = []
-    idx = start_idx
-    link_re = re.compile(r"^- \[([^\]]+)\]\(([^\)]+)\)")
-    while idx < len(lines):
-        line = lines[idx].rstrip()
-        m = link_re.match(line)
-        if not m:
-            break
-        refs.append({"text": m.group(1), "href": m.group(2)})
-        idx += 1
-    return refs, idx
-
-
-def parse_tracks(lines: List[str], start_idx: int) -> Dict[str, str]:
-    tracks: Dict[str, str] = {}
-    idx = start_idx
-    while idx < len(lines):
-        line = lines[idx].strip()
-        if not line.startswith('- '):
-            break
-        m = re.match(r"^-\s*([a-z_]+):\s*(.*)$", line)
-        if m:
-            tracks[m.group(1)] = m.group(2)
-        idx += 1
-    return tracks
+def write_if_changed(p: Path, s: str) -> bool:
+    """Write s to p unless p already holds exactly these bytes; returns True if written."""
+    data = s.encode("utf-8")
+    try:
+        if p.stat().st_size == len(data) and p.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    p.write_bytes(data)
+    return True
+
+
+def is_up_to_date(src: Path, out: Path) -> bool:
+    """True when out exists and is at least as new as src."""
+    try:
+        return out.stat().st_mtime_ns >= src.stat().st_mtime_ns
+    except OSError:
+        return False
 
 
 CANON_BEGIN = "<!-- BLIT_CANONICAL_JSON:BEGIN -->"
@@ -104,7 +95,14 @@ def extract_canonical_json_block(text: str) -> str | None:
 
 
 def md_to_json(md_path: Path) -> Dict:
-    text = read_text(md_path)
+    timings = mcu_profile.active()
+    with timings.phase('read', md_path):
+        text = read_text(md_path)
+    with timings.phase('parse', md_path):
+        return md_text_to_json(text, md_path)
+
+
+def md_text_to_json(text: str, md_path: Path) -> Dict:
     # If canonical block present, prefer it
     canon = extract_canonical_json_block(text)
     if canon:
@@ -113,106 +111,44 @@ def md_to_json(md_path: Path) -> Dict:
             return obj
         except Exception:
             pass  # fall back to parse if malformed
-    lines = text.splitlines()
+    doc = parse_text(text, md_path)
     data: Dict = {
         "id": md_path.stem,
-        "title": "",
-        "context_unit_id": "",
-        "metadata": {},
+        "title": doc.title,
+        "context_unit_id": doc.context_unit_id or "",
+        "metadata": dict(doc.metadata),
         "summary": {"objective": "", "acceptance_criteria": []},
-        "source_references": [],
+        "source_references": list(doc.source_references),
         "execution_links": {"plan": "", "pop": "", "status": ""},
-        "tracks": {},
+        "tracks": dict(doc.tracks),
         "workstreams": {},
     }
 
-    # Title: first H1
-    for line in lines:
-        if line.startswith('# '):
-            data["title"] = line[2:].strip()
-            break
-
-    # Context Memory Unit
-    cmu = re.search(r"^## Context Memory Unit:\s*(.+)$", text, re.MULTILINE)
-    if cmu:
-        data["context_unit_id"] = cmu.group(1).strip()
-
-    # Metadata block (lines starting with - **Key**: Value)
-    for i, line in enumerate(lines):
-        if line.startswith('- **Created**:'):
-            meta = parse_metadata_block(lines, i)
-            data["metadata"] = meta
-            break
-
-    # Summary
-    sum_idx = text.find('\n## Summary')
-    if sum_idx != -1:
-        # Objective line
-        m = re.search(r"## Summary\n-\s*Objective:\s*(.*)", text)
+    # Summary: Objective on the first body line, Acceptance Criteria bullets until the next H2
+    summary_lines = doc.section_lines('Summary')
+    if summary_lines:
+        m = re.match(r"-\s*Objective:\s*(.*)", summary_lines[0])
         if m:
             data["summary"]["objective"] = m.group(1).strip()
-        # Acceptance Criteria bullets until next H2
-        ac = re.search(r"-\s*Acceptance Criteria:\n([\s\S]*?)\n## ", text)
-        if not ac:
-            ac = re.search(r"-\s*Acceptance Criteria:\n([\s\S]*)$", text)
-        if ac:
-            ac_block = ac.group(1).splitlines()
-            data["summary"]["acceptance_criteria"] = [l[2:].strip() for l in ac_block if l.strip().startswith('- ')]
-
-    # Source References section
-    refs_idx = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith('## Source References'):
-            refs_idx = i + 1
-            break
-    if refs_idx is not None:
-        refs, _ = parse_source_refs(lines, refs_idx)
-        data["source_references"] = refs
-
-    # Execution Links
-    el_idx = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith('## Execution Links'):
-            el_idx = i + 1
-            break
-    if el_idx is not None:
-        # Expect three lines: PLAN, POP, STATUS
-        for j in range(el_idx, min(el_idx + 6, len(lines))):
-            l = lines[j].strip()
-            if l.startswith('- PLAN:'):
-                data["execution_links"]["plan"] = l.split(':', 1)[1].strip()
-            elif l.startswith('- POP:'):
-                data["execution_links"]["pop"] = l.split(':', 1)[1].strip()
-            elif l.startswith('- STATUS:'):
-                data["execution_links"]["status"] = l.split(':', 1)[1].strip()
+        for i, l in enumerate(summary_lines):
+            if re.match(r"\s*-\s*Acceptance Criteria:$", l):
+                ac_block = summary_lines[i + 1:]
+                data["summary"]["acceptance_criteria"] = [a[2:].strip() for a in ac_block if a.strip().startswith('- ')]
+                break
 
-    # Tracks
-    tr_idx = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith('## Tracks'):
-            tr_idx = i + 1
-            break
-    if tr_idx is not None:
-        data["tracks"] = parse_tracks(lines, tr_idx)
+    # Execution Links: expect PLAN, POP, STATUS within the first few lines
+    for l in doc.section_lines('Execution Links')[:6]:
+        l = l.strip()
+        if l.startswith('- PLAN:'):
+            data["execution_links"]["plan"] = l.split(':', 1)[1].strip()
+        elif l.startswith('- POP:'):
+            data["execution_links"]["pop"] = l.split(':', 1)[1].strip()
+        elif l.startswith('- STATUS:'):
+            data["execution_links"]["status"] = l.split(':', 1)[1].strip()
 
     # Workstreams (optional)
-    ws_idx = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith('## Workstreams'):
-            ws_idx = i + 1
-            break
-    if ws_idx is not None:
-        ws: Dict[str, str] = {}
-        idx = ws_idx
-        while idx < len(lines):
-            l = lines[idx].strip()
-            if not l.startswith('- '):
-                break
-            m = re.match(r"^-\s*([a-z_]+):\s*(.*)$", l)
-            if m:
-                ws[m.group(1)] = m.group(2)
-            idx += 1
-        data["workstreams"] = ws
+    if doc.has_section('Workstreams'):
+        data["workstreams"] = dict(doc.workstreams)
 
     return data
 
@@ -271,74 +207,289 @@ def json_to_md(j: Dict) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
-def main() -> int:
+OPTIONAL_TRACK_KEYS = ['source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track',
+                       'defer_track', 'defer_status', 'defer_until', 'integration_evidence']
+
+
+def load_schema_validator(schema_path: Path = SCHEMA_PATH) -> Optional[Callable[[Dict], None]]:
+    """Return the compiled blit_schema.json validator (None if the schema file is absent).
+
+    Uses jsonschema when installed and the built-in subset validator otherwise.
+    """
+    if not schema_path.exists():
+        return None
+    return get_validator(schema_path).validate
+
+
+def normalize_empty_to_null(obj: Dict) -> None:
+    """Normalize empty-string optional tracks to null."""
+    tr = obj.get('tracks') or {}
+    for key in OPTIONAL_TRACK_KEYS:
+        if key in tr and tr[key] == '':
+            tr[key] = None
+    obj['tracks'] = tr
+
+
+def prepare_md_item(fp: Path) -> Dict:
+    """Parse a BLIT Markdown file into its normalized JSON object."""
+    return _normalize_md_item(md_to_json(fp))
+
+
+def prepare_md_text(text: str, fp: Path) -> Dict:
+    """prepare_md_item for Markdown text that is not (yet) on disk at fp."""
+    return _normalize_md_item(md_text_to_json(text, fp))
+
+
+def _normalize_md_item(data: Dict) -> Dict:
+    data.setdefault('$schema', 'blit_schema.json')
+    data.setdefault('schema_version', '1.0')
+    normalize_empty_to_null(data)
+    return data
+
+
+def render_json(data: Dict) -> str:
+    """The .json form written by md-to-json (canonical: sorted keys)."""
+    return json.dumps(data, indent=2, sort_keys=True)
+
+
+# convert_file outcomes
+WRITTEN = 'written'
+UNCHANGED = 'unchanged'
+SKIPPED = 'skipped'
+
+
+def output_path(fp: Path, mode: str, out_dir: Optional[Path]) -> Path:
+    suffix = '.json' if mode == 'md-to-json' else '.md'
+    return (out_dir / fp.name).with_suffix(suffix) if out_dir else fp.with_suffix(suffix)
+
+
+def convert_file(fp: Path, mode: str, out_dir: Optional[Path],
+                 validate: Optional[Callable[[Dict], None]], incremental: bool = False) -> str:
+    """Convert one file; returns WRITTEN, UNCHANGED or SKIPPED and raises on any failure.
+
+    The output is only written when its bytes differ from what is on disk.
+    With incremental=True, inputs whose output is already newer are skipped
+    without being parsed.
+    """
+    timings = mcu_profile.active()
+    out = output_path(fp, mode, out_dir)
+    if incremental and is_up_to_date(fp, out):
+        return SKIPPED
+    if mode == 'md-to-json':
+        data = prepare_md_item(fp)
+        if validate:
+            with timings.phase('schema', fp):
+                validate(data)
+        with timings.phase('emit', fp):
+            # Write canonical (sorted keys) to stabilize round-trips
+            rendered = render_json(data)
+            return WRITTEN if write_if_changed(out, rendered) else UNCHANGED
+    with timings.phase('read', fp):
+        data = json.loads(read_text(fp))
+    normalize_empty_to_null(data)
+    if validate:
+        with timings.phase('schema', fp):
+            validate(data)
+    with timings.phase('emit', fp):
+        rendered = json_to_md(data)
+        return WRITTEN if write_if_changed(out, rendered) else UNCHANGED
+
+
+# Per-worker state: the schema is loaded and compiled once per process
+_worker_state: Dict = {}
+
+
+def _init_worker(mode: str, out_dir: Optional[Path], incremental: bool = False) -> None:
+    _worker_state.update(mode=mode, out_dir=out_dir, incremental=incremental, validate=load_schema_validator())
+
+
+def _convert_in_worker(fp: Path) -> Tuple[Path, Optional[str], Optional[str]]:
+    try:
+        status = convert_file(fp, _worker_state['mode'], _worker_state['out_dir'], _worker_state['validate'],
+                              _worker_state['incremental'])
+        return fp, None, status
+    except Exception as e:  # report per-file failures without aborting the batch
+        return fp, str(e), None
+
+
+def convert_batch(files: List[Path], mode: str, out_dir: Optional[Path], jobs: int = 1,
+                  incremental: bool = False) -> List[Tuple[Path, Optional[str], Optional[str]]]:
+    """Convert files serially or across a process pool.
+
+    Returns (path, error-or-None, status-or-None) in input order.
+    """
+    timings = mcu_profile.active()
+    if jobs > 1 and len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(jobs, len(files))
+        chunksize = max(1, len(files) // (workers * 4))
+        with timings.phase('convert (pool)'), \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                    initargs=(mode, out_dir, incremental)) as pool:
+            return list(pool.map(_convert_in_worker, files, chunksize=chunksize))
+    with timings.phase('schema load'):
+        _init_worker(mode, out_dir, incremental)
+    return [_convert_in_worker(fp) for fp in files]
+
+
+# ----------------------------------------------------------------------
+# JSONL bundles: one item per line, streamed so memory stays flat
+# ----------------------------------------------------------------------
+def iter_md_items(files: Iterable[Path], validate: Optional[Callable[[Dict], None]]
+                  ) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """Yield (source, item-or-None, error-or-None) for each Markdown file."""
+    for fp in files:
+        try:
+            data = prepare_md_item(fp)
+            if validate:
+                validate(data)
+            yield str(fp), data, None
+        except Exception as e:
+            yield str(fp), None, str(e)
+
+
+def iter_jsonl(path: Path) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """Yield (source, item-or-None, error-or-None) for each non-blank line of a JSONL file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            source = f"{path}:{lineno}"
+            try:
+                data = json.loads(line)
+                if not isinstance(data, dict):
+                    raise ValueError('JSONL line is not an object')
+                yield source, data, None
+            except ValueError as e:
+                yield source, None, str(e)
+
+
+def write_jsonl(items: Iterable[Tuple[str, Optional[Dict], Optional[str]]], out: TextIO,
+                failures: List[Tuple[str, str]]) -> int:
+    """Write each item as one canonical JSON line; failed items are appended to failures."""
+    count = 0
+    for source, data, err in items:
+        if err is not None:
+            failures.append((source, err))
+            continue
+        out.write(json.dumps(data, sort_keys=True, ensure_ascii=False))
+        out.write('\n')
+        count += 1
+    return count
+
+
+def export_jsonl(files: Iterable[Path], out_path: str, validate: Optional[Callable[[Dict], None]]
+                 ) -> Tuple[int, List[Tuple[str, str]]]:
+    """Stream Markdown items into a JSONL file ('-' for stdout); the file is replaced atomically."""
+    failures: List[Tuple[str, str]] = []
+    items = iter_md_items(files, validate)
+    if out_path == '-':
+        return write_jsonl(items, sys.stdout, failures), failures
+    target = Path(out_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix='.tmp', dir=str(target.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as out:
+            count = write_jsonl(items, out, failures)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return count, failures
+
+
+def import_jsonl(path: Path, out_dir: Path, validate: Optional[Callable[[Dict], None]]
+                 ) -> Tuple[Counter, List[Tuple[str, str]]]:
+    """Fan a JSONL bundle out to <out_dir>/<id>.md files, writing only changed files."""
+    statuses: Counter = Counter()
+    failures: List[Tuple[str, str]] = []
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for source, data, err in iter_jsonl(path):
+        if err is None:
+            try:
+                item_id = str(data.get('id') or '')
+                if not item_id or Path(item_id).name != item_id:
+                    raise ValueError(f"Invalid or missing item id: {item_id!r}")
+                normalize_empty_to_null(data)
+                if validate:
+                    validate(data)
+                statuses[WRITTEN if write_if_changed(out_dir / f"{item_id}.md", json_to_md(data)) else UNCHANGED] += 1
+                continue
+            except Exception as e:
+                err = str(e)
+        failures.append((source, err))
+    return statuses, failures
+
+
+def _print_summary(count: int, statuses: Counter, failures: List[Tuple[str, str]], elapsed: float,
+                   out: TextIO = sys.stdout) -> int:
+    total = count + len(failures)
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"Converted {count} file(s) in {elapsed:.3f}s ({rate:.1f} files/sec): "
+          f"{statuses[WRITTEN]} written, {statuses[UNCHANGED]} unchanged, "
+          f"{statuses[SKIPPED]} skipped", file=out)
+    if failures:
+        print(f"Failed {len(failures)} file(s):", file=out)
+        for source, err in failures:
+            print(f"  - {source}: {err}", file=out)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description='Convert BLIT Markdown <-> JSON')
-    ap.add_argument('mode', choices=['md-to-json', 'json-to-md'])
-    ap.add_argument('--path', required=True, help='File or directory path')
+    ap.add_argument('mode', choices=['md-to-json', 'json-to-md', 'md-to-jsonl', 'jsonl-to-md'])
+    ap.add_argument('--path', required=True, help='File or directory path (a .jsonl file for jsonl-to-md)')
     ap.add_argument('--out-dir', default=None, help='Optional output directory; defaults to alongside input')
-    args = ap.parse_args()
-
+    ap.add_argument('--out', default=None, help="JSONL output file for md-to-jsonl ('-' for stdout)")
+    ap.add_argument('--jobs', '-j', type=jobs_arg, default=1, help='Worker processes (default: 1; 0 = one per CPU)')
+    ap.add_argument('--incremental', action='store_true',
+                    help='Skip inputs whose output file is already newer than the input')
+    mcu_profile.add_arguments(ap)
+    args = ap.parse_args(argv)
+    if args.mode == 'md-to-jsonl' and not args.out:
+        ap.error('md-to-jsonl requires --out FILE (or - for stdout)')
+    with mcu_profile.session(args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
     path = Path(args.path)
+    if args.mode == 'jsonl-to-md':
+        started = time.perf_counter()
+        statuses, failures = import_jsonl(path, Path(args.out_dir) if args.out_dir else path.parent,
+                                          load_schema_validator())
+        return _print_summary(sum(statuses.values()), statuses, failures, time.perf_counter() - started)
+
     files: List[Path] = []
-    if path.is_dir():
-        if args.mode == 'md-to-json':
-            files = sorted([p for p in path.glob('BLIT_*.md')])
+    with mcu_profile.active().phase('discover'):
+        if path.is_dir():
+            if args.mode in ('md-to-json', 'md-to-jsonl'):
+                files = sorted([p for p in path.glob('BLIT_*.md')])
+            else:
+                files = sorted([p for p in path.glob('BLIT_*.json')])
         else:
-            files = sorted([p for p in path.glob('BLIT_*.json')])
-    else:
-        files = [path]
+            files = [path]
+
+    if args.mode == 'md-to-jsonl':
+        started = time.perf_counter()
+        count, failures = export_jsonl(files, args.out, load_schema_validator())
+        summary_out = sys.stderr if args.out == '-' else sys.stdout
+        return _print_summary(count, Counter({WRITTEN: count}), failures, time.perf_counter() - started,
+                              summary_out)
 
-    count = 0
     out_dir = Path(args.out_dir) if args.out_dir else None
     if out_dir:
         out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load schema for validation
-    schema_path = Path(__file__).resolve().parent / 'blit_schema.json'
-    schema = json.loads(schema_path.read_text(encoding='utf-8')) if schema_path.exists() else None
-
-    def validate(obj: Dict):
-        if not schema:
-            return
-        try:
-            import jsonschema  # type: ignore
-            jsonschema.validate(instance=obj, schema=schema)
-        except ImportError:
-            # Fallback: attempt external validator if available
-            pass
-        except Exception as e:
-            raise SystemExit(f"Schema validation failed: {e}")
+    started = time.perf_counter()
+    results = convert_batch(files, args.mode, out_dir, args.jobs, args.incremental)
+    elapsed = time.perf_counter() - started
 
-    def normalize_empty_to_null(obj: Dict):
-        # Normalize empty-string optional tracks to null
-        tr = obj.get('tracks') or {}
-        for key in ['source_track','definition_track','execution_track','validation_track','docs_track','defer_track','defer_status','defer_until','integration_evidence']:
-            if key in tr and tr[key] == '':
-                tr[key] = None
-        obj['tracks'] = tr
-
-    for fp in files:
-        if args.mode == 'md-to-json':
-            data = md_to_json(fp)
-            data.setdefault('$schema', 'blit_schema.json')
-            data.setdefault('schema_version', '1.0')
-            normalize_empty_to_null(data)
-            validate(data)
-            out = (out_dir / fp.name).with_suffix('.json') if out_dir else fp.with_suffix('.json')
-            # Write canonical (sorted keys) to stabilize round-trips
-            out.write_text(json.dumps(data, indent=2, sort_keys=True), encoding='utf-8')
-        else:
-            data = json.loads(read_text(fp))
-            normalize_empty_to_null(data)
-            validate(data)
-            out = (out_dir / fp.name).with_suffix('.md') if out_dir else fp.with_suffix('.md')
-            write_text(out, json_to_md(data))
-        count += 1
-    print(f"Converted {count} file(s)")
-    return 0
+    failures = [(str(fp), err) for fp, err, _ in results if err is not None]
+    statuses = Counter(status for _, _, status in results if status is not None)
+    return _print_summary(len(results) - len(failures), statuses, failures, elapsed)
 
 
 if __name__ == '__main__':
     raise SystemExit(main())
-
-
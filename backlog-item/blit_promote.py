@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+BLIT promotion: VIBE_NOTE entries -> Discovery backlog items
+
+Finds every VIBE_NOTE entry without a matching BLIT and generates, in one
+transaction, the missing `BLIT_<systemID>_<timestamp>.md` items (rendered by
+blit_convert.json_to_md, validated against blit_schema.json), their `.json`
+siblings (as `blit_convert.py md-to-json` writes them) and their
+`## Items Index` entries in BACKLOG_MAIN.md.
+
+As with hand-promoted items, the date in `context_unit_id` is the note's
+date, not the promotion date; sequences continue after the highest one
+already used for that date.
+
+A note is already promoted when an item exists with its timestamp in the
+filename, or any item's source references link to its `#note-...` anchor.
+
+Every output is first written to a temporary file next to its target; only
+when all of them are written are they renamed into place with os.replace.
+A failure before that point leaves the tree untouched, and a failure while
+renaming removes the items already moved in, so the backlog index and items
+never disagree.
+
+Usage:
+  # Show what would be promoted
+  python3 backlog-item/blit_promote.py --dry-run
+
+  # Promote every pending note
+  python3 backlog-item/blit_promote.py
+
+  # Only notes in a timestamp range (prefixes allowed), with an explicit systemID
+  python3 backlog-item/blit_promote.py --since 2025-08-10 --system-id 007F0101
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'base' / 'scripts'))
+from blit_convert import (json_to_md, load_schema_validator, normalize_empty_to_null,  # noqa: E402
+                          prepare_md_text, render_json)
+from mcu_parser import parse_text  # noqa: E402
+from vibe_note import NoteEntry, VibeNoteIndex, note_anchor  # noqa: E402
+
+ITEMS_INDEX_HEADING = '## Items Index'
+ITEM_FILE_RE = re.compile(r'^BLIT_[A-Za-z0-9_]+?_(\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}Z)\.md$')
+CONTEXT_ID_RE = re.compile(r'^backlog-item-mcu-(\d{4}-\d{2}-\d{2})-(\d+)$')
+NOTE_HREF_RE = re.compile(r'#(note-\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}Z)')
+SYSTEM_ID_MAX_LEN = 16
+
+ACCEPTANCE_CRITERIA = [
+    'Source reference to VIBE_NOTE entry is linked',
+    'Problem statement and initial scope drafted',
+    'Proposed next steps identified (triage: right-sized vs split/bundle)',
+]
+
+
+class PromotionError(RuntimeError):
+    """Raised when the promotion transaction cannot be completed."""
+
+
+def default_system_id() -> str:
+    """`hostid`, else the first 8 of /etc/machine-id, else sanitized `uname -n` (uppercased)."""
+    try:
+        out = subprocess.run(['hostid'], capture_output=True, text=True, timeout=5).stdout.strip()
+        if re.fullmatch(r'[0-9A-Fa-f]+', out):
+            return out.upper()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    try:
+        machine_id = Path('/etc/machine-id').read_text(encoding='utf-8').strip()
+        if machine_id:
+            return machine_id[:8].upper()
+    except OSError:
+        pass
+    name = re.sub(r'[^A-Za-z0-9]', '_', socket.gethostname() or 'LOCAL')
+    return name.upper()[:SYSTEM_ID_MAX_LEN]
+
+
+def scan_items(items_dir: Path) -> Tuple[Set[str], Dict[str, int]]:
+    """Return (promoted note anchors, highest context sequence per date) for existing items."""
+    promoted: Set[str] = set()
+    sequences: Dict[str, int] = {}
+    for md_file in items_dir.glob('BLIT_*.md'):
+        m = ITEM_FILE_RE.match(md_file.name)
+        if m:
+            promoted.add('note-' + m.group(1))
+        doc = parse_text(md_file.read_text(encoding='utf-8'))
+        promoted.update(NOTE_HREF_RE.findall('\n'.join(doc.section_lines('Source References'))))
+        m = CONTEXT_ID_RE.match(doc.context_unit_id or '')
+        if m:
+            date, seq = m.group(1), int(m.group(2))
+            sequences[date] = max(sequences.get(date, 0), seq)
+    return promoted, sequences
+
+
+def pending_notes(notes: VibeNoteIndex, promoted: Set[str], start: Optional[str] = None,
+                  end: Optional[str] = None) -> List[NoteEntry]:
+    """Notes in [start, end] (timestamp prefixes) whose anchor no item references."""
+    return [entry for entry in notes.range(start, end) if note_anchor(entry.timestamp) not in promoted]
+
+
+def build_item(entry: NoteEntry, system_id: str, created: str, sequence: int, note_href: str) -> Dict:
+    """The Discovery BLIT object for a note (same shape as hand-promoted items)."""
+    anchor = note_anchor(entry.timestamp)
+    stamp = anchor[len('note-'):]
+    return {
+        'id': f'BLIT_{system_id}_{stamp}',
+        'title': f'{entry.title} — Discovery',
+        'context_unit_id': f'backlog-item-mcu-{entry.timestamp[:10]}-{sequence:03d}',
+        'metadata': {
+            'Created': created,
+            'Updated': created,
+            'Type': 'backlog-item',
+            'Version': '1.0',
+            'Project': 'MCU',
+            'Tool': 'BACKLOG',
+            'Category': 'governance',
+            'Tags': '["backlog-item", "discovery"]',
+        },
+        'summary': {
+            'objective': entry.title,
+            'acceptance_criteria': list(ACCEPTANCE_CRITERIA),
+        },
+        'source_references': [{'text': f'VIBE_NOTE: {stamp}', 'href': f'{note_href}#{anchor}'}],
+        'execution_links': {'plan': '', 'pop': '', 'status': ''},
+        'tracks': {
+            'source_track': 'Captured',
+            'definition_track': 'Triaged',
+            'execution_track': 'Not-Started',
+            'validation_track': 'Implicit-Validated',
+            'docs_track': '',
+            'integration_evidence': '',
+            'defer_track': '',
+            'defer_status': '',
+            'defer_until': '',
+        },
+        'workstreams': {'current_workstream_id': '', 'completed_workstreams': ''},
+    }
+
+
+def add_index_entries(backlog_text: str, links: Sequence[Tuple[str, str]]) -> str:
+    """Append `- [ ] [title](href)` lines to the `## Items Index` list, skipping hrefs already linked."""
+    new_lines = []
+    for title, href in links:
+        if f']({href})' not in backlog_text:
+            new_lines.append(f'- [ ] [{title}]({href})')
+    if not new_lines:
+        return backlog_text
+    lines = backlog_text.splitlines()
+    try:
+        start = next(i for i, line in enumerate(lines) if line.strip() == ITEMS_INDEX_HEADING)
+    except StopIteration:
+        body = backlog_text.rstrip('\n')
+        return f"{body}\n\n{ITEMS_INDEX_HEADING}\n" + '\n'.join(new_lines) + '\n'
+    # Insert after the last non-blank line of the section
+    insert_at = start + 1
+    for i in range(start + 1, len(lines)):
+        if lines[i].startswith('#'):
+            break
+        if lines[i].strip():
+            insert_at = i + 1
+    lines[insert_at:insert_at] = new_lines
+    return '\n'.join(lines) + '\n'
+
+
+def _write_temp(target: Path, text: str) -> Path:
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return Path(tmp)
+
+
+def commit_files(new_files: Sequence[Tuple[Path, str]], backlog: Tuple[Path, str]) -> None:
+    """Write new item files and the updated backlog index atomically as one unit.
+
+    All content goes to temporary files first; the items are then renamed into
+    place and the backlog index last. On failure the temporaries and any items
+    already renamed are removed.
+    """
+    staged: List[Tuple[Path, Path]] = []
+    moved: List[Path] = []
+    try:
+        for target, text in list(new_files) + [backlog]:
+            staged.append((_write_temp(target, text), target))
+        for tmp, target in staged[:-1]:
+            if target.exists():
+                raise PromotionError(f'{target} already exists')
+            os.replace(tmp, target)
+            moved.append(target)
+        tmp, target = staged[-1]
+        os.replace(tmp, target)
+    except BaseException:
+        for tmp, _ in staged:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+        for target in moved:
+            target.unlink()
+        raise
+
+
+def promote(notes_path: Path, items_dir: Path, backlog_path: Path, system_id: str,
+            start: Optional[str] = None, end: Optional[str] = None, now: Optional[datetime] = None,
+            validate: Optional[Callable[[Dict], None]] = None, dry_run: bool = False) -> List[Path]:
+    """Promote every pending note; return the item paths written (or that would be)."""
+    notes = VibeNoteIndex(notes_path)
+    notes.refresh()
+    promoted, sequences = scan_items(items_dir)
+    pending = pending_notes(notes, promoted, start, end)
+    if not pending:
+        return []
+
+    created = (now or datetime.now(timezone.utc)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    note_href = Path(os.path.relpath(notes_path.resolve(), items_dir.resolve())).as_posix()
+    new_files: List[Tuple[Path, str]] = []
+    links: List[Tuple[str, str]] = []
+    for entry in pending:
+        date = entry.timestamp[:10]
+        sequences[date] = sequences.get(date, 0) + 1
+        item = build_item(entry, system_id, created, sequences[date], note_href)
+        if validate is not None:
+            checked = copy.deepcopy(item)
+            normalize_empty_to_null(checked)
+            validate(checked)
+        target = items_dir / f"{item['id']}.md"
+        md_text = json_to_md(item)
+        new_files.append((target, md_text))
+        new_files.append((target.with_suffix('.json'), render_json(prepare_md_text(md_text, target))))
+        href = Path(os.path.relpath(target.resolve(), backlog_path.resolve().parent)).as_posix()
+        links.append((entry.title, href))
+
+    if not dry_run:
+        backlog_text = backlog_path.read_text(encoding='utf-8')
+        commit_files(new_files, (backlog_path, add_index_entries(backlog_text, links)))
+    return [target for target, _ in new_files if target.suffix == '.md']
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    repo_root = Path(__file__).resolve().parents[1]
+    parser = argparse.ArgumentParser(description='Promote VIBE_NOTE entries without a BLIT to Discovery items.')
+    parser.add_argument('--notes', default=str(repo_root / 'VIBE_NOTE.md'), help='Note file (default: VIBE_NOTE.md)')
+    parser.add_argument('--items-dir', default=str(repo_root / 'BACKLOGS' / 'ITEMS'), help='Items directory')
+    parser.add_argument('--backlog', default=str(repo_root / 'BACKLOGS' / 'BACKLOG_MAIN.md'),
+                        help='Backlog index to add `## Items Index` entries to')
+    parser.add_argument('--system-id', default=None, help='systemID for new item IDs (default: derived from host)')
+    parser.add_argument('--since', default=None, help='Only notes at or after this timestamp (prefix allowed)')
+    parser.add_argument('--until', default=None, help='Only notes up to this timestamp (prefix allowed)')
+    parser.add_argument('--dry-run', action='store_true', help='List the items that would be created')
+    parser.add_argument('--no-validate', action='store_true', help='Skip schema validation of generated items')
+    args = parser.parse_args(argv)
+
+    system_id = args.system_id or default_system_id()
+    if not re.fullmatch(r'[A-Za-z0-9_]+', system_id):
+        print(f"❌ Invalid systemID {system_id!r}: must match ^[A-Za-z0-9_]+$")
+        return 1
+    validate = None if args.no_validate else load_schema_validator()
+
+    start = time.perf_counter()
+    try:
+        written = promote(Path(args.notes), Path(args.items_dir), Path(args.backlog), system_id,
+                          start=args.since, end=args.until, validate=validate, dry_run=args.dry_run)
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        return 1
+    except Exception as e:
+        print(f"❌ Promotion failed, nothing written: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    for path in written:
+        print(f"{'Would create' if args.dry_run else '✅ Created'} {path.name}")
+    if not written:
+        print("✅ Every note already has a BLIT")
+    elif not args.dry_run:
+        print(f"✅ Promoted {len(written)} note(s) and updated {Path(args.backlog).name} in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+BLIT schema validation
+
+Compiles backlog-item/blit_schema.json once into a reusable validator.
+
+- When the optional `jsonschema` package is installed, the schema is checked
+  once and a compiled jsonschema validator is reused for every object.
+- Otherwise a built-in validator is used. It compiles the subset of JSON
+  Schema that blit_schema.json relies on (type, enum, pattern, required,
+  properties, additionalProperties, items) into nested closures, with every
+  regex compiled up front. Validation is never silently skipped.
+
+Library usage:
+  from blit_validator import get_validator
+  validator = get_validator()
+  validator.validate(obj)        # raises BlitValidationError
+  validator.errors(obj)          # list of messages
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+SCHEMA_PATH = Path(__file__).resolve().parent / 'blit_schema.json'
+
+# A compiled check yields error messages for the value at the given path
+Check = Callable[[object, str], Iterator[str]]
+
+_TYPE_TESTS: Dict[str, Callable[[object], bool]] = {
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'string': lambda v: isinstance(v, str),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'boolean': lambda v: isinstance(v, bool),
+    'null': lambda v: v is None,
+}
+
+SUPPORTED_KEYWORDS = {
+    '$schema', '$id', 'title', 'description', 'type', 'enum', 'pattern',
+    'required', 'properties', 'additionalProperties', 'items',
+}
+
+
+class BlitValidationError(ValueError):
+    """Raised when a BLIT object does not satisfy blit_schema.json."""
+
+
+class UnsupportedSchemaError(ValueError):
+    """Raised when the built-in validator meets a keyword it does not implement."""
+
+
+def _fmt_path(path: str) -> str:
+    return path or '$'
+
+
+def compile_schema(schema: Dict) -> Check:
+    """Compile a JSON Schema (subset) into a single check function."""
+    unknown = set(schema) - SUPPORTED_KEYWORDS
+    if unknown:
+        raise UnsupportedSchemaError(f"Unsupported schema keyword(s): {sorted(unknown)}")
+    checks: List[Check] = []
+
+    if 'type' in schema:
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        tests = [_TYPE_TESTS[t] for t in types]
+        expected = ', '.join(repr(t) for t in types)
+
+        def check_type(value, path, tests=tests, expected=expected):
+            if not any(test(value) for test in tests):
+                yield f"{_fmt_path(path)}: {value!r} is not of type {expected}"
+        checks.append(check_type)
+
+    if 'enum' in schema:
+        allowed = list(schema['enum'])
+
+        def check_enum(value, path, allowed=allowed):
+            # Compare with type so that e.g. False does not match 0
+            if not any(value == a and type(value) is type(a) for a in allowed):
+                yield f"{_fmt_path(path)}: {value!r} is not one of {allowed!r}"
+        checks.append(check_enum)
+
+    if 'pattern' in schema:
+        regex = re.compile(schema['pattern'])
+
+        def check_pattern(value, path, regex=regex):
+            if isinstance(value, str) and not regex.search(value):
+                yield f"{_fmt_path(path)}: {value!r} does not match {regex.pattern!r}"
+        checks.append(check_pattern)
+
+    required = list(schema.get('required', []))
+    properties = {name: compile_schema(sub) for name, sub in schema.get('properties', {}).items()}
+    additional = schema.get('additionalProperties', True)
+    additional_check: Optional[Check] = compile_schema(additional) if isinstance(additional, dict) else None
+    if required or properties or additional is not True:
+        def check_object(value, path, required=required, properties=properties,
+                         additional=additional, additional_check=additional_check):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    yield f"{_fmt_path(path)}: {name!r} is a required property"
+            for name, item in value.items():
+                sub_path = f"{path}.{name}" if path else name
+                prop_check = properties.get(name)
+                if prop_check is not None:
+                    yield from prop_check(item, sub_path)
+                elif additional is False:
+                    yield f"{_fmt_path(path)}: additional property {name!r} is not allowed"
+                elif additional_check is not None:
+                    yield from additional_check(item, sub_path)
+        checks.append(check_object)
+
+    if 'items' in schema:
+        item_check = compile_schema(schema['items'])
+
+        def check_items(value, path, item_check=item_check):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    yield from item_check(item, f"{path}[{i}]")
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, path, checks=tuple(checks)):
+        for check in checks:
+            yield from check(value, path)
+    return check_all
+
+
+class BlitValidator:
+    """Validator for BLIT objects, compiled once from the schema.
+
+    backend: 'auto' (jsonschema if installed, else built-in), 'jsonschema'
+    or 'builtin'.
+    """
+
+    def __init__(self, schema: Dict, backend: str = 'auto'):
+        self.schema = schema
+        self._jsonschema_validator = None
+        self._check: Optional[Check] = None
+        if backend in ('auto', 'jsonschema'):
+            try:
+                import jsonschema  # type: ignore
+            except ImportError:
+                if backend == 'jsonschema':
+                    raise
+            else:
+                validator_cls = jsonschema.validators.validator_for(schema)
+                validator_cls.check_schema(schema)
+                self._jsonschema_validator = validator_cls(schema)
+                self._best_match = jsonschema.exceptions.best_match
+        if self._jsonschema_validator is None:
+            self._check = compile_schema(schema)
+        self.backend = 'jsonschema' if self._jsonschema_validator is not None else 'builtin'
+
+    def errors(self, obj: object) -> List[str]:
+        if self._jsonschema_validator is not None:
+            return [f"{e.json_path}: {e.message}" for e in self._jsonschema_validator.iter_errors(obj)]
+        return list(self._check(obj, ''))
+
+    def is_valid(self, obj: object) -> bool:
+        if self._jsonschema_validator is not None:
+            return self._jsonschema_validator.is_valid(obj)
+        return next(iter(self._check(obj, '')), None) is None
+
+    def validate(self, obj: object) -> None:
+        if self._jsonschema_validator is not None:
+            error = self._best_match(self._jsonschema_validator.iter_errors(obj))
+            if error is not None:
+                raise BlitValidationError(f"Schema validation failed: {error.message}")
+            return
+        first = next(iter(self._check(obj, '')), None)
+        if first is not None:
+            raise BlitValidationError(f"Schema validation failed: {first}")
+
+    __call__ = validate
+
+
+def load_schema(schema_path: Path = SCHEMA_PATH) -> Dict:
+    return json.loads(Path(schema_path).read_text(encoding='utf-8'))
+
+
+@lru_cache(maxsize=None)
+def get_validator(schema_path: Path = SCHEMA_PATH, backend: str = 'auto') -> BlitValidator:
+    """Return the process-wide compiled validator for schema_path."""
+    return BlitValidator(load_schema(schema_path), backend)
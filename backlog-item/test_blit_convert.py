@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
+import io
 import os
 import shutil
 import tempfile
 import unittest
+from contextlib import redirect_stderr
 from pathlib import Path
 import json
 
-from blit_convert import md_to_json, json_to_md
+from blit_convert import (SKIPPED, UNCHANGED, WRITTEN, convert_batch, convert_file, export_jsonl, import_jsonl,
+                          main, md_to_json, json_to_md, prepare_md_item)
 
 
 SAMPLE_ID = 'BLIT_TESTPAIR_2025-01-01T00-00-00Z'
@@ -138,6 +141,71 @@ class TestBlitConvert(unittest.TestCase):
         # Compare semantic equality of JSON objects
         self.assertEqual(SAMPLE_JSON, obj2)
 
+    def test_batch_reports_failures_without_aborting(self):
+        files = []
+        for n in range(4):
+            md_path = self.tmpdir / f"BLIT_TESTPAIR_2025-01-01T00-00-0{n}Z.md"
+            md_path.write_text(SAMPLE_MD, encoding='utf-8')
+            files.append(md_path)
+        bad = self.tmpdir / 'BLIT_BROKEN_2025-01-01T00-00-00Z.md'
+        bad.mkdir()  # unreadable as a file
+        files.insert(2, bad)
+        out_dir = self.tmpdir / 'out'
+        out_dir.mkdir()
+
+        results = convert_batch(files, 'md-to-json', out_dir, jobs=2)
+
+        self.assertEqual([fp for fp, _, _ in results], files)
+        self.assertEqual([fp for fp, err, _ in results if err], [bad])
+        self.assertEqual(len(list(out_dir.glob('*.json'))), 4)
+
+    def test_incremental_skips_and_only_writes_changes(self):
+        md_path = self.tmpdir / f"{SAMPLE_ID}.md"
+        md_path.write_text(SAMPLE_MD, encoding='utf-8')
+        out = md_path.with_suffix('.json')
+
+        self.assertEqual(convert_file(md_path, 'md-to-json', None, None), WRITTEN)
+        mtime = out.stat().st_mtime_ns
+        self.assertEqual(convert_file(md_path, 'md-to-json', None, None, incremental=True), SKIPPED)
+
+        # Source touched but semantically identical: output bytes are left alone
+        os.utime(md_path, ns=(mtime + 10**9, mtime + 10**9))
+        self.assertEqual(convert_file(md_path, 'md-to-json', None, None, incremental=True), UNCHANGED)
+        self.assertEqual(out.stat().st_mtime_ns, mtime)
+
+        md_path.write_text(SAMPLE_MD.replace('Example objective', 'New objective'), encoding='utf-8')
+        os.utime(md_path, ns=(mtime + 2 * 10**9, mtime + 2 * 10**9))
+        self.assertEqual(convert_file(md_path, 'md-to-json', None, None, incremental=True), WRITTEN)
+
+    def test_jsonl_bundle_round_trip(self):
+        src = self.tmpdir / 'src'
+        src.mkdir()
+        files = []
+        for n in range(3):
+            md_path = src / f"BLIT_TESTPAIR_2025-01-01T00-00-0{n}Z.md"
+            md_path.write_text(SAMPLE_MD, encoding='utf-8')
+            files.append(md_path)
+        bundle = self.tmpdir / 'bundle.jsonl'
+
+        count, failures = export_jsonl(iter(files), str(bundle), None)
+        self.assertEqual((count, failures), (3, []))
+        lines = bundle.read_text(encoding='utf-8').splitlines()
+        self.assertEqual([json.loads(l)['id'] for l in lines], [f.stem for f in files])
+
+        with open(bundle, 'a', encoding='utf-8') as f:
+            f.write('{"id": "../escape"}\n')
+        out_dir = self.tmpdir / 'out'
+        statuses, failures = import_jsonl(bundle, out_dir, None)
+        self.assertEqual(statuses[WRITTEN], 3)
+        self.assertEqual(len(failures), 1)
+        for f in files:
+            self.assertEqual(md_to_json(out_dir / f.name), prepare_md_item(f))
+
+    def test_negative_jobs_is_a_usage_error(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            main(['md-to-json', '--path', str(self.tmpdir), '--jobs', '-3'])
+        self.assertEqual(cm.exception.code, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+import blit_promote
+from blit_convert import UNCHANGED, convert_file, load_schema_validator, md_to_json
+from blit_promote import add_index_entries, promote
+
+NOTES = """# VIBE NOTE
+
+<a id="note-2025-01-01T00-00-00Z"></a>
+## [2025-01-01T00:00:00Z] Already promoted
+- Scope: first
+
+<a id="note-2025-01-02T10-30-00Z"></a>
+## [2025-01-02T10:30:00Z] Second idea
+- Scope: second
+
+<a id="note-2025-01-03T08-00-00Z"></a>
+## [2025-01-03T08:00:00Z] Third idea
+- Scope: third
+"""
+
+EXISTING_ITEM = """# Already promoted — Discovery
+
+## Context Memory Unit: backlog-item-mcu-2025-01-01-001
+
+## Source References (≥1)
+- [VIBE_NOTE: 2025-01-01T00-00-00Z](../../VIBE_NOTE.md#note-2025-01-01T00-00-00Z)
+"""
+
+BACKLOG = """# BACKLOG MAIN
+
+## Items Index
+- [ ] [Already promoted](ITEMS/BLIT_OTHER_2025-02-01T00-00-00Z.md)
+
+## Notes
+- Default backlog index.
+"""
+
+NOW = datetime(2025, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class TestBlitPromote(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.notes = self.root / 'VIBE_NOTE.md'
+        self.items = self.root / 'BACKLOGS' / 'ITEMS'
+        self.backlog = self.root / 'BACKLOGS' / 'BACKLOG_MAIN.md'
+        self.items.mkdir(parents=True)
+        self.notes.write_text(NOTES, encoding='utf-8')
+        self.backlog.write_text(BACKLOG, encoding='utf-8')
+        (self.items / 'BLIT_OTHER_2025-02-01T00-00-00Z.md').write_text(EXISTING_ITEM, encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _promote(self, **kwargs):
+        return promote(self.notes, self.items, self.backlog, 'TESTSYS', now=NOW,
+                       validate=load_schema_validator(), **kwargs)
+
+    def test_promotes_pending_notes_and_indexes_them(self):
+        # An unrelated item already uses the first sequence of 2025-01-02
+        (self.items / 'BLIT_OTHER_2025-01-02T09-00-00Z.md').write_text(
+            EXISTING_ITEM.replace('2025-01-01-001', '2025-01-02-001').replace('2025-01-01T00-00-00Z', 'x'),
+            encoding='utf-8')
+        written = self._promote()
+        self.assertEqual([p.name for p in written], ['BLIT_TESTSYS_2025-01-02T10-30-00Z.md',
+                                                     'BLIT_TESTSYS_2025-01-03T08-00-00Z.md'])
+        item = md_to_json(written[0])
+        self.assertEqual(item['title'], 'Second idea — Discovery')
+        # The id carries the note's date; sequences continue after existing ids of that date
+        self.assertEqual(item['context_unit_id'], 'backlog-item-mcu-2025-01-02-002')
+        self.assertEqual(md_to_json(written[1])['context_unit_id'], 'backlog-item-mcu-2025-01-03-001')
+        # The .json siblings match what `blit_convert.py md-to-json` writes
+        for path in written:
+            self.assertTrue(path.with_suffix('.json').exists())
+            self.assertEqual(convert_file(path, 'md-to-json', None, None), UNCHANGED)
+        self.assertEqual(item['source_references'][0]['href'], '../../VIBE_NOTE.md#note-2025-01-02T10-30-00Z')
+        self.assertEqual(item['tracks']['source_track'], 'Captured')
+
+        lines = self.backlog.read_text(encoding='utf-8').splitlines()
+        index = lines.index('## Items Index')
+        self.assertEqual(lines[index + 2:index + 4], [
+            '- [ ] [Second idea](ITEMS/BLIT_TESTSYS_2025-01-02T10-30-00Z.md)',
+            '- [ ] [Third idea](ITEMS/BLIT_TESTSYS_2025-01-03T08-00-00Z.md)',
+        ])
+        self.assertEqual(lines[index + 4], '')
+
+        # A second run finds nothing left to promote
+        self.assertEqual(self._promote(), [])
+
+    def test_dry_run_and_range_write_nothing(self):
+        written = self._promote(start='2025-01-03', dry_run=True)
+        self.assertEqual([p.name for p in written], ['BLIT_TESTSYS_2025-01-03T08-00-00Z.md'])
+        self.assertFalse(written[0].exists())
+        self.assertFalse(written[0].with_suffix('.json').exists())
+        self.assertEqual(self.backlog.read_text(encoding='utf-8'), BACKLOG)
+
+    def test_failure_rolls_back_every_file(self):
+        real_replace = blit_promote.os.replace
+
+        def fail_on_backlog(src, dst):
+            if Path(dst) == self.backlog:
+                raise OSError('disk full')
+            return real_replace(src, dst)
+
+        before = sorted(p.name for p in self.items.iterdir())
+        with mock.patch.object(blit_promote.os, 'replace', side_effect=fail_on_backlog):
+            with self.assertRaises(OSError):
+                self._promote()
+        self.assertEqual(sorted(p.name for p in self.items.iterdir()), before)
+        self.assertEqual(self.backlog.read_text(encoding='utf-8'), BACKLOG)
+        self.assertEqual(list(self.backlog.parent.glob('.*.tmp')), [])
+
+    def test_add_index_entries_skips_existing_links(self):
+        text = add_index_entries(BACKLOG, [('Already promoted', 'ITEMS/BLIT_OTHER_2025-02-01T00-00-00Z.md')])
+        self.assertEqual(text, BACKLOG)
+
+
+if __name__ == '__main__':
+    unittest.main()
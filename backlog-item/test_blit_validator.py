@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+import copy
+import unittest
+
+from blit_validator import BlitValidationError, BlitValidator, load_schema
+from test_blit_convert import SAMPLE_JSON
+
+try:
+    import jsonschema  # type: ignore  # noqa: F401
+    HAVE_JSONSCHEMA = True
+except ImportError:
+    HAVE_JSONSCHEMA = False
+
+
+INVALID_CASES = {
+    'missing required': lambda o: o.pop('tracks'),
+    'bad id pattern': lambda o: o.__setitem__('id', 'not-a-blit'),
+    'bad enum': lambda o: o['tracks'].__setitem__('source_track', 'Unknown'),
+    'bad type': lambda o: o['summary'].__setitem__('acceptance_criteria', 'x'),
+    'bad array item': lambda o: o['source_references'].append({'text': 'x'}),
+    'extra execution link': lambda o: o['execution_links'].__setitem__('extra', ''),
+    'bad defer_until': lambda o: o['tracks'].__setitem__('defer_until', 'soon'),
+}
+
+
+class TestBuiltinValidator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = load_schema()
+        self.validator = BlitValidator(self.schema, backend='builtin')
+        return super().setUp()
+
+    def test_valid_sample(self):
+        self.assertEqual(self.validator.errors(SAMPLE_JSON), [])
+        self.validator.validate(SAMPLE_JSON)
+
+    def test_invalid_cases(self):
+        for name, mutate in INVALID_CASES.items():
+            with self.subTest(name):
+                obj = copy.deepcopy(SAMPLE_JSON)
+                mutate(obj)
+                self.assertFalse(self.validator.is_valid(obj))
+                with self.assertRaises(BlitValidationError):
+                    self.validator.validate(obj)
+
+    @unittest.skipUnless(HAVE_JSONSCHEMA, 'jsonschema not installed')
+    def test_agrees_with_jsonschema(self):
+        reference = BlitValidator(self.schema, backend='jsonschema')
+        for mutate in [lambda o: None, *INVALID_CASES.values()]:
+            obj = copy.deepcopy(SAMPLE_JSON)
+            mutate(obj)
+            self.assertEqual(reference.is_valid(obj), self.validator.is_valid(obj))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Backlog Track History
+
+Reconstructs per-item track transitions from the git history of
+BACKLOGS/ITEMS/*.md and reports cycle and lead times per workstream.
+
+A BLIT's `## Tracks` section only holds the current state; every commit that
+changed an item is a snapshot of it. The history is read with one
+`git log --raw` over the items path (first-parent, so merged work counts
+from when it landed) and one `git cat-file --batch` process for the file
+contents. Each snapshot's tracks are compared with the previous one, and
+changed values are recorded as transitions stamped with the commit time.
+
+The reconstructed state is kept in `.mcu_cache/history.json` together with
+the last processed commit, so a later run only reads the new commits. If the
+cached commit is no longer an ancestor of HEAD (history was rewritten), the
+cache is rebuilt.
+
+Metrics (days, per current workstream of each item):
+- lead time:  item first committed -> execution_track first Completed
+- cycle time: execution_track first In-Progress -> first Completed
+- in_progress / blocked: total time spent in those execution states,
+  counting open intervals up to --as-of
+
+Usage:
+  python3 base/scripts/backlog_history.py [--format csv|json|md] [--out FILE]
+  python3 base/scripts/backlog_history.py --transitions-out transitions.csv
+  python3 base/scripts/backlog_history.py --rebuild [--cache-dir DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from mcu_cache import atomic_write_json, default_cache_dir, load_json
+import mcu_profile
+from mcu_parser import parse_text
+from workstream_rules import get_rules
+
+HISTORY_CACHE_FILE_NAME = 'history.json'
+HISTORY_CACHE_VERSION = 1
+ITEMS_PATHSPEC = 'BACKLOGS/ITEMS/*.md'
+
+TRACK_NAMES = ['source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track', 'defer_track']
+
+SUMMARY_FIELDS = ['workstream', 'items', 'completed', 'lead_median_days', 'lead_mean_days',
+                  'cycle_median_days', 'cycle_mean_days', 'in_progress_mean_days', 'blocked_mean_days']
+TRANSITION_FIELDS = ['path', 'track', 'from', 'to', 'at', 'commit']
+
+SECONDS_PER_DAY = 86400.0
+
+
+class HistoryError(RuntimeError):
+    """Raised when git cannot be queried."""
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(['git', '-C', str(repo), '-c', 'core.quotePath=false', *args],
+                            capture_output=True, text=True, encoding='utf-8')
+    if result.returncode != 0:
+        raise HistoryError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout
+
+
+class _BlobReader:
+    """Reads blobs through one long-running `git cat-file --batch`."""
+
+    def __init__(self, repo: Path):
+        self._proc = subprocess.Popen(['git', '-C', str(repo), 'cat-file', '--batch'],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def read(self, blob: str) -> bytes:
+        self._proc.stdin.write(blob.encode('ascii') + b'\n')
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) < 3 or header[1] != b'blob':
+            raise HistoryError(f"cannot read blob {blob}")
+        data = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # trailing newline
+        return data
+
+    def close(self) -> None:
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        self._proc.wait()
+
+    def __enter__(self) -> '_BlobReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_commits(repo: Path, since: Optional[str] = None,
+                 pathspec: str = ITEMS_PATHSPEC) -> Iterator[Tuple[str, int, List[Tuple[str, str, str]]]]:
+    """Yield (sha, commit time, [(status, blob, path)]) oldest first."""
+    rev = f"{since}..HEAD" if since else 'HEAD'
+    out = _git(repo, 'log', '--reverse', '--first-parent', '-m', '--no-renames', '--raw', '--no-abbrev',
+               '--format=commit %H %ct', rev, '--', pathspec)
+    sha, ts, changes = None, 0, []
+    for line in out.splitlines():
+        if line.startswith('commit '):
+            if sha is not None:
+                yield sha, ts, changes
+            _, sha, ct = line.split()
+            ts, changes = int(ct), []
+        elif line.startswith(':'):
+            meta, path = line.split('\t', 1)
+            fields = meta.split()
+            changes.append((fields[4][0], fields[3], path))
+    if sha is not None:
+        yield sha, ts, changes
+
+
+class TrackHistory:
+    """Per-item track state and transitions, resumable from a JSON cache."""
+
+    def __init__(self, repo: Path, cache_path: Optional[Path] = None):
+        self.repo = Path(repo)
+        self.cache_path = cache_path
+        self.head: Optional[str] = None
+        # path -> {'tracks', 'first_seen', 'removed', 'transitions': [[track, from, to, at, sha], ...]}
+        self.items: Dict[str, Dict] = {}
+        self.commits_processed = 0
+        if cache_path is not None:
+            data = load_json(cache_path, default={})
+            if isinstance(data, dict) and data.get('version') == HISTORY_CACHE_VERSION:
+                self.head = data.get('head')
+                self.items = data.get('items') or {}
+
+    def _is_ancestor(self, sha: str) -> bool:
+        result = subprocess.run(['git', '-C', str(self.repo), 'merge-base', '--is-ancestor', sha, 'HEAD'],
+                                capture_output=True)
+        return result.returncode == 0
+
+    def update(self) -> int:
+        """Process commits since the cached head; returns how many were read."""
+        head = _git(self.repo, 'rev-parse', 'HEAD').strip()
+        if self.head == head:
+            return 0
+        if self.head is not None and not self._is_ancestor(self.head):
+            self.head, self.items = None, {}
+        processed = 0
+        with _BlobReader(self.repo) as blobs:
+            for sha, ts, changes in iter_commits(self.repo, self.head):
+                for status, blob, path in changes:
+                    if status == 'D':
+                        self._remove(path, ts)
+                    else:
+                        self._apply(path, parse_text(blobs.read(blob).decode('utf-8', 'replace')).tracks, ts, sha)
+                processed += 1
+        self.head = head
+        self.commits_processed += processed
+        return processed
+
+    def _apply(self, path: str, tracks: Dict[str, str], ts: int, sha: str) -> None:
+        item = self.items.get(path)
+        if item is None or item.get('removed') is not None:
+            item = self.items[path] = {'tracks': {}, 'first_seen': ts, 'removed': None, 'transitions': []}
+        previous = item['tracks']
+        for track in TRACK_NAMES:
+            old, new = previous.get(track, ''), tracks.get(track, '')
+            if old != new:
+                item['transitions'].append([track, old, new, ts, sha])
+        item['tracks'] = {t: tracks.get(t, '') for t in TRACK_NAMES if tracks.get(t, '')}
+
+    def _remove(self, path: str, ts: int) -> None:
+        item = self.items.get(path)
+        if item is not None:
+            item['removed'] = ts
+
+    def save(self) -> None:
+        if self.cache_path is None:
+            return
+        atomic_write_json(self.cache_path, {'version': HISTORY_CACHE_VERSION, 'head': self.head, 'items': self.items})
+
+    def transitions(self) -> List[Dict]:
+        rows = []
+        for path in sorted(self.items):
+            for track, old, new, ts, sha in self.items[path]['transitions']:
+                rows.append({'path': path, 'track': track, 'from': old, 'to': new,
+                             'at': _iso(ts), 'commit': sha})
+        return rows
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def item_metrics(item: Dict, as_of: float) -> Dict[str, Optional[float]]:
+    """Lead/cycle time and time in In-Progress/Blocked (seconds) for one item."""
+    started = completed = None
+    in_state = {'In-Progress': 0.0, 'Blocked': 0.0}
+    current, since = '', item['first_seen']
+    for track, _, new, ts, _ in item['transitions']:
+        if track != 'execution_track':
+            continue
+        if current in in_state:
+            in_state[current] += ts - since
+        current, since = new, ts
+        if new == 'In-Progress' and started is None:
+            started = ts
+        if new == 'Completed' and completed is None:
+            completed = ts
+    if current in in_state:
+        in_state[current] += max(0.0, as_of - since)
+    return {
+        'lead': completed - item['first_seen'] if completed is not None else None,
+        'cycle': completed - started if completed is not None and started is not None else None,
+        'in_progress': in_state['In-Progress'],
+        'blocked': in_state['Blocked'],
+    }
+
+
+def _days(values: List[float], how) -> object:
+    return round(how(values) / SECONDS_PER_DAY, 2) if values else ''
+
+
+def summarize(history: TrackHistory, as_of: Optional[float] = None) -> List[Dict]:
+    """One row per workstream (current classification of live items), plus `(all)`."""
+    as_of = time.time() if as_of is None else as_of
+    classifier = get_rules()['workstream']
+    groups: Dict[str, List[Dict]] = {}
+    for item in history.items.values():
+        if item.get('removed') is not None:
+            continue
+        groups.setdefault(classifier.lookup(item['tracks']), []).append(item_metrics(item, as_of))
+    order = {ws: i for i, ws in enumerate(classifier.results())}
+    rows = []
+    all_metrics: List[Dict] = []
+    for ws in sorted(groups, key=lambda w: (order.get(w, len(order)), w)):
+        rows.append(_summary_row(ws, groups[ws]))
+        all_metrics.extend(groups[ws])
+    rows.append(_summary_row('(all)', all_metrics))
+    return rows
+
+
+def _summary_row(name: str, metrics: List[Dict]) -> Dict:
+    lead = [m['lead'] for m in metrics if m['lead'] is not None]
+    cycle = [m['cycle'] for m in metrics if m['cycle'] is not None]
+    return {
+        'workstream': name,
+        'items': len(metrics),
+        'completed': len(lead),
+        'lead_median_days': _days(lead, statistics.median),
+        'lead_mean_days': _days(lead, statistics.fmean),
+        'cycle_median_days': _days(cycle, statistics.median),
+        'cycle_mean_days': _days(cycle, statistics.fmean),
+        'in_progress_mean_days': _days([m['in_progress'] for m in metrics], statistics.fmean),
+        'blocked_mean_days': _days([m['blocked'] for m in metrics], statistics.fmean),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from backlog_report import as_of_arg
+
+    parser = argparse.ArgumentParser(description='Reconstruct backlog track transitions from git history.')
+    parser.add_argument('--repo', default=None, help='Git repository root (default: this repository)')
+    parser.add_argument('--format', default='csv', choices=['csv', 'json', 'md'], help='Summary format (default: csv)')
+    parser.add_argument('--out', default=None, help='Output file for the per-workstream summary (default: stdout)')
+    parser.add_argument('--transitions-out', default=None, help='Also write every transition (CSV) to this file')
+    parser.add_argument('--as-of', type=as_of_arg, default=None, metavar='DATE',
+                        help='Reference time (ISO 8601) for open intervals (default: now, UTC)')
+    parser.add_argument('--cache-dir', default=None, help='Cache directory (default: .mcu_cache or $MCU_CACHE_DIR)')
+    parser.add_argument('--no-cache', action='store_true', help='Read the whole history without using the cache')
+    parser.add_argument('--rebuild', action='store_true', help='Discard the cached history first')
+    mcu_profile.add_arguments(parser)
+    args = parser.parse_args(argv)
+    with mcu_profile.session(args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    from backlog_report import _emit_report
+
+    repo = Path(args.repo) if args.repo else Path(__file__).resolve().parents[2]
+    cache_path = None
+    if not args.no_cache:
+        cache_path = (Path(args.cache_dir) if args.cache_dir else default_cache_dir()) / HISTORY_CACHE_FILE_NAME
+        if args.rebuild:
+            cache_path.unlink(missing_ok=True)
+    as_of = args.as_of.timestamp() if args.as_of else None
+
+    timings = mcu_profile.active()
+    started = time.perf_counter()
+    history = TrackHistory(repo, cache_path)
+    try:
+        with timings.phase('history'):
+            processed = history.update()
+    except HistoryError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    with timings.phase('cache'):
+        history.save()
+    print(f"History: {processed} new commit(s) read, {len(history.items)} item(s) "
+          f"in {time.perf_counter() - started:.3f}s", file=sys.stderr)
+
+    with timings.phase('emit'):
+        _emit_report(summarize(history, as_of), args.format, SUMMARY_FIELDS,
+                     Path(args.out) if args.out else None, title='Report: Cycle and Lead Times by Workstream')
+        if args.transitions_out:
+            _emit_report(history.transitions(), 'csv', TRANSITION_FIELDS, Path(args.transitions_out),
+                         title='Track Transitions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,12 +6,23 @@ Given a backlog item Markdown file (BACKLOGS/ITEMS/*.md), render kanban-style
 boards for each workstream, where columns are the states of the relevant tracks
 and the item's current state is highlighted.
 
+With --all (or --items-dir), every item is loaded in one process and an
+aggregated board is rendered: each lane column lists its item count and titles.
+With --watch the view is redrawn whenever an item is saved; only changed files
+are re-parsed.
+
 Usage:
   python3 base/scripts/backlog_kanban.py BACKLOGS/ITEMS/BLIT_<SYSTEMID>_<TS>.md
+  python3 base/scripts/backlog_kanban.py BACKLOGS/ITEMS/BLIT_<SYSTEMID>_<TS>.md --index
+  python3 base/scripts/backlog_kanban.py --all
+  python3 base/scripts/backlog_kanban.py --items-dir BACKLOGS/ITEMS [--index]
+  python3 base/scripts/backlog_kanban.py --all --watch
 
 Notes:
   - Workstreams are orchestration phases; they reference item tracks to define
     entry/exit. This renderer is a view: it does not change item state.
+  - Planning and Release lanes use the shared rules in
+    backlog-item/workstream_rules.yaml (see workstream_rules.py).
   - Defer is modeled as an overlay workstream with `defer_track`, `defer_status`,
     and optional `defer_until`.
 """
@@ -19,38 +30,13 @@ Notes:
 from __future__ import annotations
 
 from pathlib import Path
-import re
+import argparse
 import sys
-from typing import Dict, List, Tuple
-
-
-def read_item_text(item_path: Path) -> str:
-    return item_path.read_text(encoding="utf-8")
-
-
-def read_tracks(markdown_text: str) -> Dict[str, str]:
-    tracks: Dict[str, str] = {}
-    in_tracks_section = False
-    for line in markdown_text.splitlines():
-        if line.strip().startswith("## Tracks"):
-            in_tracks_section = True
-            continue
-        if in_tracks_section:
-            if line.strip().startswith("## "):
-                break
-            match = re.match(r"^-\s*([a-z_]+):\s*(.*)$", line.strip())
-            if match:
-                track_name = match.group(1)
-                track_value = match.group(2)
-                tracks[track_name] = track_value
-    return tracks
-
+from typing import Callable, Dict, List, Tuple
 
-def read_title(markdown_text: str) -> str:
-    for line in markdown_text.splitlines():
-        if line.startswith("# "):
-            return line[2:].strip()
-    return ""
+import mcu_profile
+from mcu_parser import parse_file
+from workstream_rules import get_rules
 
 
 def render_lane(title: str, columns: List[str], current: str, extra_note: str = "") -> str:
@@ -67,111 +53,227 @@ def render_lane(title: str, columns: List[str], current: str, extra_note: str =
     return f"{title}:  {rendered_columns}{suffix}"
 
 
-def main(argv: List[str]) -> int:
-    if len(argv) != 2:
-        print("Usage: python3 base/scripts/backlog_kanban.py BACKLOGS/ITEMS/<file>.md")
-        return 1
+def planning_state(tracks: Dict[str, str]) -> str:
+    # This workstream is gated by AC-Ready and plan acceptance (not an item track),
+    # so we expose a minimal Waiting → Plan-Accepted view; the inference lives in
+    # the `planning` classifier of backlog-item/workstream_rules.yaml.
+    return get_rules().classify("planning", tracks)
 
-    item_path = Path(argv[1]).resolve()
-    if not item_path.exists():
-        print(f"Item not found: {item_path}")
-        return 1
 
-    markdown_text = read_item_text(item_path)
-    title = read_title(markdown_text) or item_path.name
-    tracks = read_tracks(markdown_text)
-
-    source_track = tracks.get("source_track", "")
-    definition_track = tracks.get("definition_track", "")
-    execution_track = tracks.get("execution_track", "")
-    validation_track = tracks.get("validation_track", "")
-    docs_track = tracks.get("docs_track", "")
-    defer_track = tracks.get("defer_track", "")
-    defer_status = tracks.get("defer_status", "")
-    defer_until = tracks.get("defer_until", "")
-
-    header = f"Item: {title}\nPath: {item_path.relative_to(Path(__file__).resolve().parents[2])}"
-    print(header)
-
-    # Discovery lane
-    print(render_lane(
-        title="Discovery",
-        columns=["Captured", "Curated"],
-        current=source_track,
-    ))
-
-    # Definition lane
-    print(render_lane(
-        title="Definition",
-        columns=["Triaged", "Clarified", "Sized", "AC-Ready"],
-        current=definition_track,
-    ))
+def release_state(tracks: Dict[str, str]) -> str:
+    return get_rules().classify("release", tracks)
 
-    # Planning lane (simple two-state view)
-    # This workstream is gated by AC-Ready and plan acceptance (not an item track),
-    # so we expose a minimal Waiting → Plan-Accepted view. We infer current as Waiting
-    # unless execution is already started and plan was presumably accepted.
-    planning_current = "Waiting"
-    if definition_track == "AC-Ready" and execution_track in ("", "Not-Started"):
-        planning_current = "Waiting"
-    elif execution_track in ("In-Progress", "Blocked", "Completed"):
-        planning_current = "Plan-Accepted"
-
-    print(render_lane(
-        title="Planning",
-        columns=["Waiting", "Plan-Accepted"],
-        current=planning_current,
-    ))
-
-    # Delivery (Execution) lane
-    print(render_lane(
-        title="Delivery (Execution)",
-        columns=["Not-Started", "In-Progress", "Blocked", "Completed"],
-        current=execution_track,
-    ))
-
-    # Validation lane
-    print(render_lane(
-        title="Validation",
-        columns=["Implicit-Validated", "Explicit-Accepted"],
-        current=validation_track,
-    ))
 
-    # Release lane (simple two-state view)
-    release_current = "Released" if validation_track == "Explicit-Accepted" else "Waiting"
-    print(render_lane(
-        title="Release",
-        columns=["Waiting", "Released"],
-        current=release_current,
-    ))
+def defer_note(tracks: Dict[str, str]) -> str:
+    defer_note_parts = []
+    if tracks.get("defer_status", ""):
+        defer_note_parts.append(f"status={tracks['defer_status']}")
+    if tracks.get("defer_until", ""):
+        defer_note_parts.append(f"until={tracks['defer_until']}")
+    return ", ".join(defer_note_parts)
+
+
+def _track(name: str) -> Callable[[Dict[str, str]], str]:
+    return lambda tracks: tracks.get(name, "")
 
+
+# Lanes in display order: (title, columns, current-state function)
+LANES: List[Tuple[str, List[str], Callable[[Dict[str, str]], str]]] = [
+    ("Discovery", ["Captured", "Curated"], _track("source_track")),
+    ("Definition", ["Triaged", "Clarified", "Sized", "AC-Ready"], _track("definition_track")),
+    # Planning lane (simple two-state view)
+    ("Planning", ["Waiting", "Plan-Accepted"], planning_state),
+    ("Delivery (Execution)", ["Not-Started", "In-Progress", "Blocked", "Completed"], _track("execution_track")),
+    ("Validation", ["Implicit-Validated", "Explicit-Accepted"], _track("validation_track")),
+    # Release lane (simple two-state view)
+    ("Release", ["Waiting", "Released"], release_state),
     # Defer lane (overlay)
-    defer_columns = ["Deferred", "Permanently-Deferred"]
-    defer_note_parts = []
-    if defer_status:
-        defer_note_parts.append(f"status={defer_status}")
-    if defer_until:
-        defer_note_parts.append(f"until={defer_until}")
-    defer_note = ", ".join(defer_note_parts)
-    print(render_lane(
-        title="Defer (overlay)",
-        columns=defer_columns,
-        current=defer_track,
-        extra_note=defer_note,
-    ))
-
-    # Optional: Docs lane if teams want a quick view of documentation status
-    if docs_track:
-        print(render_lane(
-            title="Docs",
-            columns=["Docs-Added", "Examples-Linked"],
-            current=docs_track,
-        ))
+    ("Defer (overlay)", ["Deferred", "Permanently-Deferred"], _track("defer_track")),
+]
+
+# Optional: Docs lane if teams want a quick view of documentation status
+DOCS_LANE: Tuple[str, List[str], Callable[[Dict[str, str]], str]] = (
+    "Docs", ["Docs-Added", "Examples-Linked"], _track("docs_track"))
+
+
+def render_item(tracks: Dict[str, str]) -> List[str]:
+    """Render every lane for a single item."""
+    lines = []
+    for title, columns, current in LANES:
+        extra = defer_note(tracks) if title == "Defer (overlay)" else ""
+        lines.append(render_lane(title=title, columns=columns, current=current(tracks), extra_note=extra))
+    if tracks.get("docs_track", ""):
+        title, columns, current = DOCS_LANE
+        lines.append(render_lane(title=title, columns=columns, current=current(tracks)))
+    return lines
+
 
+def render_board(items: List[Tuple[str, Dict[str, str]]]) -> List[str]:
+    """Render an aggregated board for (title, tracks) items in a single pass.
+
+    Each lane lists its columns with item counts and the titles in them.
+    """
+    lanes = list(LANES)
+    if any(tracks.get("docs_track", "") for _, tracks in items):
+        lanes.append(DOCS_LANE)
+    buckets: List[Dict[str, List[str]]] = [{column: [] for column in columns} for _, columns, _ in lanes]
+    for item_title, tracks in items:
+        for bucket, (_, _, current) in zip(buckets, lanes):
+            state = current(tracks)
+            if state in bucket:
+                bucket[state].append(item_title)
+
+    lines = []
+    for bucket, (title, columns, _) in zip(buckets, lanes):
+        lines.append("")
+        lines.append(f"{title}:  " + " | ".join(f"{column} ({len(bucket[column])})" for column in columns))
+        for column in columns:
+            for item_title in bucket[column]:
+                lines.append(f"  [{column}] {item_title}")
+    return lines
+
+
+def load_item(item_path: Path, index_db: str | None = None):
+    """Parse the item, or read it from the SQLite corpus index when index_db is set."""
+    if index_db is None:
+        return parse_file(item_path)
+    from mcu_index import open_index
+    with open_index(index_db) as index:
+        index.refresh(item_path)
+        return index.document(item_path)
+
+
+def load_item_map(items_dir: Path, index_db: str | None = None) -> Dict[Path, Tuple[str, Dict[str, str]]]:
+    """Load path -> (title, tracks) for every items_dir/*.md in one process, sorted by path.
+
+    Paths are resolved, matching the paths reported by mcu_watch.DirectoryWatcher.
+    """
+    timings = mcu_profile.active()
+    if index_db is None:
+        with timings.phase("discover"):
+            md_files = sorted(items_dir.glob("*.md"))
+        return {md_file.resolve(): (doc.title or md_file.name, doc.tracks)
+                for md_file in md_files
+                for doc in (parse_file(md_file),)}
+    from mcu_index import open_index
+    with open_index(index_db) as index:
+        with timings.phase("index"):
+            index.refresh(items_dir, recursive=False)
+        return {doc.path.resolve(): (doc.title or doc.path.name, doc.tracks)
+                for doc in index.documents(items_dir, recursive=False)}
+
+
+def load_items(items_dir: Path, index_db: str | None = None) -> List[Tuple[str, Dict[str, str]]]:
+    """Load (title, tracks) for every items_dir/*.md in one process, sorted by path."""
+    return list(load_item_map(items_dir, index_db).values())
+
+
+def board_lines(items_dir: Path, item_map: Dict[Path, Tuple[str, Dict[str, str]]]) -> List[str]:
+    items = [item_map[path] for path in sorted(item_map)]
+    return [f"Backlog: {items_dir} ({len(items)} item(s))"] + render_board(items)
+
+
+def item_lines(item_path: Path, doc, repo_root: Path) -> List[str]:
+    title = doc.title or item_path.name
+    header = f"Item: {title}\nPath: {item_path.relative_to(repo_root)}"
+    return [header] + render_item(doc.tracks)
+
+
+def _print_view(lines: List[str], clear: bool = False) -> None:
+    with mcu_profile.active().phase("emit"):
+        if clear:
+            # Redraw in place on a terminal
+            sys.stdout.write("\x1b[2J\x1b[H")
+        for line in lines:
+            print(line)
+        sys.stdout.flush()
+
+
+def watch(directory: Path, redraw: Callable[[set], None]) -> int:
+    """Call redraw(changed_paths) on every change under directory until interrupted."""
+    from mcu_watch import DirectoryWatcher
+    with DirectoryWatcher(directory) as watcher:
+        print(f"Watching {directory} ({watcher.backend}); press Ctrl-C to stop.", file=sys.stderr)
+        try:
+            for changed in watcher:
+                redraw(changed)
+        except KeyboardInterrupt:
+            pass
     return 0
 
 
-if __name__ == "__main__":
-    sys.exit(main(sys.argv))
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Render kanban lanes for a backlog item or the whole backlog.")
+    parser.add_argument("item", nargs="?", help="Path to BACKLOGS/ITEMS/<file>.md")
+    parser.add_argument("--all", action="store_true", help="Render an aggregated board for every item")
+    parser.add_argument("--items-dir", default=None,
+                        help="Items directory for the aggregated board (default: repo BACKLOGS/ITEMS; implies --all)")
+    parser.add_argument("--index", nargs="?", const="", default=None, metavar="DB",
+                        help="Read items from the SQLite corpus index (default DB: .mcu_cache/index.sqlite)")
+    parser.add_argument("--watch", action="store_true", help="Keep running and redraw whenever items change")
+    mcu_profile.add_arguments(parser)
+    args = parser.parse_args(argv[1:])
+    if not (args.all or args.items_dir or args.item):
+        # Same message and status as before the argparse rewrite; hooks check $?
+        print("Usage: python3 base/scripts/backlog_kanban.py BACKLOGS/ITEMS/<file>.md")
+        return 1
+    with mcu_profile.session(args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    repo_root = Path(__file__).resolve().parents[2]
+    clear = args.watch and sys.stdout.isatty()
+    if args.all or args.items_dir:
+        items_dir = Path(args.items_dir) if args.items_dir else (repo_root / "BACKLOGS" / "ITEMS")
+        if not items_dir.is_dir():
+            print(f"Items directory not found: {items_dir}")
+            return 1
+        item_map = load_item_map(items_dir, args.index)
+        with mcu_profile.active().phase("render"):
+            lines = board_lines(items_dir, item_map)
+        _print_view(lines, clear)
+        if not args.watch:
+            return 0
+
+        def redraw_board(changed: set) -> None:
+            # Re-parse only the changed items; the rest stay in memory
+            for md_file in changed:
+                md_file = md_file.resolve()
+                try:
+                    doc = parse_file(md_file)
+                except FileNotFoundError:
+                    item_map.pop(md_file, None)
+                    continue
+                except (OSError, ValueError) as e:
+                    # Likely a half-written save: keep the previous entry until the next change
+                    print(f"⚠️  Skipping {md_file}: {e}", file=sys.stderr)
+                    continue
+                item_map[md_file] = (doc.title or md_file.name, doc.tracks)
+            _print_view(board_lines(items_dir, item_map), clear)
+
+        return watch(items_dir, redraw_board)
+
+    item_path = Path(args.item).resolve()
+    if not item_path.exists():
+        print(f"Item not found: {item_path}")
+        return 1
+
+    doc = load_item(item_path, args.index)
+    _print_view(item_lines(item_path, doc, repo_root), clear)
+    if not args.watch:
+        return 0
+
+    def redraw_item(changed: set) -> None:
+        if item_path in changed and item_path.exists():
+            try:
+                doc = parse_file(item_path)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Skipping {item_path}: {e}", file=sys.stderr)
+                return
+            _print_view(item_lines(item_path, doc, repo_root), clear)
 
+    return watch(item_path.parent, redraw_item)
 
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
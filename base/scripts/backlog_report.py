@@ -6,7 +6,9 @@ Reads BACKLOGS/ITEMS/*.md and emits two CSV reports to stdout:
 1) Grouped by Workstream (one row per item, with all track states)
 2) Grouped by Tracks (one row per item per track state)
 
-Inference rules for workstream (best-effort):
+Inference rules for workstream (best-effort) are declared in
+backlog-item/workstream_rules.yaml and compiled by workstream_rules.py; the
+shipped rules are:
 - Discovery: source_track == Captured
 - Definition: source_track == Curated and definition_track != AC-Ready
 - Planning: definition_track == AC-Ready and execution_track in {Not-Started, ''}
@@ -15,126 +17,210 @@ Inference rules for workstream (best-effort):
 - Release: validation_track == Explicit-Accepted
 
 If tracks are missing or ambiguous, items are placed under "Unassigned".
+Rows are grouped in rule order.
+
+Rows are streamed: each report is fed into an external merge sort while items
+are parsed and written row by row (CSV, MD) or element by element (JSON) in
+grouped order. Peak memory is about --sort-buffer rows per report (default
+50000, roughly 1KB each; at least 1) plus one row per merged run, whatever
+the number of items; smaller buffers trade memory for temporary-file I/O.
+
+With --stats, track data is loaded into compact columns (see backlog_stats.py;
+NumPy is used when installed) and three aggregate reports are emitted instead:
+items per track state per workstream, deferred items by defer_until month,
+and age since Created per workstream.
+
+With --watch the script keeps running: BACKLOGS/ITEMS/ is watched (inotify on
+Linux, polling elsewhere), only the changed items are re-parsed, and the
+--ws-out / --tr-out files are rewritten (atomically) when their content changes.
 """
 
 from pathlib import Path
-import re
 import sys
-from typing import Dict, List, Tuple
+import io
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Tuple
 import csv
 import json
 import argparse
 
+from mcu_cache import atomic_write_text
+import mcu_profile
+from mcu_parser import parse_file, parse_timestamp
+from mcu_sort import DEFAULT_BUFFER_SIZE, ExternalSorter
+from workstream_rules import get_rules
 
-def read_tracks(md_text: str) -> Dict[str, str]:
-    tracks: Dict[str, str] = {}
-    in_tracks = False
-    for line in md_text.splitlines():
-        if line.strip().startswith('## Tracks'):
-            in_tracks = True
-            continue
-        if in_tracks:
-            if line.strip().startswith('## '):
-                break
-            m = re.match(r'^-\s*([a-z_]+):\s*(.*)$', line.strip())
-            if m:
-                tracks[m.group(1)] = m.group(2)
-    return tracks
 
+def infer_workstream(tracks: Dict[str, str]) -> str:
+    return get_rules().classify('workstream', tracks)
 
-def read_title(md_text: str) -> str:
-    for line in md_text.splitlines():
-        if line.startswith('# '):
-            return line[2:].strip()
-    return ''
 
+def _iter_documents(items_dir: Path, index=None) -> Iterator[Tuple[Path, object]]:
+    """Yield (path, document) for items_dir/*.md, from the corpus index when given.
 
-def infer_workstream(tracks: Dict[str, str]) -> str:
-    source = tracks.get('source_track', '')
-    definition = tracks.get('definition_track', '')
-    execution = tracks.get('execution_track', '')
-    validation = tracks.get('validation_track', '')
-
-    if source == 'Captured':
-        return 'Discovery'
-    if source == 'Curated' and definition != 'AC-Ready':
-        return 'Definition'
-    if definition == 'AC-Ready' and execution in ('', 'Not-Started'):
-        return 'Planning'
-    if execution in ('In-Progress', 'Blocked'):
-        return 'Delivery (Execution)'
-    if execution == 'Completed' and validation != 'Explicit-Accepted':
-        return 'Validation'
-    if validation == 'Explicit-Accepted':
-        return 'Release'
-    return 'Unassigned'
-
-
-def _collect_rows(items_dir: Path, repo_root: Path) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
-    rows_ws: List[Dict[str, str]] = []
+    Paths are resolved, matching the paths reported by mcu_watch.DirectoryWatcher.
+    """
+    timings = mcu_profile.active()
+    if index is None:
+        with timings.phase('discover'):
+            md_files = sorted(items_dir.glob('*.md'))
+        for md_file in md_files:
+            yield md_file.resolve(), parse_file(md_file)
+        return
+    with timings.phase('index'):
+        index.refresh(items_dir, recursive=False)
+    for doc in index.documents(items_dir, recursive=False):
+        yield doc.path.resolve(), doc
+
+
+TRACK_NAMES = ['source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track', 'defer_track']
+WS_FIELDS = ['workstream', 'title', 'path', 'source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track', 'defer_track', 'defer_status', 'defer_until']
+TRACKS_FIELDS = ['track', 'state', 'title', 'path', 'workstream', 'defer_status', 'defer_until']
+
+
+def _report_path(md_file: Path, repo_root: Path) -> str:
+    """POSIX path of md_file relative to repo_root, or absolute when it lies outside."""
+    try:
+        return md_file.relative_to(repo_root).as_posix()
+    except ValueError:
+        pass
+    md_file = md_file.resolve()
+    try:
+        return md_file.relative_to(repo_root.resolve()).as_posix()
+    except ValueError:
+        return md_file.as_posix()
+
+
+def _item_rows(md_file: Path, doc, repo_root: Path) -> Tuple[Dict[str, str], List[Dict[str, str]]]:
+    """Build the workstream row and the track rows for one item."""
+    tracks = doc.tracks
+    ws = infer_workstream(tracks)
+    title = doc.title or md_file.name
+    rel = _report_path(md_file, repo_root)
+
+    # Workstream CSV row (one row per item)
+    row_ws = {
+        'workstream': ws,
+        'title': title,
+        'path': rel,
+        'source_track': tracks.get('source_track', ''),
+        'definition_track': tracks.get('definition_track', ''),
+        'execution_track': tracks.get('execution_track', ''),
+        'validation_track': tracks.get('validation_track', ''),
+        'docs_track': tracks.get('docs_track', ''),
+        'defer_track': tracks.get('defer_track', ''),
+        'defer_status': tracks.get('defer_status', ''),
+        'defer_until': tracks.get('defer_until', ''),
+    }
+
+    # Tracks CSV rows (one row per item per track with a value)
     rows_tracks: List[Dict[str, str]] = []
-    for md_file in sorted(items_dir.glob('*.md')):
-        text = md_file.read_text(encoding='utf-8')
-        tracks = read_tracks(text)
-        ws = infer_workstream(tracks)
-        title = read_title(text) or md_file.name
-        rel = md_file.relative_to(repo_root).as_posix()
-
-        # Workstream CSV row (one row per item)
-        rows_ws.append({
-            'workstream': ws,
-            'title': title,
-            'path': rel,
-            'source_track': tracks.get('source_track', ''),
-            'definition_track': tracks.get('definition_track', ''),
-            'execution_track': tracks.get('execution_track', ''),
-            'validation_track': tracks.get('validation_track', ''),
-            'docs_track': tracks.get('docs_track', ''),
-            'defer_track': tracks.get('defer_track', ''),
-            'defer_status': tracks.get('defer_status', ''),
-            'defer_until': tracks.get('defer_until', ''),
-        })
-
-        # Tracks CSV rows (one row per item per track with a value)
-        for track_name in ['source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track', 'defer_track']:
-            value = tracks.get(track_name, '')
-            if value:
-                row = {
-                    'track': track_name,
-                    'state': value,
-                    'title': title,
-                    'path': rel,
-                    'workstream': ws,
-                }
-                if track_name == 'defer_track':
-                    row['defer_status'] = tracks.get('defer_status', '')
-                    row['defer_until'] = tracks.get('defer_until', '')
-                rows_tracks.append(row)
-
-    # Sort rows for stable grouping
-    ws_order = ['Discovery', 'Definition', 'Planning', 'Delivery (Execution)', 'Validation', 'Release', 'Unassigned']
-    rows_ws.sort(key=lambda r: (ws_order.index(r['workstream']) if r['workstream'] in ws_order else len(ws_order), r['title']))
-    rows_tracks.sort(key=lambda r: (r['track'], r.get('state', ''), r['title']))
+    for track_name in TRACK_NAMES:
+        value = tracks.get(track_name, '')
+        if value:
+            row = {
+                'track': track_name,
+                'state': value,
+                'title': title,
+                'path': rel,
+                'workstream': ws,
+            }
+            if track_name == 'defer_track':
+                row['defer_status'] = tracks.get('defer_status', '')
+                row['defer_until'] = tracks.get('defer_until', '')
+            rows_tracks.append(row)
+    return row_ws, rows_tracks
+
+
+def _ws_sort_key():
+    ws_order = {ws: i for i, ws in enumerate(get_rules()['workstream'].results())}
+    return lambda r: (ws_order.get(r['workstream'], len(ws_order)), r['title'])
+
+
+def _tracks_sort_key(r: Dict[str, str]):
+    return (r['track'], r.get('state', ''), r['title'])
 
+
+def _sort_rows(rows_ws: List[Dict[str, str]], rows_tracks: List[Dict[str, str]]) -> None:
+    """Sort rows in place for stable grouping."""
+    rows_ws.sort(key=_ws_sort_key())
+    rows_tracks.sort(key=_tracks_sort_key)
+
+
+def _collect_rows(items_dir: Path, repo_root: Path, index=None) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    rows_ws: List[Dict[str, str]] = []
+    rows_tracks: List[Dict[str, str]] = []
+    item_rows = mcu_profile.active().wrap('rows', _item_rows)
+    for md_file, doc in _iter_documents(items_dir, index):
+        row_ws, item_tracks = item_rows(md_file, doc, repo_root)
+        rows_ws.append(row_ws)
+        rows_tracks.extend(item_tracks)
+    _sort_rows(rows_ws, rows_tracks)
     return rows_ws, rows_tracks
 
 
-def _emit_csv(rows: List[Dict[str, str]], fieldnames: List[str], out_path: Path | None):
-    out_file = sys.stdout if out_path is None else open(out_path, 'w', encoding='utf-8', newline='')
+def _stream_rows(items_dir: Path, repo_root: Path, index=None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE) -> Tuple[ExternalSorter, ExternalSorter]:
+    """Feed rows into two external sorters as items are parsed.
+
+    Use `sorter.sorted()` to read each report back in grouped order. At most
+    buffer_size rows per report are held in memory; the rest is spilled to
+    temporary files and merged on read.
+    """
+    sorter_ws = ExternalSorter(_ws_sort_key(), buffer_size)
+    sorter_tracks = ExternalSorter(_tracks_sort_key, buffer_size)
+    item_rows = mcu_profile.active().wrap('rows', _item_rows)
+    for md_file, doc in _iter_documents(items_dir, index):
+        row_ws, item_tracks = item_rows(md_file, doc, repo_root)
+        sorter_ws.add(row_ws)
+        sorter_tracks.extend(item_tracks)
+    return sorter_ws, sorter_tracks
+
+
+def _open_out(out_path: Path | None):
+    return sys.stdout if out_path is None else open(out_path, 'w', encoding='utf-8', newline='')
+
+
+def _write_csv(rows: Iterable[Dict[str, str]], fieldnames: List[str], out_file):
+    writer = csv.DictWriter(out_file, fieldnames=fieldnames)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({fn: row.get(fn, '') for fn in fieldnames})
+
+
+def _write_json(rows: Iterable[Dict[str, str]], out_file):
+    # Element by element, byte-identical to json.dump(list(rows), out_file, indent=2)
+    sep = '['
+    for row in rows:
+        out_file.write(sep)
+        out_file.write('\n  ' + json.dumps(row, indent=2).replace('\n', '\n  '))
+        sep = ','
+    out_file.write('[]' if sep == '[' else '\n]')
+
+
+def _write_md(rows: Iterable[Dict[str, str]], fieldnames: List[str], out_file, title: str):
+    print(f"# {title}", file=out_file)
+    # Header
+    print("| " + " | ".join(fieldnames) + " |", file=out_file)
+    print("| " + " | ".join(['---'] * len(fieldnames)) + " |", file=out_file)
+    for row in rows:
+        print("| " + " | ".join((str(row.get(fn, '')) for fn in fieldnames)) + " |", file=out_file)
+
+
+def _emit_csv(rows: Iterable[Dict[str, str]], fieldnames: List[str], out_path: Path | None):
+    out_file = _open_out(out_path)
     try:
-        writer = csv.DictWriter(out_file, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow({fn: row.get(fn, '') for fn in fieldnames})
+        _write_csv(rows, fieldnames, out_file)
     finally:
         if out_file is not sys.stdout:
             out_file.close()
 
 
-def _emit_json(rows: List[Dict[str, str]], out_path: Path | None):
-    out_file = sys.stdout if out_path is None else open(out_path, 'w', encoding='utf-8')
+def _emit_json(rows: Iterable[Dict[str, str]], out_path: Path | None):
+    out_file = _open_out(out_path)
     try:
-        json.dump(rows, out_file, indent=2)
+        _write_json(rows, out_file)
         if out_file is sys.stdout:
             print()
     finally:
@@ -142,21 +228,166 @@ def _emit_json(rows: List[Dict[str, str]], out_path: Path | None):
             out_file.close()
 
 
-def _emit_md(rows: List[Dict[str, str]], fieldnames: List[str], out_path: Path | None, title: str):
-    out_file = sys.stdout if out_path is None else open(out_path, 'w', encoding='utf-8')
+def _emit_md(rows: Iterable[Dict[str, str]], fieldnames: List[str], out_path: Path | None, title: str):
+    out_file = _open_out(out_path)
     try:
-        print(f"# {title}", file=out_file)
-        # Header
-        print("| " + " | ".join(fieldnames) + " |", file=out_file)
-        print("| " + " | ".join(['---'] * len(fieldnames)) + " |", file=out_file)
-        for row in rows:
-            print("| " + " | ".join((str(row.get(fn, '')) for fn in fieldnames)) + " |", file=out_file)
+        _write_md(rows, fieldnames, out_file, title)
     finally:
         if out_file is not sys.stdout:
             out_file.close()
 
 
-def main() -> int:
+def _emit_report(rows: Iterable[Dict[str, str]], fmt: str, fieldnames: List[str], out_path: Path | None, title: str):
+    if fmt == 'csv':
+        _emit_csv(rows, fieldnames, out_path)
+    elif fmt == 'json':
+        _emit_json(rows, out_path)
+    else:
+        _emit_md(rows, fieldnames, out_path, title=title)
+
+
+def _render_report(rows: List[Dict[str, str]], fmt: str, fieldnames: List[str], title: str) -> str:
+    """Render a report to a string (what _emit_report would write to a file)."""
+    buf = io.StringIO(newline='')
+    if fmt == 'csv':
+        _write_csv(rows, fieldnames, buf)
+    elif fmt == 'json':
+        _write_json(rows, buf)
+    else:
+        _write_md(rows, fieldnames, buf, title)
+    return buf.getvalue()
+
+
+def _collect_stats(items_dir: Path, index=None, as_of: datetime | None = None):
+    """Load every item's tracks into backlog_stats.StatsColumns."""
+    from backlog_stats import StatsColumns
+    cols = StatsColumns(as_of)
+    classify = get_rules()['workstream'].lookup
+    for _, doc in _iter_documents(items_dir, index):
+        created = doc.metadata.get('Created') or doc.fields.get('Created')
+        cols.append(classify(doc.tracks), doc.tracks, created)
+    return cols
+
+
+def _emit_stats(cols, fmt: str, out_dir: Path | None) -> None:
+    from backlog_stats import AGE_FIELDS, CROSSTAB_FIELDS, DEFER_FIELDS, age_rows, crosstab_rows, defer_rows
+    ws_order = get_rules()['workstream'].results()
+    reports = [
+        ('stats_tracks', 'Stats: Items per Track State per Workstream', crosstab_rows(cols, ws_order), CROSSTAB_FIELDS),
+        ('stats_defer', 'Stats: Deferred Items by defer_until Month', defer_rows(cols), DEFER_FIELDS),
+        ('stats_age', 'Stats: Age since Created (days)', age_rows(cols, ws_order), AGE_FIELDS),
+    ]
+    if out_dir is not None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    for i, (stem, title, rows, fields) in enumerate(reports):
+        out_path = out_dir / f"{stem}.{fmt}" if out_dir is not None else None
+        if out_path is None and i:
+            # Spacer between reports on stdout
+            print()
+        _emit_report(rows, fmt, fields, out_path, title=title)
+
+
+class ReportWatcher:
+    """Keeps the rows of every item in memory and rebuilds the reports from them.
+
+    Only changed files are re-parsed; outputs are rewritten only when their
+    rendered content actually changes.
+    """
+
+    def __init__(self, items_dir: Path, repo_root: Path, outputs: List[Tuple[str, str, List[str], Path | None, str]]):
+        self.items_dir = items_dir
+        self.repo_root = repo_root
+        # (kind, format, fieldnames, out_path, title) with kind 'ws' or 'tr'
+        self.outputs = outputs
+        self.items: Dict[Path, Tuple[Dict[str, str], List[Dict[str, str]]]] = {}
+        self._last: Dict[int, str] = {}
+
+    def load(self, index=None) -> None:
+        for md_file, doc in _iter_documents(self.items_dir, index):
+            self.items[md_file] = _item_rows(md_file, doc, self.repo_root)
+
+    def update(self, changed) -> int:
+        """Re-parse changed paths (dropping removed ones); returns items re-parsed.
+
+        A file that cannot be read or parsed (e.g. a half-written save) keeps
+        its previous rows and is reported on stderr.
+        """
+        parsed = 0
+        for md_file in changed:
+            md_file = Path(md_file).resolve()
+            try:
+                doc = parse_file(md_file)
+            except FileNotFoundError:
+                self.items.pop(md_file, None)
+                continue
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Skipping {md_file}: {e}", file=sys.stderr)
+                continue
+            self.items[md_file] = _item_rows(md_file, doc, self.repo_root)
+            parsed += 1
+        return parsed
+
+    def rows(self) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+        rows_ws = [row_ws for row_ws, _ in self.items.values()]
+        rows_tracks = [row for _, item_tracks in self.items.values() for row in item_tracks]
+        _sort_rows(rows_ws, rows_tracks)
+        return rows_ws, rows_tracks
+
+    def write(self) -> List[str]:
+        """Write outputs whose content changed; returns the names written."""
+        rows_ws, rows_tracks = self.rows()
+        written = []
+        for i, (kind, fmt, fieldnames, out_path, title) in enumerate(self.outputs):
+            text = _render_report(rows_ws if kind == 'ws' else rows_tracks, fmt, fieldnames, title)
+            if self._last.get(i) == text:
+                continue
+            self._last[i] = text
+            if out_path is None:
+                sys.stdout.write(text)
+                if fmt == 'json':
+                    print()
+                sys.stdout.flush()
+                written.append('<stdout>')
+            else:
+                atomic_write_text(out_path, text)
+                written.append(str(out_path))
+        return written
+
+
+def watch(report: ReportWatcher, items_dir: Path) -> int:
+    """Rewrite the reports whenever an item changes, until interrupted."""
+    from mcu_watch import DirectoryWatcher
+    with DirectoryWatcher(items_dir) as watcher:
+        print(f"Watching {items_dir} ({watcher.backend}); press Ctrl-C to stop.", file=sys.stderr)
+        try:
+            for changed in watcher:
+                start = time.perf_counter()
+                parsed = report.update(changed)
+                written = report.write()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"{len(changed)} change(s), {parsed} re-parsed, "
+                      f"{len(written)} output(s) rewritten in {elapsed_ms:.1f}ms", file=sys.stderr)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _sort_buffer_arg(value: str) -> int:
+    rows = int(value)
+    if rows < 1:
+        raise argparse.ArgumentTypeError("--sort-buffer must be >= 1")
+    return rows
+
+
+def as_of_arg(value: str) -> datetime:
+    """argparse type for --as-of: an ISO 8601 date or time, UTC unless it has an offset."""
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 date: {value!r} (e.g. 2025-09-01 or 2025-09-01T12:00:00Z)")
+
+
+def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description='Generate backlog reports (workstream and tracks).')
     parser.add_argument('--items-dir', default=None, help='Path to BACKLOGS/ITEMS directory (default: repo BACKLOGS/ITEMS)')
     parser.add_argument('--ws-out', default=None, help='Output file for Workstream report')
@@ -167,50 +398,84 @@ def main() -> int:
     # Back-compat aliases (deprecated): --tracks-*
     parser.add_argument('--tracks-out', default=None, help=argparse.SUPPRESS)
     parser.add_argument('--tracks-format', default=None, choices=['csv', 'json', 'md'], help=argparse.SUPPRESS)
-    args = parser.parse_args()
-
+    parser.add_argument('--index', nargs='?', const='', default=None, metavar='DB',
+                        help='Read items from the SQLite corpus index (default DB: .mcu_cache/index.sqlite)')
+    parser.add_argument('--sort-buffer', type=_sort_buffer_arg, default=DEFAULT_BUFFER_SIZE, metavar='N',
+                        help=f'Rows per report held in memory before spilling to disk (default: {DEFAULT_BUFFER_SIZE})')
+    parser.add_argument('--stats', action='store_true',
+                        help='Emit aggregate statistics (track cross-tab, defer months, age) instead of per-item rows')
+    parser.add_argument('--stats-format', default='csv', choices=['csv', 'json', 'md'], help='Format for --stats (default: csv)')
+    parser.add_argument('--stats-dir', default=None,
+                        help='Write --stats reports as stats_tracks/stats_defer/stats_age files in this directory')
+    parser.add_argument('--as-of', type=as_of_arg, default=None, metavar='DATE',
+                        help='Reference date (ISO 8601) for ages in --stats (default: now, UTC)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and rewrite the reports whenever an item changes')
+    mcu_profile.add_arguments(parser)
+    args = parser.parse_args(argv)
+    with mcu_profile.session(args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
     repo_root = Path(__file__).resolve().parents[2]
     items_dir = Path(args.items_dir) if args.items_dir else (repo_root / 'BACKLOGS' / 'ITEMS')
     if not items_dir.exists():
         print(f"Items directory not found: {items_dir}")
         return 1
 
-    rows_ws, rows_tracks = _collect_rows(items_dir, repo_root)
-
-    ws_fields = ['workstream', 'title', 'path', 'source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track', 'defer_track', 'defer_status', 'defer_until']
-    tracks_fields = ['track', 'state', 'title', 'path', 'workstream', 'defer_status', 'defer_until']
-
     ws_out = Path(args.ws_out) if args.ws_out else None
     # Resolve TR output and format with back-compat flags
     tr_out_arg = args.tr_out if args.tr_out is not None else args.tracks_out
     tr_fmt_arg = args.tr_format if args.tr_format is not None else args.tracks_format
     tr_out = Path(tr_out_arg) if tr_out_arg else None
+    tr_format = (tr_fmt_arg or 'csv')
 
-    # Emit Workstream report
-    if args.ws_format == 'csv':
-        _emit_csv(rows_ws, ws_fields, ws_out)
-    elif args.ws_format == 'json':
-        _emit_json(rows_ws, ws_out)
+    if args.stats:
+        if args.index is not None:
+            from mcu_index import open_index
+            with open_index(args.index) as index:
+                cols = _collect_stats(items_dir, index, args.as_of)
+        else:
+            cols = _collect_stats(items_dir, as_of=args.as_of)
+        with mcu_profile.active().phase('emit'):
+            _emit_stats(cols, args.stats_format, Path(args.stats_dir) if args.stats_dir else None)
+        return 0
+
+    if args.watch:
+        report = ReportWatcher(items_dir, repo_root, [
+            ('ws', args.ws_format, WS_FIELDS, ws_out, 'Report: Grouped by Workstream'),
+            ('tr', tr_format, TRACKS_FIELDS, tr_out, 'Report: Grouped by Tracks'),
+        ])
+        if args.index is not None:
+            from mcu_index import open_index
+            with open_index(args.index) as index:
+                report.load(index)
+        else:
+            report.load()
+        report.write()
+        return watch(report, items_dir)
+
+    if args.index is not None:
+        from mcu_index import open_index
+        with open_index(args.index) as index:
+            sorter_ws, sorter_tracks = _stream_rows(items_dir, repo_root, index, args.sort_buffer)
     else:
-        _emit_md(rows_ws, ws_fields, ws_out, title='Report: Grouped by Workstream')
+        sorter_ws, sorter_tracks = _stream_rows(items_dir, repo_root, buffer_size=args.sort_buffer)
 
-    # Spacer for stdout when both go to stdout and formats are CSV
-    if ws_out is None and tr_out is None:
-        print()
+    with sorter_ws, sorter_tracks, mcu_profile.active().phase('emit'):
+        # Emit Workstream report
+        _emit_report(sorter_ws.sorted(), args.ws_format, WS_FIELDS, ws_out, title='Report: Grouped by Workstream')
 
-    # Emit Tracks report
-    tr_format = (tr_fmt_arg or 'csv')
-    if tr_format == 'csv':
-        _emit_csv(rows_tracks, tracks_fields, tr_out)
-    elif tr_format == 'json':
-        _emit_json(rows_tracks, tr_out)
-    else:
-        _emit_md(rows_tracks, tracks_fields, tr_out, title='Report: Grouped by Tracks')
+        # Spacer for stdout when both go to stdout and formats are CSV
+        if ws_out is None and tr_out is None:
+            print()
+
+        # Emit Tracks report
+        _emit_report(sorter_tracks.sorted(), tr_format, TRACKS_FIELDS, tr_out, title='Report: Grouped by Tracks')
 
     return 0
 
 
 if __name__ == '__main__':
     sys.exit(main())
-
-
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Backlog Statistics
+
+Aggregates for `backlog_report.py --stats`:
+
+1) Items per track state per workstream (cross-tab)
+2) Items with a defer_until date, by month and defer_track
+3) Age since `Created` (days) per workstream
+
+Track data is loaded into compact columns: each categorical column is
+dictionary-encoded into an `array('I')` of small integer codes and ages are
+an `array('d')`, so an item costs a few dozen bytes whatever its text size.
+When NumPy is installed the arrays are viewed without copying and aggregated
+with bincount/argsort; otherwise the same results are computed with
+Counter/zip over the arrays.
+
+Library usage:
+  from backlog_stats import StatsColumns, crosstab_rows, defer_rows, age_rows
+  cols = StatsColumns(as_of=datetime.now(timezone.utc))
+  cols.append(workstream, tracks, created)
+  rows = crosstab_rows(cols, workstream_order)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import statistics
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from mcu_parser import parse_timestamp
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+TRACK_NAMES = ['source_track', 'definition_track', 'execution_track', 'validation_track', 'docs_track', 'defer_track']
+CATEGORICAL = ['workstream'] + TRACK_NAMES + ['defer_month']
+
+CROSSTAB_FIELDS = ['workstream', 'track', 'state', 'count']
+DEFER_FIELDS = ['defer_until_month', 'defer_track', 'count']
+AGE_FIELDS = ['workstream', 'items', 'with_created', 'min_days', 'median_days', 'mean_days', 'max_days']
+
+MONTH_RE = re.compile(r'^(\d{4}-\d{2})')
+
+
+def _parse_created(value: str) -> Optional[datetime]:
+    try:
+        return parse_timestamp(value)
+    except (AttributeError, ValueError):
+        return None
+
+
+class StatsColumns:
+    """Column store of per-item track data.
+
+    backend: 'auto' (NumPy if installed), 'numpy' or 'array'.
+    """
+
+    def __init__(self, as_of: Optional[datetime] = None, backend: str = 'auto'):
+        if backend == 'numpy' and np is None:
+            raise ImportError('NumPy is not installed')
+        self.backend = 'numpy' if backend in ('auto', 'numpy') and np is not None else 'array'
+        self.as_of = as_of or datetime.now(timezone.utc)
+        self.count = 0
+        self.labels: Dict[str, List[str]] = {name: [] for name in CATEGORICAL}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL}
+        self.data: Dict[str, array] = {name: array('I') for name in CATEGORICAL}
+        self.age_days = array('d')
+
+    def _encode(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.labels[name].append(value)
+        return code
+
+    def append(self, workstream: str, tracks: Mapping[str, str], created: Optional[str]) -> None:
+        data = self.data
+        data['workstream'].append(self._encode('workstream', workstream))
+        for name in TRACK_NAMES:
+            data[name].append(self._encode(name, tracks.get(name, '') or ''))
+        m = MONTH_RE.match(tracks.get('defer_until', '') or '')
+        data['defer_month'].append(self._encode('defer_month', m.group(1) if m else ''))
+        created_at = _parse_created(created) if created else None
+        self.age_days.append((self.as_of - created_at).total_seconds() / 86400 if created_at else math.nan)
+        self.count += 1
+
+    def column(self, name: str):
+        """The code column for name (a zero-copy NumPy view on the numpy backend)."""
+        if self.backend == 'numpy':
+            return np.frombuffer(self.data[name], dtype=np.uint32) if self.count else np.zeros(0, np.uint32)
+        return self.data[name]
+
+    def ages(self):
+        if self.backend == 'numpy':
+            return np.frombuffer(self.age_days, dtype=np.float64) if self.count else np.zeros(0)
+        return self.age_days
+
+    def pair_counts(self, a: str, b: str) -> Dict[tuple, int]:
+        """Count items per (label of a, label of b)."""
+        labels_a, labels_b = self.labels[a], self.labels[b]
+        if self.backend == 'numpy':
+            width = max(1, len(labels_b))
+            combined = self.column(a).astype(np.int64) * width + self.column(b)
+            counts = np.bincount(combined, minlength=len(labels_a) * width)
+            return {(labels_a[i // width], labels_b[i % width]): int(c)
+                    for i in np.flatnonzero(counts).tolist() for c in (counts[i],)}
+        return {(labels_a[i], labels_b[j]): c for (i, j), c in Counter(zip(self.data[a], self.data[b])).items()}
+
+
+def _order(labels: Sequence[str], preferred: Sequence[str]) -> List[str]:
+    rank = {label: i for i, label in enumerate(preferred)}
+    return sorted(labels, key=lambda label: (rank.get(label, len(rank)), label))
+
+
+def crosstab_rows(cols: StatsColumns, workstream_order: Sequence[str] = ()) -> List[Dict]:
+    """Items per (workstream, track, state) for every track with a state."""
+    rows = []
+    workstreams = _order(cols.labels['workstream'], workstream_order)
+    for track in TRACK_NAMES:
+        counts = cols.pair_counts('workstream', track)
+        states = sorted(s for s in cols.labels[track] if s)
+        for ws in workstreams:
+            for state in states:
+                count = counts.get((ws, state), 0)
+                if count:
+                    rows.append({'workstream': ws, 'track': track, 'state': state, 'count': count})
+    return rows
+
+
+def defer_rows(cols: StatsColumns) -> List[Dict]:
+    """Items per (defer_until month, defer_track), for items with a defer_until date."""
+    counts = cols.pair_counts('defer_month', 'defer_track')
+    return [{'defer_until_month': month, 'defer_track': track, 'count': count}
+            for (month, track), count in sorted(counts.items()) if month]
+
+
+def _age_row(name: str, items: int, with_created: int, low=None, median=None, mean=None, high=None) -> Dict:
+    row = {'workstream': name, 'items': items, 'with_created': with_created}
+    if with_created:
+        row.update(min_days=round(float(low), 1), median_days=round(float(median), 1),
+                   mean_days=round(float(mean), 1), max_days=round(float(high), 1))
+    else:
+        row.update(min_days='', median_days='', mean_days='', max_days='')
+    return row
+
+
+def _summarize(name: str, items: int, ages: List[float]) -> Dict:
+    if not ages:
+        return _age_row(name, items, 0)
+    return _age_row(name, items, len(ages), min(ages), statistics.median(ages),
+                    math.fsum(ages) / len(ages), max(ages))
+
+
+def age_rows(cols: StatsColumns, workstream_order: Sequence[str] = ()) -> List[Dict]:
+    """Age since Created per workstream, plus an `(all)` row."""
+    labels = cols.labels['workstream']
+    ordered = _order(labels, workstream_order)
+    if cols.backend == 'numpy':
+        codes = cols.column('workstream')
+        ages = cols.ages()
+        known = ~np.isnan(ages)
+        codes_k, ages_k = codes[known], ages[known]
+        # Sort by workstream, then age: each group is a contiguous, ordered slice.
+        # A trailing pad keeps the gathers below valid for empty groups.
+        sorted_ages = np.append(ages_k[np.lexsort((ages_k, codes_k))], 0.0)
+        counts = np.bincount(codes_k, minlength=len(labels))
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        last = np.maximum(ends - 1, 0)
+        medians = (sorted_ages[starts + np.maximum(counts - 1, 0) // 2] + sorted_ages[starts + counts // 2]) / 2
+        lows, highs = sorted_ages[starts], sorted_ages[last]
+        means = np.bincount(codes_k, weights=ages_k, minlength=len(labels)) / np.maximum(counts, 1)
+        item_counts = np.bincount(codes, minlength=len(labels))
+        index = {label: i for i, label in enumerate(labels)}
+        rows = [_age_row(ws, int(item_counts[i]), int(counts[i]), lows[i], medians[i], means[i], highs[i])
+                for ws in ordered for i in (index[ws],)]
+        if ages_k.size:
+            rows.append(_age_row('(all)', cols.count, int(ages_k.size), ages_k.min(), np.median(ages_k),
+                                 ages_k.mean(), ages_k.max()))
+        else:
+            rows.append(_age_row('(all)', cols.count, 0))
+        return rows
+
+    groups: Dict[str, List[float]] = {label: [] for label in labels}
+    items: Dict[str, int] = dict.fromkeys(labels, 0)
+    for code, age in zip(cols.data['workstream'], cols.age_days):
+        label = labels[code]
+        items[label] += 1
+        if not math.isnan(age):
+            groups[label].append(age)
+    rows = [_summarize(ws, items[ws], groups[ws]) for ws in ordered]
+    rows.append(_summarize('(all)', cols.count, [a for ws in ordered for a in groups[ws]]))
+    return rows
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+MCU Benchmark Suite
+
+Generates a synthetic corpus from the real templates and times the MCU
+scripts on it, end to end and per phase, so performance changes show up as
+numbers instead of anecdotes.
+
+Corpus (`--size 1k|10k|100k` or `--items N`), under `$TMPDIR/mcu-bench/` so
+that whole-repository runs of the scripts never pick it up:
+  - N BLITs in BACKLOGS/ITEMS/ built from templates/MCU_BACKLOG_ITEM_TEMPLATE.md,
+    with a spread of track states and a source reference to their note
+  - N anchored entries in VIBE_NOTE.md
+  - N/10 reference MCUs built from templates/MCU_REFERENCE_TEMPLATE.md, each
+    linking to two others (file and `#anchor` links)
+  - BACKLOGS/BACKLOG_MAIN.md linking every item
+
+End-to-end tasks run each script in a fresh interpreter (validate_mcu.py,
+check_links.py, blit_convert.py md-to-json, backlog_report.py,
+backlog_kanban.py --all). Phases run in-process on the same corpus:
+discovery, reading, parsing, validation rules, anchor extraction, link
+checks, BLIT conversion, report rows and the kanban board. Each timing is the
+best of `--repeat` runs.
+
+Results are written as JSON. With `--baseline`, every timing is compared to
+the stored run and anything slower by more than `--threshold` (and by at
+least `--min-delta` seconds) is flagged as a regression (exit status 1).
+
+Usage:
+  python3 base/scripts/bench_mcu.py --size 1k --out bench.json
+  python3 base/scripts/bench_mcu.py --size 10k --baseline bench-main.json --out bench.json
+  python3 base/scripts/bench_mcu.py --size 1k --only validate,report --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / 'base' / 'scripts'
+BLIT_DIR = REPO_ROOT / 'backlog-item'
+sys.path.insert(0, str(BLIT_DIR))
+
+from generate_mcu import METADATA_PATTERN, MCUGenerator  # noqa: E402
+from mcu_cache import atomic_write_json, load_json  # noqa: E402
+from mcu_parser import parse_text  # noqa: E402
+
+RESULTS_VERSION = 1
+CORPUS_VERSION = 1
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000}
+TASKS = ['validate', 'links', 'convert', 'report', 'kanban']
+
+TRACK_STATES = [
+    ('Captured', 'Triaged', 'Not-Started', 'Implicit-Validated'),
+    ('Curated', 'Clarified', 'Not-Started', 'Implicit-Validated'),
+    ('Curated', 'AC-Ready', 'Not-Started', 'Implicit-Validated'),
+    ('Curated', 'AC-Ready', 'In-Progress', 'Implicit-Validated'),
+    ('Curated', 'AC-Ready', 'Blocked', 'Implicit-Validated'),
+    ('Curated', 'AC-Ready', 'Completed', 'Implicit-Validated'),
+    ('Curated', 'AC-Ready', 'Completed', 'Explicit-Accepted'),
+]
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+# ----------------------------------------------------------------------
+# Synthetic corpus
+# ----------------------------------------------------------------------
+def _stamp(n: int) -> datetime:
+    return EPOCH + timedelta(minutes=7 * n)
+
+
+def _replace_sections(text: str, bodies: Dict[str, List[str]]) -> str:
+    """Replace the body of each H2 section whose heading starts with a key of bodies."""
+    doc = parse_text(text)
+    lines = text.splitlines()
+    for sec in reversed(doc.sections):
+        for prefix, body in bodies.items():
+            if sec.heading.startswith(prefix):
+                lines[sec.body_start:sec.end] = body + ['']
+                break
+    return '\n'.join(lines) + '\n'
+
+
+def _blit_text(template: str, n: int) -> str:
+    ts = _stamp(n)
+    stamp = ts.strftime('%Y-%m-%dT%H-%M-%SZ')
+    iso = ts.strftime('%Y-%m-%dT%H:%M:%SZ')
+    source, definition, execution, validation = TRACK_STATES[n % len(TRACK_STATES)]
+    metadata = '\n'.join([
+        f"## Context Memory Unit: backlog-item-bench-{iso[:10]}-{n % 1000 + 1:03d}",
+        f"- **Created**: {iso}",
+        f"- **Updated**: {iso}",
+        "- **Type**: backlog-item",
+        "- **Version**: 1.0",
+        "- **Project**: MCU",
+        "- **Tool**: BACKLOG",
+        "- **Category**: governance",
+        '- **Tags**: ["backlog-item", "benchmark"]',
+    ]) + '\n'
+    text = METADATA_PATTERN.sub(lambda _: metadata, template, count=1)
+    text = text.replace('# [BACKLOG ITEM TITLE]', f'# Synthetic item {n} — Discovery', 1)
+    return _replace_sections(text, {
+        'Summary': [f'- Objective: Synthetic objective {n}', '- Acceptance Criteria:',
+                    '  - Source reference to VIBE_NOTE entry is linked', '  - Scope drafted'],
+        'Source References': [f'- [VIBE_NOTE: {stamp}](../../VIBE_NOTE.md#note-{stamp})'],
+        'Lineage': ['- Derived-from: ', '- Superseded-by: '],
+        'Execution Links': ['- PLAN: ', '- POP: ', '- STATUS: '],
+        'Tracks': [f'- source_track: {source}', f'- definition_track: {definition}',
+                   f'- execution_track: {execution}', f'- validation_track: {validation}',
+                   f"- docs_track: {'Docs-Added' if n % 4 == 0 else ''}", '- integration_evidence: ',
+                   f"- defer_track: {'Deferred' if n % 9 == 0 else ''}", '- defer_status: ',
+                   f"- defer_until: {'2025-%02d-01' % (n % 12 + 1) if n % 9 == 0 else ''}"],
+        'Workstreams': ['- current_workstream_id: ', '- completed_workstreams: '],
+        'Disposition': ['- Disposition: ', '- Notes: '],
+    })
+
+
+def _blit_name(n: int) -> str:
+    return f"BLIT_BENCH_{_stamp(n).strftime('%Y-%m-%dT%H-%M-%SZ')}.md"
+
+
+def generate_corpus(out_dir: Path, items: int, notes: Optional[int] = None,
+                    references: Optional[int] = None) -> Dict[str, int]:
+    """Write a synthetic corpus into out_dir (replacing it) and return its counts."""
+    notes = items if notes is None else notes
+    references = max(1, items // 10) if references is None else references
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    items_dir = out_dir / 'BACKLOGS' / 'ITEMS'
+    ref_dir = out_dir / 'reference'
+    items_dir.mkdir(parents=True)
+    ref_dir.mkdir(parents=True)
+
+    with open(out_dir / 'VIBE_NOTE.md', 'w', encoding='utf-8') as f:
+        f.write('# VIBE NOTE (OPERATOR)\n\n')
+        for n in range(notes):
+            ts = _stamp(n)
+            f.write(f'<a id="note-{ts.strftime("%Y-%m-%dT%H-%M-%SZ")}"></a>\n'
+                    f'## [{ts.strftime("%Y-%m-%dT%H:%M:%SZ")}] Synthetic note {n}\n'
+                    f'- Scope: benchmark entry {n}\n- Next: promote to a BLIT\n\n')
+
+    blit_template = (REPO_ROOT / 'templates' / 'MCU_BACKLOG_ITEM_TEMPLATE.md').read_text(encoding='utf-8')
+    index_lines = ['# BACKLOG MAIN', '', '## Items Index']
+    for n in range(items):
+        name = _blit_name(n)
+        (items_dir / name).write_text(_blit_text(blit_template, n), encoding='utf-8')
+        index_lines.append(f'- [ ] [Synthetic item {n}](ITEMS/{name})')
+    (out_dir / 'BACKLOGS' / 'BACKLOG_MAIN.md').write_text('\n'.join(index_lines) + '\n', encoding='utf-8')
+
+    # Explicit sequence numbers below, so the allocator is never consulted
+    generator = MCUGenerator()
+    generator.templates_dir = str(REPO_ROOT / 'templates')
+    pieces = generator._load_template('reference')
+    for n in range(references):
+        metadata = generator._generate_metadata('reference', f'bench-{n}', EPOCH.replace(tzinfo=None), n % 1000 + 1)
+        related = [(n + 1) % references, (n * 7 + 3) % references]
+        body = generator._render(pieces, metadata).rstrip('\n')
+        body += '\n\n## Related\n' + ''.join(
+            f'- [Reference {r}](REF_{r:06d}.md#executive-summary)\n' for r in related)
+        (ref_dir / f'REF_{n:06d}.md').write_text(body, encoding='utf-8')
+
+    counts = {'version': CORPUS_VERSION, 'items': items, 'notes': notes, 'references': references}
+    atomic_write_json(out_dir / 'corpus.json', counts)
+    return counts
+
+
+def default_corpus_dir(items: int) -> Path:
+    """Reusable corpus location outside the repository."""
+    return Path(tempfile.gettempdir()) / 'mcu-bench' / f'items-{items}'
+
+
+def ensure_corpus(out_dir: Path, items: int, regenerate: bool = False) -> Dict[str, int]:
+    """Reuse the corpus in out_dir when it was generated with the same parameters."""
+    counts = load_json(out_dir / 'corpus.json')
+    if regenerate or not isinstance(counts, dict) or counts.get('version') != CORPUS_VERSION \
+            or counts.get('items') != items:
+        counts = generate_corpus(out_dir, items)
+    return counts
+
+
+# ----------------------------------------------------------------------
+# Timing
+# ----------------------------------------------------------------------
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def e2e_commands(corpus: Path, scratch: Path) -> Dict[str, List[str]]:
+    items_dir = corpus / 'BACKLOGS' / 'ITEMS'
+    py = sys.executable
+    return {
+        'validate': [py, str(SCRIPTS_DIR / 'validate_mcu.py'), str(corpus)],
+        'links': [py, str(SCRIPTS_DIR / 'check_links.py'), str(corpus)],
+        'convert': [py, str(BLIT_DIR / 'blit_convert.py'), 'md-to-json', '--path', str(items_dir),
+                    '--out-dir', str(scratch / 'json')],
+        'report': [py, str(SCRIPTS_DIR / 'backlog_report.py'), '--items-dir', str(items_dir),
+                   '--ws-out', str(scratch / 'ws.csv'), '--tr-out', str(scratch / 'tr.csv')],
+        'kanban': [py, str(SCRIPTS_DIR / 'backlog_kanban.py'), '--all', '--items-dir', str(items_dir)],
+    }
+
+
+def run_e2e(corpus: Path, tasks: List[str], repeat: int) -> Dict[str, Dict]:
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = Path(tmp)
+        (scratch / 'json').mkdir()
+        commands = e2e_commands(corpus, scratch)
+        for task in tasks:
+            returncodes = []
+
+            def run() -> None:
+                proc = subprocess.run(commands[task], cwd=REPO_ROOT, stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.DEVNULL)
+                returncodes.append(proc.returncode)
+
+            seconds = best_of(run, repeat)
+            results[f'e2e.{task}'] = {'seconds': round(seconds, 6), 'returncode': returncodes[-1]}
+            print(f"  e2e.{task:<10} {seconds:9.3f}s  (exit {returncodes[-1]})")
+    return results
+
+
+def run_phases(corpus: Path, tasks: List[str], repeat: int) -> Dict[str, Dict]:
+    from backlog_kanban import load_items, render_board
+    from backlog_report import _collect_rows, _sort_rows
+    from blit_convert import md_to_json
+    from check_links import HeadingIndex, LinkChecker, extract_anchors
+    from validate_mcu import MCUValidator
+
+    items_dir = corpus / 'BACKLOGS' / 'ITEMS'
+    validator = MCUValidator()
+    files = validator.discover_files(str(corpus))
+    texts = {path: Path(path).read_text(encoding='utf-8') for path in files}
+    docs = {path: parse_text(text) for path, text in texts.items()}
+    item_paths = sorted(items_dir.glob('*.md'))
+
+    def report_rows() -> None:
+        rows_ws, rows_tracks = _collect_rows(items_dir, REPO_ROOT)
+        _sort_rows(rows_ws, rows_tracks)
+
+    phases: Dict[str, Callable[[], object]] = {
+        'discover': lambda: validator.discover_files(str(corpus)),
+        'read': lambda: [Path(path).read_text(encoding='utf-8') for path in files],
+        'parse': lambda: [parse_text(text) for text in texts.values()],
+    }
+    if 'validate' in tasks:
+        phases['validate_rules'] = lambda: [validator.validate_document(path, doc) for path, doc in docs.items()]
+    if 'links' in tasks:
+        phases['anchors'] = lambda: [extract_anchors(text) for text in texts.values()]
+        phases['link_checks'] = lambda: [checker.check_document(path, doc)
+                                         for checker in [LinkChecker(HeadingIndex())]
+                                         for path, doc in docs.items()]
+    if 'convert' in tasks:
+        phases['md_to_json'] = lambda: [md_to_json(path) for path in item_paths]
+    if 'report' in tasks:
+        phases['report_rows'] = report_rows
+    if 'kanban' in tasks:
+        phases['kanban_board'] = lambda: render_board(load_items(items_dir))
+
+    results: Dict[str, Dict] = {}
+    for name, fn in phases.items():
+        seconds = best_of(fn, repeat)
+        results[f'phase.{name}'] = {'seconds': round(seconds, 6)}
+        print(f"  phase.{name:<14} {seconds:9.3f}s")
+    return results
+
+
+# ----------------------------------------------------------------------
+# Baseline comparison
+# ----------------------------------------------------------------------
+def compare(current: Dict, baseline: Dict, threshold: float = 0.2, min_delta: float = 0.005) -> List[Dict]:
+    """Per-timing comparison rows; status is ok, regression, improved or new."""
+    rows = []
+    base_results = baseline.get('results', {})
+    for name, result in current.get('results', {}).items():
+        now = result['seconds']
+        before = base_results.get(name, {}).get('seconds')
+        if before is None:
+            rows.append({'name': name, 'baseline': None, 'current': now, 'ratio': None, 'status': 'new'})
+            continue
+        ratio = now / before if before > 0 else float('inf')
+        status = 'ok'
+        if now - before > min_delta and ratio > 1 + threshold:
+            status = 'regression'
+        elif before - now > min_delta and ratio < 1 - threshold:
+            status = 'improved'
+        rows.append({'name': name, 'baseline': before, 'current': now, 'ratio': round(ratio, 3), 'status': status})
+    return rows
+
+
+def print_comparison(rows: List[Dict], baseline_corpus: Optional[Dict], corpus: Dict) -> None:
+    if baseline_corpus and baseline_corpus != corpus:
+        print(f"⚠️  Baseline corpus differs: {baseline_corpus} vs {corpus}")
+    print(f"\n{'timing':<22} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+    for row in rows:
+        before = f"{row['baseline']:.3f}s" if row['baseline'] is not None else '-'
+        ratio = f"{row['ratio']:.2f}x" if row['ratio'] is not None else '-'
+        marker = {'regression': '❌', 'improved': '✅'}.get(row['status'], '')
+        print(f"{row['name']:<22} {before:>10} {row['current']:>9.3f}s {ratio:>7}  {row['status']} {marker}".rstrip())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description='Benchmark the MCU scripts on a synthetic corpus')
+    size = ap.add_mutually_exclusive_group()
+    size.add_argument('--size', choices=sorted(SIZES, key=SIZES.get), default='1k', help='Corpus size (default: 1k)')
+    size.add_argument('--items', type=int, default=None, help='Explicit number of BLITs (and notes)')
+    ap.add_argument('--corpus-dir', default=None,
+                    help='Where to generate the corpus (default: $TMPDIR/mcu-bench/items-N)')
+    ap.add_argument('--regenerate', action='store_true', help='Regenerate the corpus even if it exists')
+    ap.add_argument('--only', default=None, help=f"Comma-separated tasks (default: {','.join(TASKS)})")
+    ap.add_argument('--no-e2e', action='store_true', help='Skip the end-to-end script runs')
+    ap.add_argument('--no-phases', action='store_true', help='Skip the in-process phase timings')
+    ap.add_argument('--repeat', type=int, default=3, help='Repetitions; best time is reported (default: 3)')
+    ap.add_argument('--out', default=None, help='Write results JSON here')
+    ap.add_argument('--baseline', default=None, help='Compare against a previous results JSON')
+    ap.add_argument('--threshold', type=float, default=0.2,
+                    help='Relative slowdown flagged as a regression (default: 0.2 = 20%%)')
+    ap.add_argument('--min-delta', type=float, default=0.005,
+                    help='Ignore differences smaller than this many seconds (default: 0.005)')
+    args = ap.parse_args(argv)
+
+    tasks = [t.strip() for t in args.only.split(',')] if args.only else list(TASKS)
+    unknown = [t for t in tasks if t not in TASKS]
+    if unknown:
+        print(f"❌ Unknown task(s): {', '.join(unknown)}; choose from {', '.join(TASKS)}")
+        return 1
+    items = args.items if args.items is not None else SIZES[args.size]
+    corpus = Path(args.corpus_dir) if args.corpus_dir else default_corpus_dir(items)
+    corpus = corpus.resolve()
+
+    started = time.perf_counter()
+    counts = ensure_corpus(corpus, items, args.regenerate)
+    print(f"Corpus {corpus} ({counts['items']} items, {counts['notes']} notes, "
+          f"{counts['references']} references) ready in {time.perf_counter() - started:.1f}s")
+
+    results: Dict[str, Dict] = {}
+    if not args.no_e2e:
+        results.update(run_e2e(corpus, tasks, args.repeat))
+    if not args.no_phases:
+        results.update(run_phases(corpus, tasks, args.repeat))
+
+    report = {
+        'version': RESULTS_VERSION,
+        'created': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'corpus': {k: counts[k] for k in ('items', 'notes', 'references')},
+        'results': results,
+    }
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        print(f"✅ Results written to {args.out}")
+
+    if args.baseline:
+        baseline = load_json(Path(args.baseline))
+        if not isinstance(baseline, dict) or baseline.get('version') != RESULTS_VERSION:
+            print(f"❌ Not a benchmark results file: {args.baseline}")
+            return 1
+        rows = compare(report, baseline, args.threshold, args.min_delta)
+        print_comparison(rows, baseline.get('corpus'), report['corpus'])
+        regressions = [row['name'] for row in rows if row['status'] == 'regression']
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+MCU Startup Benchmark
+
+Measures the cold-start cost of the MCU commands as a pre-commit hook sees
+it: one small invocation per command, in a fresh interpreter, run both as
+the standalone script and through `mcu.py <command>`. For each run it
+reports the best wall time of `--repeat` launches and the import time
+reported by `python -X importtime` (sum of the top-level imports), plus the
+heaviest top-level imports.
+
+`--root` points at another checkout of the repository, e.g. a worktree of an
+older commit, so the reduction can be measured directly:
+
+  git worktree add /tmp/mcu-before <commit>
+  python3 base/scripts/bench_startup.py --root /tmp/mcu-before --out before.json
+  python3 base/scripts/bench_startup.py --baseline before.json
+
+Results use the bench_mcu.py JSON format; `--baseline` compares against a
+stored run and exits 1 on regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bench_mcu import RESULTS_VERSION, compare, print_comparison
+from mcu_cache import load_json
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# command -> (script relative to the root, arguments of a typical hook run)
+COMMANDS: Dict[str, Tuple[str, List[str]]] = {
+    'validate': ('base/scripts/validate_mcu.py', ['BACKLOGS/BACKLOG_MAIN.md']),
+    'links': ('base/scripts/check_links.py', ['reference']),
+    'generate': ('base/scripts/generate_mcu.py', ['--list']),
+    'convert': ('backlog-item/blit_convert.py', ['md-to-json', '--path', 'BACKLOGS/ITEMS', '--out-dir', '{tmp}']),
+    'report': ('base/scripts/backlog_report.py', ['--ws-out', '{tmp}/ws.csv', '--tr-out', '{tmp}/tr.csv']),
+    'kanban': ('base/scripts/backlog_kanban.py', ['--all']),
+}
+
+
+def parse_importtime(stderr: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """(total seconds, [(module, seconds)] heaviest first) of the top-level imports in -X importtime output."""
+    top: List[Tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()[1:]  # drop the separator space; nesting adds two more per level
+        if name.startswith(' ') or name in ('site', 'encodings'):
+            continue  # nested import, or interpreter startup common to every command
+        top.append((name, int(fields[1]) / 1e6))
+    return sum(seconds for _, seconds in top), sorted(top, key=lambda item: -item[1])
+
+
+def measure(argv: List[str], cwd: Path, repeat: int) -> Dict:
+    """Best wall time of repeat launches, and the import profile of one more."""
+    best = float('inf')
+    returncode = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable] + argv, cwd=cwd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - started)
+        returncode = proc.returncode
+    proc = subprocess.run([sys.executable, '-X', 'importtime'] + argv, cwd=cwd, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True)
+    imports, heaviest = parse_importtime(proc.stderr)
+    return {'seconds': round(best, 6), 'imports': round(imports, 6), 'returncode': returncode,
+            'heaviest': [[name, round(seconds, 6)] for name, seconds in heaviest[:5]]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description='Benchmark MCU command startup (wall time and import time)')
+    ap.add_argument('--root', default=str(REPO_ROOT), help='Repository checkout to measure (default: this one)')
+    ap.add_argument('--only', default=None, help=f"Comma-separated commands (default: {','.join(COMMANDS)})")
+    ap.add_argument('--repeat', type=int, default=5, help='Launches per command; best time is reported (default: 5)')
+    ap.add_argument('--out', default=None, help='Write results JSON here')
+    ap.add_argument('--baseline', default=None, help='Compare against a previous results JSON')
+    ap.add_argument('--threshold', type=float, default=0.2,
+                    help='Relative slowdown flagged as a regression (default: 0.2 = 20%%)')
+    ap.add_argument('--min-delta', type=float, default=0.005,
+                    help='Ignore differences smaller than this many seconds (default: 0.005)')
+    args = ap.parse_args(argv)
+
+    root = Path(args.root).resolve()
+    commands = [c.strip() for c in args.only.split(',')] if args.only else list(COMMANDS)
+    unknown = [c for c in commands if c not in COMMANDS]
+    if unknown:
+        print(f"❌ Unknown command(s): {', '.join(unknown)}; choose from {', '.join(COMMANDS)}")
+        return 1
+    has_mcu_commands = 'SCRIPT_COMMANDS' in (root / 'base' / 'scripts' / 'mcu.py').read_text(encoding='utf-8') \
+        if (root / 'base' / 'scripts' / 'mcu.py').exists() else False
+
+    results: Dict[str, Dict] = {}
+    print(f"{'run':<18} {'wall':>9} {'imports':>9}  heaviest imports")
+    with tempfile.TemporaryDirectory() as tmp:
+        for command in commands:
+            script, script_args = COMMANDS[command]
+            script_args = [a.replace('{tmp}', tmp) for a in script_args]
+            runs = {f'script.{command}': [script] + script_args}
+            if has_mcu_commands:
+                runs[f'mcu.{command}'] = ['base/scripts/mcu.py', command] + script_args
+            for name, run_argv in runs.items():
+                result = measure(run_argv, root, args.repeat)
+                results[name] = result
+                heaviest = ', '.join(f"{mod} {sec * 1000:.1f}" for mod, sec in result['heaviest'][:3])
+                status = '' if result['returncode'] == 0 else f"  (exit {result['returncode']})"
+                print(f"{name:<18} {result['seconds'] * 1000:>7.1f}ms {result['imports'] * 1000:>7.1f}ms  "
+                      f"{heaviest}{status}")
+
+    report = {
+        'version': RESULTS_VERSION,
+        'created': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'root': root.as_posix(),
+        'results': results,
+    }
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        print(f"✅ Results written to {args.out}")
+
+    if args.baseline:
+        baseline = load_json(Path(args.baseline))
+        if not isinstance(baseline, dict) or baseline.get('version') != RESULTS_VERSION:
+            print(f"❌ Not a benchmark results file: {args.baseline}")
+            return 1
+        rows = compare(report, baseline, args.threshold, args.min_delta)
+        print_comparison(rows, None, None)
+        regressions = [row['name'] for row in rows if row['status'] == 'regression']
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,54 +4,182 @@ MCU Link Checker
 
 This script checks for broken links in MCU documentation files.
 It validates internal links, external links, and cross-references.
+External (http/https) links are only verified with --external.
 """
 
+import argparse
 import os
 import sys
 import re
-import requests
 from pathlib import Path
-from typing import Dict, List, Tuple, Set, Optional
-from urllib.parse import urlparse, urljoin
+from typing import TYPE_CHECKING, Dict, List, Set, Optional
+from urllib.parse import unquote
+
+from mcu_cache import atomic_write_json, default_cache_dir, load_json
+from mcu_parser import FENCE_RE
+import mcu_profile
+
+if TYPE_CHECKING:
+    # Imported at run time only with --external (asyncio and urllib.request are slow to load)
+    from external_links import ExternalLinkChecker
+
+ANCHOR_CACHE_FILE_NAME = 'anchors.json'
+ANCHOR_CACHE_VERSION = 1
+
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})[ \t]+(.*?)[ \t]*#*[ \t]*$')
+HTML_ANCHOR_RE = re.compile(r'<a\s+[^>]*?(?:id|name)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+MD_LINK_TEXT_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+SLUG_STRIP_RE = re.compile(r'[^\w\- ]', re.UNICODE)
+
+
+def slugify(heading: str) -> str:
+    """GitHub-style anchor slug for a heading text."""
+    text = MD_LINK_TEXT_RE.sub(r'\1', heading)
+    text = HTML_TAG_RE.sub('', text)
+    text = SLUG_STRIP_RE.sub('', text.strip().lower())
+    return text.replace(' ', '-')
+
+
+def extract_anchors(content: str) -> Set[str]:
+    """Return every anchor a document defines: heading slugs and explicit <a id/name>.
+
+    Duplicate headings get GitHub's -1, -2, ... suffixes. Headings inside
+    fenced code blocks are ignored.
+    """
+    anchors: Set[str] = set()
+    slug_counts: Dict[str, int] = {}
+    fence: Optional[str] = None
+    for line in content.splitlines():
+        fence_match = FENCE_RE.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker[0] * 3
+            elif marker.startswith(fence):
+                fence = None
+            continue
+        if fence is not None:
+            continue
+        heading_match = HEADING_RE.match(line)
+        if heading_match:
+            slug = slugify(heading_match.group(2))
+            count = slug_counts.get(slug, 0)
+            slug_counts[slug] = count + 1
+            anchors.add(slug if count == 0 else f"{slug}-{count}")
+        if '<a' in line or '<A' in line:
+            anchors.update(HTML_ANCHOR_RE.findall(line))
+    return anchors
+
+
+class HeadingIndex:
+    """Anchor sets per Markdown file, built at most once per run.
+
+    Each file is scanned the first time one of its anchors is looked up;
+    later lookups are a dict access plus a set membership test. With a
+    cache path, anchor sets persist across runs keyed by mtime/size, so
+    unchanged files are never rescanned.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self._anchors: Dict[str, Optional[Set[str]]] = {}
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if cache_path is not None:
+            data = load_json(cache_path, default={})
+            if isinstance(data, dict) and data.get('version') == ANCHOR_CACHE_VERSION:
+                self._entries = data.get('entries') or {}
+
+    def anchors(self, file_path: str) -> Optional[Set[str]]:
+        """Anchors defined by file_path, or None if it cannot be read."""
+        key = os.path.abspath(file_path)
+        if key in self._anchors:
+            return self._anchors[key]
+        anchors: Optional[Set[str]] = None
+        try:
+            st = os.stat(key)
+            entry = self._entries.get(key)
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                anchors = set(entry['anchors'])
+            else:
+                with mcu_profile.active().phase('anchors', key):
+                    with open(key, 'r', encoding='utf-8') as f:
+                        anchors = extract_anchors(f.read())
+                if self.cache_path is not None:
+                    self._entries[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                                          'anchors': sorted(anchors)}
+                    self._dirty = True
+        except (OSError, UnicodeDecodeError):
+            anchors = None
+        self._anchors[key] = anchors
+        return anchors
+
+    def has_anchor(self, file_path: str, anchor: str) -> bool:
+        anchors = self.anchors(file_path)
+        if not anchors:
+            return False
+        return anchor in anchors or anchor.lower() in anchors
+
+    def save(self) -> None:
+        if self.cache_path is None or not self._dirty:
+            return
+        # Drop entries for files that no longer exist
+        self._entries = {k: v for k, v in self._entries.items() if os.path.exists(k)}
+        atomic_write_json(self.cache_path, {'version': ANCHOR_CACHE_VERSION, 'entries': self._entries})
+        self._dirty = False
+
 
 class LinkChecker:
     """Checks links in MCU documentation files."""
     
-    def __init__(self):
+    def __init__(self, heading_index: Optional[HeadingIndex] = None,
+                 external_checker: Optional['ExternalLinkChecker'] = None):
         self.broken_links = []
         self.valid_links = []
         self.external_links = []
+        self.heading_index = heading_index or HeadingIndex()
+        self.external_checker = external_checker
         
     def check_file(self, file_path: str) -> List[Dict]:
         """Check links in a single file."""
-        issues = []
-        
+        timings = mcu_profile.active()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Find all markdown links
-            link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-            links = re.findall(link_pattern, content)
-            
-            for link_text, link_url in links:
-                issue = self._validate_link(file_path, link_text, link_url)
-                if issue:
-                    issues.append(issue)
-                    
+            with timings.phase('read', file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            with timings.phase('links', file_path):
+                return self._check_content(file_path, content)
         except Exception as e:
-            issues.append({
-                'file': file_path,
-                'type': 'error',
-                'message': f"Error reading file: {str(e)}"
-            })
-            
+            return [self._read_error(file_path, e)]
+    
+    def _check_content(self, file_path: str, content: str) -> List[Dict]:
+        issues = []
+        # Find all markdown links
+        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+        links = re.findall(link_pattern, content)
+        
+        for link_text, link_url in links:
+            issue = self._validate_link(file_path, link_text, link_url)
+            if issue:
+                issues.append(issue)
         return issues
     
+    @staticmethod
+    def _read_error(file_path: str, error: Exception) -> Dict:
+        return {
+            'file': file_path,
+            'type': 'error',
+            'message': f"Error reading file: {str(error)}"
+        }
+    
     def _validate_link(self, file_path: str, link_text: str, link_url: str) -> Optional[Dict]:
         """Validate a single link."""
-        # Skip external links for now (can be added later)
+        # External links are collected and verified in one concurrent batch
+        # by check_external_links(); without --external they are skipped.
         if link_url.startswith('http'):
+            if self.external_checker is not None:
+                self.external_links.append((file_path, link_text, link_url))
             return None
             
         # Check if it's a relative link
@@ -67,38 +195,39 @@ class LinkChecker:
     
     def _check_relative_link(self, file_path: str, link_text: str, link_url: str) -> Optional[Dict]:
         """Check relative links."""
-        file_dir = os.path.dirname(file_path)
-        target_path = os.path.join(file_dir, link_url)
-        
-        if not os.path.exists(target_path):
+        return self._check_target(file_path, link_text, link_url)
+    
+    def _check_anchor_link(self, file_path: str, link_text: str, link_url: str) -> Optional[Dict]:
+        """Check anchor links against the headings of the current file."""
+        anchor = unquote(link_url[1:])
+        if not anchor:
             return {
                 'file': file_path,
-                'type': 'broken_link',
+                'type': 'invalid_anchor',
                 'link_text': link_text,
                 'link_url': link_url,
-                'message': f"Target file does not exist: {target_path}"
+                'message': f"Invalid anchor format: {link_url}"
             }
-            
-        return None
-    
-    def _check_anchor_link(self, file_path: str, link_text: str, link_url: str) -> Optional[Dict]:
-        """Check anchor links."""
-        # For now, just check if the anchor format is valid
-        if not re.match(r'^#[a-zA-Z0-9_-]+$', link_url):
+        if not self.heading_index.has_anchor(file_path, anchor):
             return {
                 'file': file_path,
-                'type': 'invalid_anchor',
+                'type': 'broken_anchor',
                 'link_text': link_text,
                 'link_url': link_url,
-                'message': f"Invalid anchor format: {link_url}"
+                'message': f"Anchor not found in {file_path}: #{anchor}"
             }
             
         return None
     
     def _check_file_link(self, file_path: str, link_text: str, link_url: str) -> Optional[Dict]:
         """Check file links."""
+        return self._check_target(file_path, link_text, link_url)
+
+    def _check_target(self, file_path: str, link_text: str, link_url: str) -> Optional[Dict]:
+        """Check that a file link's target exists and, for `file.md#anchor`, that the anchor does."""
+        target, _, fragment = link_url.partition('#')
         file_dir = os.path.dirname(file_path)
-        target_path = os.path.join(file_dir, link_url)
+        target_path = os.path.join(file_dir, unquote(target))
         
         if not os.path.exists(target_path):
             return {
@@ -108,31 +237,128 @@ class LinkChecker:
                 'link_url': link_url,
                 'message': f"Target file does not exist: {target_path}"
             }
+
+        anchor = unquote(fragment)
+        if anchor and target_path.endswith('.md') and os.path.isfile(target_path):
+            if not self.heading_index.has_anchor(target_path, anchor):
+                return {
+                    'file': file_path,
+                    'type': 'broken_anchor',
+                    'link_text': link_text,
+                    'link_url': link_url,
+                    'message': f"Anchor not found in {target_path}: #{anchor}"
+                }
             
         return None
     
-    def check_directory(self, directory: str) -> List[Dict]:
-        """Check all markdown files in a directory."""
+    def check_document(self, file_path: str, doc) -> List[Dict]:
+        """Check links of an already-parsed document (e.g. from the corpus index)."""
+        issues = []
+        for link_text, link_url in doc.links:
+            issue = self._validate_link(file_path, link_text, link_url)
+            if issue:
+                issues.append(issue)
+        return issues
+
+    def check_directory(self, directory: str, index=None) -> List[Dict]:
+        """Check all markdown files in a directory.
+
+        With a corpus index (mcu_index.MCUIndex), links are read from the
+        index, which re-parses only files that changed since the last run.
+        """
         all_issues = []
+        indexed = {}
+        timings = mcu_profile.active()
+        if index is not None:
+            with timings.phase('index'):
+                index.refresh(Path(directory))
+                indexed = {os.path.abspath(doc.path): doc for doc in index.documents(Path(directory))}
         
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    issues = self.check_file(file_path)
-                    all_issues.extend(issues)
+        with timings.phase('discover'):
+            file_paths = []
+            for root, dirs, files in os.walk(directory):
+                # Skip hidden directories (.git, .mcu_cache, ...)
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                file_paths.extend(os.path.join(root, file) for file in files if file.endswith('.md'))
+        check_document = timings.wrap('links', self.check_document)
+        for file_path in file_paths:
+            doc = indexed.get(os.path.abspath(file_path))
+            if doc is not None:
+                issues = check_document(file_path, doc)
+            else:
+                issues = self.check_file(file_path)
+            all_issues.extend(issues)
+
+        if self.external_checker is not None:
+            with timings.phase('external'):
+                all_issues.extend(self.check_external_links())
                     
         return all_issues
 
-def main():
+    def check_external_links(self) -> List[Dict]:
+        """Verify collected external links; each distinct URL is requested once."""
+        occurrences = self.external_links
+        self.external_links = []
+        if not occurrences or self.external_checker is None:
+            return []
+        from external_links import normalize_url
+        results = self.external_checker.check_urls(url for _, _, url in occurrences)
+        issues = []
+        for file_path, link_text, link_url in occurrences:
+            result = results[normalize_url(link_url)]
+            if not result.ok:
+                issues.append({
+                    'file': file_path,
+                    'type': 'broken_external',
+                    'link_text': link_text,
+                    'link_url': link_url,
+                    'message': f"External link failed ({result.message}): {result.url}"
+                })
+        return issues
+
+def main(argv: Optional[List[str]] = None):
     """Main link checking function."""
-    checker = LinkChecker()
-    
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description='Check links in MCU documentation files.')
+    parser.add_argument('directory', nargs='?', help='Directory to check')
+    parser.add_argument('--index', nargs='?', const='', default=None, metavar='DB',
+                        help='Read links from the SQLite corpus index (default DB: .mcu_cache/index.sqlite)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Persist heading anchors and external link results across runs')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Cache directory (default: $MCU_CACHE_DIR or ./.mcu_cache)')
+    parser.add_argument('--external', action='store_true',
+                        help='Also verify http(s) links (concurrently, each distinct URL once)')
+    parser.add_argument('--max-connections', type=int, default=16,
+                        help='Concurrent external requests overall (default: 16)')
+    parser.add_argument('--per-host', type=int, default=4,
+                        help='Concurrent external requests per host (default: 4)')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='Per-request timeout in seconds (default: 10)')
+    parser.add_argument('--cache-ttl', type=float, default=86400.0,
+                        help='Seconds a successful external result stays cached (default: 86400)')
+    mcu_profile.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.directory is None:
+        # Same message and status as before the argparse rewrite; hooks check $?
         print("Usage: python check_links.py <directory>")
         sys.exit(1)
-        
-    directory = sys.argv[1]
+    with mcu_profile.session(args):
+        run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    cache_dir = Path(args.cache_dir or default_cache_dir()) if args.cache else None
+    heading_index = HeadingIndex(cache_dir / ANCHOR_CACHE_FILE_NAME if cache_dir else None)
+    external_cache = None
+    external_checker = None
+    if args.external:
+        from external_links import EXTERNAL_CACHE_FILE_NAME, ExternalLinkCache, ExternalLinkChecker
+        external_cache = ExternalLinkCache(cache_dir / EXTERNAL_CACHE_FILE_NAME if cache_dir else None,
+                                           ttl=args.cache_ttl, failure_ttl=min(args.cache_ttl, 3600.0))
+        external_checker = ExternalLinkChecker(max_connections=args.max_connections, per_host=args.per_host,
+                                               timeout=args.timeout, cache=external_cache)
+    checker = LinkChecker(heading_index, external_checker)
+    directory = args.directory
     
     if not os.path.exists(directory):
         print(f"Directory not found: {directory}")
@@ -141,18 +367,28 @@ def main():
     print(f"Checking links in: {directory}")
     print("=" * 50)
     
-    issues = checker.check_directory(directory)
+    if args.index is not None:
+        from mcu_index import open_index
+        with open_index(args.index) as index:
+            issues = checker.check_directory(directory, index)
+    else:
+        issues = checker.check_directory(directory)
+    with mcu_profile.active().phase('cache'):
+        heading_index.save()
+        if external_cache is not None:
+            external_cache.save()
     
     if not issues:
         print("🎉 No link issues found!")
         return
         
-    for issue in issues:
-        print(f"❌ {issue['file']}")
-        print(f"   - {issue['message']}")
-        if 'link_text' in issue:
-            print(f"   - Link: [{issue['link_text']}]({issue['link_url']})")
-        print()
+    with mcu_profile.active().phase('emit'):
+        for issue in issues:
+            print(f"❌ {issue['file']}")
+            print(f"   - {issue['message']}")
+            if 'link_text' in issue:
+                print(f"   - Link: [{issue['link_text']}]({issue['link_url']})")
+            print()
         
     print(f"Found {len(issues)} link issues")
     sys.exit(1)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+MCU External Link Verification
+
+Checks http(s) links concurrently for check_links.py `--external`.
+
+- Identical URLs (ignoring `#fragment`) are checked once across all files.
+- Requests run on a bounded worker pool (`max_connections`) driven by
+  asyncio, with an additional per-host concurrency limit.
+- Each request uses HEAD, falling back to GET when the server rejects HEAD.
+- Results can be kept in an on-disk TTL cache so repeat runs skip URLs that
+  were checked recently; failures expire sooner than successes.
+
+Only the standard library is used (urllib in worker threads), so proxies
+and TLS behave exactly as they do for other Python tooling.
+"""
+
+import asyncio
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urldefrag, urlparse
+
+from mcu_cache import atomic_write_json, load_json
+
+EXTERNAL_CACHE_FILE_NAME = 'external_links.json'
+EXTERNAL_CACHE_VERSION = 1
+
+USER_AGENT = 'mcu-check-links/1.0'
+# Servers that answer these to HEAD are retried with GET
+HEAD_REJECTED = {403, 405, 501}
+
+
+class LinkResult:
+    """Outcome of checking one URL."""
+
+    __slots__ = ('url', 'ok', 'status', 'message', 'checked_at')
+
+    def __init__(self, url: str, ok: bool, status: Optional[int], message: str,
+                 checked_at: Optional[float] = None):
+        self.url = url
+        self.ok = ok
+        self.status = status
+        self.message = message
+        self.checked_at = time.time() if checked_at is None else checked_at
+
+    def to_dict(self) -> Dict:
+        return {'ok': self.ok, 'status': self.status, 'message': self.message, 'checked_at': self.checked_at}
+
+    @classmethod
+    def from_dict(cls, url: str, data: Dict) -> 'LinkResult':
+        return cls(url, data['ok'], data.get('status'), data.get('message', ''), data['checked_at'])
+
+
+class ExternalLinkCache:
+    """On-disk TTL cache of URL results."""
+
+    def __init__(self, cache_path: Optional[Path], ttl: float = 86400.0, failure_ttl: float = 3600.0):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if cache_path is not None:
+            data = load_json(cache_path, default={})
+            if isinstance(data, dict) and data.get('version') == EXTERNAL_CACHE_VERSION:
+                self.entries = data.get('entries') or {}
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[LinkResult]:
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        now = time.time() if now is None else now
+        ttl = self.ttl if entry.get('ok') else self.failure_ttl
+        if now - entry.get('checked_at', 0) > ttl:
+            return None
+        return LinkResult.from_dict(url, entry)
+
+    def put(self, result: LinkResult) -> None:
+        self.entries[result.url] = result.to_dict()
+        self._dirty = True
+
+    def save(self) -> None:
+        if self.cache_path is None or not self._dirty:
+            return
+        now = time.time()
+        # Expired entries are not worth keeping on disk
+        self.entries = {url: e for url, e in self.entries.items()
+                        if now - e.get('checked_at', 0) <= max(self.ttl, self.failure_ttl)}
+        atomic_write_json(self.cache_path, {'version': EXTERNAL_CACHE_VERSION, 'entries': self.entries})
+        self._dirty = False
+
+
+def normalize_url(link_url: str) -> str:
+    """Strip `<...>`, a trailing link title and the fragment from a Markdown URL."""
+    url = link_url.strip()
+    if url.startswith('<') and url.endswith('>'):
+        url = url[1:-1]
+    url = url.split()[0] if url else url
+    return urldefrag(url)[0]
+
+
+class ExternalLinkChecker:
+    """Verifies external URLs concurrently with bounded global and per-host parallelism."""
+
+    def __init__(self, max_connections: int = 16, per_host: int = 4, timeout: float = 10.0,
+                 cache: Optional[ExternalLinkCache] = None):
+        self.max_connections = max(1, max_connections)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.cache = cache or ExternalLinkCache(None)
+        self.requests_made = 0
+
+    def check_urls(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        """Check each distinct URL once; returns url -> result."""
+        unique = sorted({normalize_url(u) for u in urls})
+        results: Dict[str, LinkResult] = {}
+        pending = []
+        for url in unique:
+            cached = self.cache.get(url)
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+        if pending:
+            for result in asyncio.run(self._check_all(pending)):
+                results[result.url] = result
+                self.cache.put(result)
+        return results
+
+    async def _check_all(self, urls):
+        loop = asyncio.get_running_loop()
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        with ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix='mcu-link') as pool:
+            async def check(url: str) -> LinkResult:
+                host = urlparse(url).netloc.lower()
+                limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+                async with limit:
+                    return await loop.run_in_executor(pool, self._fetch, url)
+            return await asyncio.gather(*(check(url) for url in urls))
+
+    def _request(self, url: str, method: str) -> int:
+        self.requests_made += 1
+        request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def _fetch(self, url: str) -> LinkResult:
+        if urlparse(url).scheme not in ('http', 'https'):
+            return LinkResult(url, False, None, f"Unsupported URL scheme: {url}")
+        try:
+            status = self._request(url, 'HEAD')
+            if status in HEAD_REJECTED:
+                status = self._request(url, 'GET')
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            reason = getattr(e, 'reason', e)
+            return LinkResult(url, False, None, f"Request failed: {reason}")
+        if 200 <= status < 400:
+            return LinkResult(url, True, status, 'OK')
+        return LinkResult(url, False, status, f"HTTP {status}")
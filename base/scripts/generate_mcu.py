@@ -4,28 +4,56 @@ MCU Generator
 
 This script generates MCU files from templates with proper metadata.
 It helps create new MCUs with the correct structure and metadata.
+
+The `[SEQ]` of each context_unit_id comes from mcu_sequence.SequenceAllocator,
+so concurrent runs get unique sequences per type and date. `--reseed` resets
+the allocator's state from the corpus.
+
+Batch mode (`--manifest FILE`) generates every MCU listed in a CSV, JSON or
+YAML manifest with `type`, `name` and optional `output_dir` columns/keys.
+Each template is read and split around its metadata block once per run, and
+the sequences for each type are reserved in one allocation.
+
+`--timings [N]` / `--profile FILE` (see mcu_profile.py) may be added to any
+invocation.
 """
 
+import csv
+import json
 import os
 import sys
 import re
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+import mcu_profile
+from mcu_sequence import SequenceAllocator
+
+# Context Memory Unit heading plus its `- **Key**: value` lines
+METADATA_PATTERN = re.compile(r'## Context Memory Unit: [^\n]+\n(?:- \*\*[^*]+\*\*: [^\n]+\n)*')
 
 class MCUGenerator:
     """Generates MCU files from templates."""
     
-    def __init__(self):
+    def __init__(self, allocator: Optional[SequenceAllocator] = None):
         self.templates_dir = "templates"
         self.valid_types = ['reference', 'instruction', 'instruction-agent']
+        self.allocator = allocator or SequenceAllocator(Path(__file__).resolve().parents[2])
+        # mcu_type -> template split around its metadata block(s)
+        self._templates: Dict[str, List[str]] = {}
         
-    def generate_mcu(self, mcu_type: str, name: str, output_dir: str = ".") -> bool:
-        """Generate a new MCU file from template."""
+    def _load_template(self, mcu_type: str) -> Optional[List[str]]:
+        """Return the template for mcu_type split on METADATA_PATTERN, read once per generator."""
         if mcu_type not in self.valid_types:
             print(f"Invalid MCU type: {mcu_type}")
             print(f"Valid types: {self.valid_types}")
-            return False
+            return None
+        pieces = self._templates.get(mcu_type)
+        if pieces is not None:
+            return pieces
             
         # Find template file
         template_file = f"MCU_{mcu_type.upper().replace('-', '_')}_TEMPLATE.md"
@@ -33,36 +61,86 @@ class MCUGenerator:
         
         if not os.path.exists(template_path):
             print(f"Template not found: {template_path}")
+            return None
+            
+        # Read template
+        with mcu_profile.active().phase('template', template_path):
+            with open(template_path, 'r', encoding='utf-8') as f:
+                pieces = METADATA_PATTERN.split(f.read())
+        self._templates[mcu_type] = pieces
+        return pieces
+        
+    def generate_mcu(self, mcu_type: str, name: str, output_dir: str = ".") -> bool:
+        """Generate a new MCU file from template."""
+        pieces = self._load_template(mcu_type)
+        if pieces is None:
             return False
             
-        # Generate metadata
+        # Generate metadata (allocates the sequence, so only once the template is in hand)
         metadata = self._generate_metadata(mcu_type, name)
+        output_path = self._write_mcu(pieces, metadata, name, output_dir)
+        print(f"✅ Generated MCU: {output_path}")
+        return True
+    
+    def generate_batch(self, entries: List[Tuple[str, str, str]]) -> Tuple[int, int]:
+        """Generate (type, name, output_dir) entries; returns (generated, failed)."""
+        start = time.perf_counter()
+        loaded = [(entry, self._load_template(entry[0])) for entry in entries]
+        valid = [(entry, pieces) for entry, pieces in loaded if pieces is not None]
+        failed = len(entries) - len(valid)
         
-        # Read template
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-            
-        # Replace placeholders
-        content = self._replace_placeholders(template_content, metadata)
+        # Reserve each type's sequences as one contiguous block
+        now = datetime.now()
+        date_str = now.strftime("%Y-%m-%d")
+        with mcu_profile.active().phase('sequence'):
+            next_sequence = {
+                mcu_type: self.allocator.allocate(mcu_type, date_str, count)
+                for mcu_type, count in Counter(entry[0] for entry, _ in valid).items()
+            }
         
+        generated = 0
+        for (mcu_type, name, output_dir), pieces in valid:
+            metadata = self._generate_metadata(mcu_type, name, now, next_sequence[mcu_type])
+            next_sequence[mcu_type] += 1
+            try:
+                os.makedirs(output_dir, exist_ok=True)
+                output_path = self._write_mcu(pieces, metadata, name, output_dir)
+            except OSError as e:
+                print(f"❌ {name}: {e}")
+                failed += 1
+                continue
+            print(f"✅ Generated MCU: {output_path}")
+            generated += 1
+            
+        elapsed = time.perf_counter() - start
+        rate = generated / elapsed if elapsed > 0 else float('inf')
+        print(f"Generated {generated} MCU(s) in {elapsed:.3f}s ({rate:.1f} files/sec), {failed} failed")
+        return generated, failed
+    
+    def _write_mcu(self, pieces: List[str], metadata: Dict, name: str, output_dir: str) -> str:
         # Create output file
         output_file = f"{name}.md"
         output_path = os.path.join(output_dir, output_file)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-            
-        print(f"✅ Generated MCU: {output_path}")
-        return True
+        with mcu_profile.active().phase('emit', output_path):
+            # Replace placeholders
+            content = self._render(pieces, metadata)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return output_path
     
-    def _generate_metadata(self, mcu_type: str, name: str) -> Dict:
+    def _generate_metadata(self, mcu_type: str, name: str, now: Optional[datetime] = None,
+                           sequence_number: Optional[int] = None) -> Dict:
         """Generate metadata for new MCU."""
-        now = datetime.now()
+        now = now or datetime.now()
         date_str = now.strftime("%Y-%m-%d")
         time_str = now.strftime("%Y-%m-%dT%H:%M:%SZ")
         
         # Generate context unit ID
-        sequence = "001"  # Could be made more sophisticated
+        if sequence_number is None:
+            with mcu_profile.active().phase('sequence'):
+                sequence_number = self.allocator.allocate(mcu_type, date_str)
+        sequence = f"{sequence_number:03d}"
         context_unit_id = f"{mcu_type}-{name.lower().replace(' ', '-')}-{date_str}-{sequence}"
         
         return {
@@ -77,12 +155,9 @@ class MCUGenerator:
             'tags': [mcu_type, 'specification', 'template']
         }
     
-    def _replace_placeholders(self, template_content: str, metadata: Dict) -> str:
-        """Replace placeholders in template with metadata."""
-        content = template_content
-        
-        # Replace metadata section
-        metadata_section = f"""## Context Memory Unit: {metadata['context_unit_id']}
+    @staticmethod
+    def _metadata_section(metadata: Dict) -> str:
+        return f"""## Context Memory Unit: {metadata['context_unit_id']}
 - **Created**: {metadata['created_at']}
 - **Updated**: {metadata['updated_at']}
 - **Type**: {metadata['type']}
@@ -91,12 +166,10 @@ class MCUGenerator:
 - **Tool**: {metadata['tool']}
 - **Category**: {metadata['category']}
 - **Tags**: {metadata['tags']}"""
-        
-        # Find and replace metadata section
-        metadata_pattern = r'## Context Memory Unit: [^\n]+\n(?:- \*\*[^*]+\*\*: [^\n]+\n)*'
-        content = re.sub(metadata_pattern, metadata_section, content)
-        
-        return content
+    
+    def _render(self, pieces: List[str], metadata: Dict) -> str:
+        """Join a split template around the metadata section."""
+        return self._metadata_section(metadata).join(pieces)
     
     def list_templates(self):
         """List available templates."""
@@ -109,28 +182,88 @@ class MCUGenerator:
                 print(f"- {mcu_type}: {template_file}")
                 
         print(f"\nUsage: python generate_mcu.py <type> <name> [output_dir]")
+        print(f"       python generate_mcu.py --manifest <manifest.csv|json|yaml>")
         print(f"Example: python generate_mcu.py reference my-reference-doc")
 
-def main():
+
+def load_manifest(path: str) -> List[Tuple[str, str, str]]:
+    """Read (type, name, output_dir) entries from a CSV, JSON or YAML manifest.
+
+    JSON/YAML manifests are a list of mappings, or a mapping with an `mcus` list.
+    """
+    suffix = Path(path).suffix.lower()
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if suffix == '.csv':
+            records = list(csv.DictReader(f))
+        elif suffix == '.json':
+            records = json.load(f)
+        elif suffix in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML manifests need PyYAML (pip install pyyaml)")
+            records = yaml.safe_load(f)
+        else:
+            raise ValueError(f"Unsupported manifest format: {suffix or path}")
+    if isinstance(records, dict):
+        records = records.get('mcus')
+    if not isinstance(records, list):
+        raise ValueError("Manifest must be a list of entries")
+    entries = []
+    for i, record in enumerate(records, 1):
+        if not isinstance(record, dict) or not record.get('type') or not record.get('name'):
+            raise ValueError(f"Manifest entry {i} needs 'type' and 'name'")
+        entries.append((str(record['type']).strip(), str(record['name']).strip(),
+                        str(record.get('output_dir') or '.').strip()))
+    return entries
+
+def main(argv: Optional[List[str]] = None):
     """Main generation function."""
+    profiling, argv = mcu_profile.parse_known(sys.argv[1:] if argv is None else argv)
+    with mcu_profile.session(profiling):
+        run(argv)
+
+
+def run(argv: List[str]) -> None:
     generator = MCUGenerator()
     
-    if len(sys.argv) < 2:
+    if len(argv) < 1:
         print("Usage: python generate_mcu.py <type> <name> [output_dir]")
+        print("       python generate_mcu.py --manifest <manifest.csv|json|yaml>")
         print("       python generate_mcu.py --list")
+        print("       python generate_mcu.py --reseed")
         sys.exit(1)
         
-    if sys.argv[1] == "--list":
+    if argv[0] == "--list":
         generator.list_templates()
         return
         
-    if len(sys.argv) < 3:
+    if argv[0] == "--reseed":
+        generator.allocator.rebuild()
+        print(f"✅ Re-seeded sequences for {generator.allocator.root}")
+        return
+        
+    if argv[0] == "--manifest":
+        if len(argv) < 2:
+            print("Usage: python generate_mcu.py --manifest <manifest.csv|json|yaml>")
+            sys.exit(1)
+        try:
+            entries = load_manifest(argv[1])
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read manifest: {e}")
+            sys.exit(1)
+        _, failed = generator.generate_batch(entries)
+        if failed:
+            sys.exit(1)
+        return
+        
+    if len(argv) < 2:
         print("Usage: python generate_mcu.py <type> <name> [output_dir]")
         sys.exit(1)
         
-    mcu_type = sys.argv[1]
-    name = sys.argv[2]
-    output_dir = sys.argv[3] if len(sys.argv) > 3 else "."
+    mcu_type = argv[0]
+    name = argv[1]
+    output_dir = argv[2] if len(argv) > 2 else "."
     
     success = generator.generate_mcu(mcu_type, name, output_dir)
     if not success:
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+MCU Command Line
+
+Single entry point for the MCU tools: corpus-level commands (index, search,
+graph) and the standalone scripts, which keep working on their own.
+
+Usage:
+  python3 base/scripts/mcu.py index [root] [--db PATH] [--rebuild]
+  python3 base/scripts/mcu.py search QUERY [--refresh] [--section quick] [--type reference] [--tag backlog-item]
+  python3 base/scripts/mcu.py graph [root] [--orphans] [--cycles] [--top N] [--cites FILE] [--dot F] [--json F]
+  python3 base/scripts/mcu.py validate PATH [...]    # validate_mcu.py
+  python3 base/scripts/mcu.py links PATH [...]       # check_links.py
+  python3 base/scripts/mcu.py generate TYPE NAME     # generate_mcu.py
+  python3 base/scripts/mcu.py convert MODE --path P  # backlog-item/blit_convert.py
+  python3 base/scripts/mcu.py report [...]           # backlog_report.py
+  python3 base/scripts/mcu.py kanban [--all]         # backlog_kanban.py
+
+Only the module a command needs is imported, after the command is known,
+so a pre-commit hook running `mcu.py validate` pays for validate_mcu.py and
+nothing else. Script commands take exactly the arguments of their script
+(`mcu.py validate --help`).
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import mcu_profile
+
+
+def cmd_index(args: argparse.Namespace) -> int:
+    from mcu_index import MCUIndex
+
+    root = Path(args.root)
+    if not root.exists():
+        print(f"Directory not found: {root}")
+        return 1
+    db_path = Path(args.db) if args.db else None
+    if args.rebuild:
+        from mcu_index import default_index_path
+        target = db_path or default_index_path()
+        for suffix in ('', '-wal', '-shm'):
+            Path(str(target) + suffix).unlink(missing_ok=True)
+    started = time.perf_counter()
+    with MCUIndex(db_path) as index, mcu_profile.active().phase('index'):
+        stats = index.refresh(root)
+        print(f"Indexed {stats} in {time.perf_counter() - started:.3f}s -> {index.db_path}")
+    return 0
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    from mcu_search import SearchIndex, resolve_section
+
+    root = Path(args.root)
+    if not root.exists():
+        print(f"Directory not found: {root}")
+        return 1
+    try:
+        section = resolve_section(args.section)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    with SearchIndex(Path(args.db) if args.db else None) as index:
+        refresh_started = time.perf_counter()
+        with mcu_profile.active().phase('index'):
+            stats = index.refresh(root) if args.refresh or not index.has_documents(root) else None
+        refresh_ms = (time.perf_counter() - refresh_started) * 1000
+        started = time.perf_counter()
+        with mcu_profile.active().phase('query'):
+            hits = index.search(' '.join(args.query), section=section, mcu_type=args.type,
+                                category=args.category, tags=args.tag, limit=args.limit)
+        query_ms = (time.perf_counter() - started) * 1000
+
+    if args.format == 'json':
+        print(json.dumps([hit.to_dict() for hit in hits], indent=2))
+        return 0 if hits else 1
+    for rank, hit in enumerate(hits, 1):
+        rel = os.path.relpath(hit.path)
+        print(f"{rank:3d}. {hit.score:7.3f}  {rel}  [{hit.section}]  {hit.title}")
+    refreshed = f"; refresh {stats} in {refresh_ms:.1f} ms" if stats else ''
+    print(f"{len(hits)} result(s) in {query_ms:.1f} ms{refreshed}")
+    return 0 if hits else 1
+
+
+def cmd_graph(args: argparse.Namespace) -> int:
+    from mcu_graph import DEFAULT_ROOTS, build_graph
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"Directory not found: {root}")
+        return 1
+    started = time.perf_counter()
+    with mcu_profile.active().phase('build'):
+        if args.index is not None:
+            from mcu_index import open_index
+            with open_index(args.index) as index:
+                graph = build_graph(root, index)
+        else:
+            graph = build_graph(root)
+    elapsed = time.perf_counter() - started
+
+    entry_points = args.entry or [p for p in DEFAULT_ROOTS if graph.node_id(p) is not None]
+    roots = []
+    for path in entry_points:
+        node = graph.node_id(path)
+        if node is None:
+            print(f"❌ Entry point not in graph: {path}")
+            return 1
+        roots.append(node)
+
+    orphans = graph.orphans(roots)
+    cycles = graph.cycles()
+    print(f"Graph: {len(graph.nodes)} node(s), {graph.edge_count} edge(s) in {elapsed:.3f}s; "
+          f"{len(orphans)} orphan(s) from {', '.join(entry_points) or 'no entry points'}, {len(cycles)} cycle(s)")
+    if args.orphans:
+        print("\nOrphans:")
+        for path in orphans:
+            print(f"  {path}")
+    if args.cycles:
+        print("\nCycles:")
+        for component in cycles:
+            print(f"  {' <-> '.join(component)}")
+    if args.top:
+        print("\nMost referenced:")
+        for path, degree in graph.most_referenced(args.top):
+            print(f"  {degree:4d}  {path}")
+    if args.cites:
+        print(f"\nCiting {args.cites}:")
+        for source, fragments in graph.citations(args.cites):
+            print(f"  {source}" + (f"  #{', #'.join(fragments)}" if fragments else ''))
+    if args.dot:
+        Path(args.dot).write_text(graph.to_dot(roots), encoding='utf-8')
+        print(f"✅ Wrote {args.dot}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(graph.to_json(roots), indent=2), encoding='utf-8')
+        print(f"✅ Wrote {args.json}")
+    return 0
+
+
+# command -> (module, help); the module's main(argv) handles the arguments
+SCRIPT_COMMANDS = {
+    'validate': ('validate_mcu', 'Validate MCU files against the specification (validate_mcu.py)'),
+    'links': ('check_links', 'Check links in MCU documentation files (check_links.py)'),
+    'generate': ('generate_mcu', 'Generate MCU files from templates (generate_mcu.py)'),
+    'convert': ('blit_convert', 'Convert BLIT Markdown <-> JSON (backlog-item/blit_convert.py)'),
+    'report': ('backlog_report', 'Backlog workstream and tracks reports (backlog_report.py)'),
+    'kanban': ('backlog_kanban', 'Kanban lanes for one item or the whole backlog (backlog_kanban.py)'),
+}
+BLIT_DIR = Path(__file__).resolve().parents[2] / 'backlog-item'
+
+
+def run_script(command: str, argv: List[str]) -> int:
+    """Import the module behind a script command and run its main() on argv."""
+    module_name = SCRIPT_COMMANDS[command][0]
+    if module_name == 'blit_convert' and str(BLIT_DIR) not in sys.path:
+        sys.path.insert(0, str(BLIT_DIR))
+    module = importlib.import_module(module_name)
+    # The scripts' parsers take their usage name from sys.argv[0]
+    sys.argv[0] = f"{os.path.basename(sys.argv[0])} {command}"
+    if module_name == 'backlog_kanban':
+        argv = [sys.argv[0]] + argv
+    return module.main(argv) or 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='mcu', description='MCU corpus tools.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_index = sub.add_parser('index', help='Build or incrementally update the SQLite corpus index')
+    p_index.add_argument('root', nargs='?', default='.', help='Corpus root to index (default: .)')
+    p_index.add_argument('--db', default=None, help='Index database (default: .mcu_cache/index.sqlite)')
+    p_index.add_argument('--rebuild', action='store_true', help='Discard the existing index first')
+    mcu_profile.add_arguments(p_index)
+    p_index.set_defaults(func=cmd_index)
+
+    p_search = sub.add_parser('search', help='BM25 full-text search over the corpus')
+    p_search.add_argument('query', nargs='+', help='Search terms')
+    p_search.add_argument('--root', default='.', help='Corpus root (default: .)')
+    p_search.add_argument('--db', default=None, help='Search index (default: .mcu_cache/search.sqlite)')
+    p_search.add_argument('--section', default=None,
+                          help='Only match in one section: title, summary, quick, detailed or other')
+    p_search.add_argument('--type', default=None, help='Filter by metadata Type')
+    p_search.add_argument('--category', default=None, help='Filter by metadata Category')
+    p_search.add_argument('--tag', action='append', default=[], help='Filter by metadata tag (repeatable)')
+    p_search.add_argument('--limit', type=int, default=10, help='Maximum results (default: 10)')
+    p_search.add_argument('--format', choices=['text', 'json'], default='text', help='Output format')
+    p_search.add_argument('--refresh', action='store_true',
+                          help='Update the index for changed files before querying (always done on first use)')
+    mcu_profile.add_arguments(p_search)
+    p_search.set_defaults(func=cmd_search)
+
+    p_graph = sub.add_parser('graph', help='Link graph: reachability, orphans, cycles, in-degree, DOT/JSON export')
+    p_graph.add_argument('root', nargs='?', default='.', help='Corpus root (default: .)')
+    p_graph.add_argument('--entry', action='append', default=[],
+                         help='Entry point for reachability, relative to root (repeatable; '
+                              'default: README.md and BACKLOGS/BACKLOG_MAIN.md)')
+    p_graph.add_argument('--orphans', action='store_true', help='List documents unreachable from the entry points')
+    p_graph.add_argument('--cycles', action='store_true', help='List groups of files that link in a cycle')
+    p_graph.add_argument('--top', type=int, default=0, help='List the N most referenced files')
+    p_graph.add_argument('--cites', default=None, help='List files linking to this file (with #fragments)')
+    p_graph.add_argument('--dot', default=None, help='Write the graph as Graphviz DOT')
+    p_graph.add_argument('--json', default=None, help='Write the graph as JSON')
+    p_graph.add_argument('--index', nargs='?', const='', default=None, metavar='DB',
+                         help='Read links from the corpus index (default DB: .mcu_cache/index.sqlite)')
+    mcu_profile.add_arguments(p_graph)
+    p_graph.set_defaults(func=cmd_graph)
+
+    # Listed for --help only; main() hands these to run_script() before parsing
+    for command, (_, help_text) in SCRIPT_COMMANDS.items():
+        sub.add_parser(command, help=help_text, add_help=False)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SCRIPT_COMMANDS:
+        return run_script(argv[0], argv[1:])
+    args = build_parser().parse_args(argv)
+    with mcu_profile.session(args):
+        return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
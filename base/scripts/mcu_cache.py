@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+MCU Cache Helpers
+
+Shared helpers for the persistent on-disk caches used by the MCU scripts.
+Caches live under `.mcu_cache/` (relative to the working directory) unless
+the `MCU_CACHE_DIR` environment variable points elsewhere. Cache files are
+plain JSON and are always replaced atomically, so an interrupted run never
+leaves a half-written cache behind.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_CACHE_DIR = '.mcu_cache'
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory (MCU_CACHE_DIR or ./.mcu_cache)."""
+    return Path(os.environ.get('MCU_CACHE_DIR') or DEFAULT_CACHE_DIR)
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    """Hash a file's contents without loading it all at once."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_fingerprint(*sources: str) -> str:
+    """Short hash of the given source files; changes whenever any of them is edited."""
+    digest = hashlib.sha256()
+    for source in sources:
+        with open(source, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def load_json(path: Path, default: Any = None) -> Any:
+    """Load a JSON cache file, returning default if missing or corrupt."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = 'utf-8') -> None:
+    """Write text to path via a temp file in the same directory + rename."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: Path, obj: Any, indent: Optional[int] = None) -> None:
+    atomic_write_text(path, json.dumps(obj, indent=indent, sort_keys=True))
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+MCU Command Line Helpers
+
+argparse option types shared by the MCU scripts, so the same option is
+validated (and reported) the same way everywhere:
+
+  parser.add_argument('--jobs', '-j', type=jobs_arg, default=1)
+"""
+
+import argparse
+import os
+
+
+def jobs_arg(value: str) -> int:
+    """argparse type for --jobs: a worker count >= 0, where 0 means one per CPU."""
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("--jobs must be >= 0")
+    return jobs or (os.cpu_count() or 1)
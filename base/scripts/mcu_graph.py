@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+MCU Link Graph
+
+Global view of the links between corpus files, complementing check_links.py
+(which checks each link in isolation): reachability from entry points such
+as README.md and BACKLOGS/BACKLOG_MAIN.md, orphaned documents, link cycles,
+in-degree (most referenced files) and who cites a given file, e.g. which
+BLITs cite which VIBE_NOTE entries.
+
+Files are numbered with integer node IDs in path order and the deduplicated
+edges are stored in compressed sparse row form: an `array('I')` of per-node
+offsets into an `array('I')` of targets, for both directions. Edges are
+deduplicated with a hash set and ordered by (source, target) with two stable
+counting sorts (by target, then by source), so building the arrays is linear
+and every query is a linear walk over them: time and memory grow linearly
+with the number of links.
+
+Only local links are edges: external URLs and same-file `#anchor` links are
+ignored, as are links whose target does not exist (check_links.py reports
+those). `file.md#anchor` fragments are kept per edge for citations().
+
+Usage:
+  python3 base/scripts/mcu.py graph [root] [--orphans] [--cycles] [--top 10]
+  python3 base/scripts/mcu.py graph --cites VIBE_NOTE.md
+  python3 base/scripts/mcu.py graph --dot links.dot --json links.json
+"""
+
+import json
+import os
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+from mcu_parser import parse_file
+
+DEFAULT_ROOTS = ['README.md', 'BACKLOGS/BACKLOG_MAIN.md']
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'ftp://')
+
+
+def _csr(count: int, sources: array, targets: array) -> Tuple[array, array]:
+    """Group edges by source with a stable counting sort: (offsets[count + 1], targets).
+
+    Targets keep their input order within each source.
+    """
+    offsets = array('I', bytes(4 * (count + 1)))
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(count):
+        offsets[i + 1] += offsets[i]
+    fill = array('I', offsets)
+    out = array('I', bytes(4 * len(targets)))
+    for s, t in zip(sources, targets):
+        out[fill[s]] = t
+        fill[s] += 1
+    return offsets, out
+
+
+def _owners(offsets: array) -> array:
+    """The node each CSR slot belongs to, i.e. the grouped-by key of every edge."""
+    owners = array('I')
+    for node in range(len(offsets) - 1):
+        owners.extend(array('I', [node]) * (offsets[node + 1] - offsets[node]))
+    return owners
+
+
+class LinkGraph:
+    """Directed, deduplicated link graph over integer node IDs."""
+
+    def __init__(self, root: Path, nodes: Sequence[str], edges: Iterable[Tuple[int, int]],
+                 fragments: Optional[Dict[Tuple[int, int], List[str]]] = None, documents: Iterable[int] = ()):
+        self.root = Path(root)
+        self.nodes: List[str] = list(nodes)
+        self.ids: Dict[str, int] = {path: i for i, path in enumerate(self.nodes)}
+        # Nodes that are scanned documents (other nodes are only link targets)
+        self.documents = bytearray(len(self.nodes))
+        for i in documents:
+            self.documents[i] = 1
+        self.fragments = fragments or {}
+        count = len(self.nodes)
+        unique = dict.fromkeys(edges)
+        sources = array('I', (s for s, _ in unique))
+        targets = array('I', (t for _, t in unique))
+        # LSD radix sort: group by target, then (stably) by source, so every
+        # successor list is ascending; regrouping that by target does the same
+        # for predecessor lists
+        by_target_offsets, by_target_sources = _csr(count, targets, sources)
+        self.offsets, self.targets = _csr(count, by_target_sources, _owners(by_target_offsets))
+        self.in_offsets, self.in_sources = _csr(count, self.targets, _owners(self.offsets))
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def predecessors(self, node: int) -> array:
+        return self.in_sources[self.in_offsets[node]:self.in_offsets[node + 1]]
+
+    def node_id(self, path: str) -> Optional[int]:
+        return self.ids.get(Path(path).as_posix())
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def reachable(self, roots: Iterable[int]) -> bytearray:
+        """Mark every node reachable from roots (roots included)."""
+        seen = bytearray(len(self.nodes))
+        stack = [r for r in roots]
+        for r in stack:
+            seen[r] = 1
+        offsets, targets = self.offsets, self.targets
+        while stack:
+            node = stack.pop()
+            for t in targets[offsets[node]:offsets[node + 1]]:
+                if not seen[t]:
+                    seen[t] = 1
+                    stack.append(t)
+        return seen
+
+    def orphans(self, roots: Iterable[int]) -> List[str]:
+        """Markdown documents not reachable from roots."""
+        seen = self.reachable(roots)
+        return [path for i, path in enumerate(self.nodes)
+                if not seen[i] and self.documents[i] and path.endswith('.md')]
+
+    def in_degree(self) -> array:
+        """Number of distinct files linking to each node."""
+        offsets = self.in_offsets
+        return array('I', (offsets[i + 1] - offsets[i] for i in range(len(self.nodes))))
+
+    def most_referenced(self, limit: int = 10) -> List[Tuple[str, int]]:
+        degree = self.in_degree()
+        ranked = sorted(range(len(self.nodes)), key=lambda i: (-degree[i], self.nodes[i]))
+        return [(self.nodes[i], degree[i]) for i in ranked[:limit] if degree[i]]
+
+    def cycles(self) -> List[List[str]]:
+        """Strongly connected components that contain a cycle (iterative Tarjan)."""
+        count = len(self.nodes)
+        offsets, targets = self.offsets, self.targets
+        index = array('i', [-1]) * count
+        low = array('i', [0]) * count
+        on_stack = bytearray(count)
+        stack: List[int] = []
+        components: List[List[str]] = []
+        counter = 0
+        for start in range(count):
+            if index[start] != -1:
+                continue
+            work = [(start, offsets[start])]
+            index[start] = low[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack[start] = 1
+            while work:
+                node, pos = work[-1]
+                if pos < offsets[node + 1]:
+                    work[-1] = (node, pos + 1)
+                    t = targets[pos]
+                    if index[t] == -1:
+                        index[t] = low[t] = counter
+                        counter += 1
+                        stack.append(t)
+                        on_stack[t] = 1
+                        work.append((t, offsets[t]))
+                    elif on_stack[t]:
+                        low[node] = min(low[node], index[t])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        m = stack.pop()
+                        on_stack[m] = 0
+                        members.append(m)
+                        if m == node:
+                            break
+                    if len(members) > 1 or node in self.successors(node):
+                        components.append(sorted(self.nodes[m] for m in members))
+        return sorted(components)
+
+    def citations(self, target: str) -> List[Tuple[str, List[str]]]:
+        """Files linking to target, with the `#fragments` they cite."""
+        node = self.node_id(target)
+        if node is None:
+            return []
+        return [(self.nodes[s], self.fragments.get((s, node), [])) for s in self.predecessors(node)]
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def to_json(self, roots: Iterable[int] = ()) -> Dict:
+        roots = list(roots)
+        degree = self.in_degree()
+        seen = self.reachable(roots) if roots else None
+        nodes = []
+        for i, path in enumerate(self.nodes):
+            node = {'id': i, 'path': path, 'in_degree': degree[i], 'document': bool(self.documents[i])}
+            if seen is not None:
+                node['reachable'] = bool(seen[i])
+            nodes.append(node)
+        edges = [[s, t] for s in range(len(self.nodes)) for t in self.successors(s)]
+        return {'root': self.root.as_posix(), 'nodes': nodes, 'edges': edges}
+
+    def to_dot(self, roots: Iterable[int] = ()) -> str:
+        roots = list(roots)
+        orphaned = set(self.orphans(roots)) if roots else set()
+        lines = ['digraph mcu_links {', '  rankdir=LR;', '  node [shape=box, fontsize=10];']
+        for i, path in enumerate(self.nodes):
+            style = ''
+            if i in roots:
+                style = ', style=filled, fillcolor="#c6f6d5"'
+            elif path in orphaned:
+                style = ', style=filled, fillcolor="#fed7d7"'
+            lines.append(f'  n{i} [label={json.dumps(path)}{style}];')
+        for s in range(len(self.nodes)):
+            for t in self.successors(s):
+                lines.append(f'  n{s} -> n{t};')
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+
+def resolve_link(root: Path, source: str, url: str) -> Optional[Tuple[str, str]]:
+    """(target path relative to root, fragment) for a local link, or None."""
+    url = url.strip()
+    if not url or url.startswith('#') or url.lower().startswith(EXTERNAL_PREFIXES):
+        return None
+    target, _, fragment = url.partition('#')
+    target = unquote(target.split('?', 1)[0])
+    full = os.path.normpath(os.path.join(root, os.path.dirname(source), target))
+    rel = os.path.relpath(full, root)
+    if rel.startswith('..') or not os.path.exists(full):
+        return None
+    return Path(rel).as_posix(), unquote(fragment)
+
+
+def _iter_documents(root: Path, index=None) -> Iterable[Tuple[str, List[str]]]:
+    """(path relative to root, link URLs) for every Markdown file under root."""
+    if index is not None:
+        index.refresh(root)
+        for doc in index.documents(root):
+            rel = Path(os.path.relpath(doc.path, root)).as_posix()
+            if not any(part.startswith('.') for part in Path(rel).parts[:-1]):
+                yield rel, [link.url for link in doc.links]
+        return
+    for dirpath, dirnames, files in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(files):
+            if name.endswith('.md'):
+                path = Path(dirpath) / name
+                yield Path(os.path.relpath(path, root)).as_posix(), [link.url for link in parse_file(path).links]
+
+
+def build_graph(root: Path, index=None) -> LinkGraph:
+    """Scan (or read from the corpus index) every Markdown file under root and link its targets."""
+    root = Path(root).resolve()
+    docs = list(_iter_documents(root, index))
+    ids: Dict[str, int] = {}
+    names: List[str] = []
+    raw_edges: List[Tuple[str, str, str]] = []
+    for path, urls in docs:
+        for url in urls:
+            resolved = resolve_link(root, path, url)
+            if resolved is not None and resolved[0] != path:
+                raw_edges.append((path, resolved[0], resolved[1]))
+    for path in sorted({p for p, _ in docs} | {t for _, t, _ in raw_edges}):
+        ids[path] = len(names)
+        names.append(path)
+    edges = []
+    fragments: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+    seen_fragments = set()
+    for source, target, fragment in raw_edges:
+        edge = (ids[source], ids[target])
+        edges.append(edge)
+        if fragment and (edge, fragment) not in seen_fragments:
+            seen_fragments.add((edge, fragment))
+            fragments[edge].append(fragment)
+    return LinkGraph(root, names, edges, dict(fragments), (ids[p] for p, _ in docs))
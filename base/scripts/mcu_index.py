@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+MCU Corpus Index
+
+Persistent SQLite index of every Markdown document in the corpus: metadata
+fields, section offsets, tracks, source references and links, as produced by
+mcu_parser. The index is refreshed incrementally: files are matched on
+mtime/size (and content hash when the mtime moved), only changed files are
+re-parsed, and rows for deleted files are removed. The index records a
+fingerprint of mcu_parser.py and this module (index_version()); when either
+changes, the whole index is rebuilt on open so no stale rows survive.
+
+Reporting scripts (backlog_report.py, backlog_kanban.py, check_links.py)
+accept `--index` to answer their queries from the index instead of parsing
+every file. Build or update the index with:
+
+  python3 base/scripts/mcu.py index [root] [--db PATH]
+"""
+
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import mcu_parser
+from mcu_cache import default_cache_dir, sha256_bytes, source_fingerprint
+from mcu_parser import Link, MCUDocument, Section, decode_text
+
+INDEX_FILE_NAME = 'index.sqlite'
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    dir TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    title TEXT NOT NULL,
+    context_unit_id TEXT
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+CREATE TABLE IF NOT EXISTS metadata (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    block INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metadata_file ON metadata(file_id);
+CREATE INDEX IF NOT EXISTS metadata_key ON metadata(key, value);
+CREATE TABLE IF NOT EXISTS sections (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    ord INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_file ON sections(file_id);
+CREATE TABLE IF NOT EXISTS tracks (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tracks_file ON tracks(file_id);
+CREATE INDEX IF NOT EXISTS tracks_state ON tracks(name, value);
+CREATE TABLE IF NOT EXISTS source_refs (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    ord INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    href TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS source_refs_file ON source_refs(file_id);
+CREATE TABLE IF NOT EXISTS links (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    ord INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    url TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_file ON links(file_id);
+"""
+
+
+def index_version() -> str:
+    """Fingerprint of the parser and indexing code; any edit to them invalidates the index."""
+    return source_fingerprint(__file__, mcu_parser.__file__)
+
+
+def default_index_path() -> Path:
+    return default_cache_dir() / INDEX_FILE_NAME
+
+
+class IndexedDocument:
+    """Read-only view of an indexed document.
+
+    Exposes the same attributes as mcu_parser.MCUDocument, so consumers can
+    take either. Everything but `text`, `lines` and section_lines() comes
+    from the index; those three read the file on first use, decoded exactly
+    as mcu_parser.parse_file() does.
+    """
+
+    def __init__(self, path: Path, title: str, context_unit_id: Optional[str]):
+        self.path = path
+        self._text: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self.title = title
+        self.context_unit_id = context_unit_id
+        self.metadata: Dict[str, str] = {}
+        self.fields: Dict[str, str] = {}
+        self.sections: List[Section] = []
+        self.tracks: Dict[str, str] = {}
+        self.workstreams: Dict[str, str] = {}
+        self.source_references: List[Dict[str, str]] = []
+        self.links: List[Link] = []
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = decode_text(self.path.read_bytes())
+        return self._text
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.text.splitlines()
+        return self._lines
+
+    def section(self, name: str) -> Optional[Section]:
+        for sec in self.sections:
+            if sec.matches(name):
+                return sec
+        return None
+
+    def has_section(self, name: str) -> bool:
+        return self.section(name) is not None
+
+    def section_lines(self, name: str) -> List[str]:
+        sec = self.section(name)
+        if sec is None:
+            return []
+        return self.lines[sec.body_start:sec.end]
+
+    def section_map(self) -> Dict[str, Tuple[int, int]]:
+        result: Dict[str, Tuple[int, int]] = {}
+        for sec in self.sections:
+            result.setdefault(sec.heading, (sec.start, sec.end))
+        return result
+
+
+class RefreshStats:
+    """Counts from one incremental refresh."""
+
+    def __init__(self):
+        self.added = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    @property
+    def total(self) -> int:
+        return self.added + self.updated + self.unchanged
+
+    def __str__(self) -> str:
+        return (f"{self.total} file(s): {self.added} added, {self.updated} updated, "
+                f"{self.unchanged} unchanged, {self.removed} removed")
+
+
+class MCUIndex:
+    """SQLite-backed index of parsed MCU documents."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._drop_all()
+        self.conn.executescript(SCHEMA)
+        current = index_version()
+        stored = self.conn.execute("SELECT value FROM info WHERE key = 'version'").fetchone()
+        if stored is None or stored[0] != current:
+            # Rows were produced by another parser: rebuild from scratch
+            self._drop_all()
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("INSERT INTO info (key, value) VALUES ('version', ?)", (current,))
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'MCUIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _drop_all(self) -> None:
+        for table in ('links', 'source_refs', 'tracks', 'sections', 'metadata', 'files', 'info'):
+            self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return Path(os.path.abspath(path)).as_posix()
+
+    # ------------------------------------------------------------------
+    # Incremental refresh
+    # ------------------------------------------------------------------
+    def refresh(self, root: Path, pattern: str = '*.md', recursive: bool = True) -> RefreshStats:
+        """Bring the index up to date for markdown files under root.
+
+        Only files whose mtime/size and content hash changed are re-parsed;
+        rows for files that disappeared from root are deleted. Hidden
+        directories (`.git`, `.mcu_cache`, ...) are not walked.
+        """
+        root = Path(root)
+        if root.is_file():
+            paths = [root]
+        elif recursive:
+            paths = []
+            for dirpath, dirnames, files in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+                for name in files:
+                    if Path(name).match(pattern):
+                        paths.append(Path(dirpath) / name)
+        else:
+            paths = [p for p in root.glob(pattern) if p.is_file()]
+
+        stats = RefreshStats()
+        seen = set()
+        with self.conn:
+            for path in paths:
+                key = self._key(path)
+                seen.add(key)
+                self._refresh_file(path, key, stats)
+            stats.removed += self._remove_missing(root, recursive, seen)
+        return stats
+
+    def _refresh_file(self, path: Path, key: str, stats: RefreshStats) -> None:
+        try:
+            st = path.stat()
+        except OSError:
+            return
+        row = self.conn.execute(
+            'SELECT id, mtime_ns, size, sha256 FROM files WHERE path = ?', (key,)).fetchone()
+        if row is not None and row[1] == st.st_mtime_ns and row[2] == st.st_size:
+            stats.unchanged += 1
+            return
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return
+        digest = sha256_bytes(data)
+        if row is not None and row[3] == digest:
+            self.conn.execute('UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?',
+                              (st.st_mtime_ns, st.st_size, row[0]))
+            stats.unchanged += 1
+            return
+        try:
+            doc = MCUDocument(decode_text(data), path)
+        except UnicodeDecodeError as e:
+            # parse_file() cannot read it either: do not index a different view of it
+            print(f"⚠️  Not indexing {path}: {e}", file=sys.stderr)
+            if row is not None:
+                self.conn.execute('DELETE FROM files WHERE id = ?', (row[0],))
+                stats.removed += 1
+            return
+        if row is not None:
+            self.conn.execute('DELETE FROM files WHERE id = ?', (row[0],))
+            stats.updated += 1
+        else:
+            stats.added += 1
+        self._insert(doc, key, st.st_mtime_ns, st.st_size, digest)
+
+    def _insert(self, doc: MCUDocument, key: str, mtime_ns: int, size: int, digest: str) -> None:
+        cur = self.conn.execute(
+            'INSERT INTO files (path, dir, mtime_ns, size, sha256, title, context_unit_id) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (key, key.rsplit('/', 1)[0], mtime_ns, size, digest, doc.title, doc.context_unit_id))
+        file_id = cur.lastrowid
+        self.conn.executemany(
+            'INSERT INTO metadata (file_id, block, key, value) VALUES (?, ?, ?, ?)',
+            [(file_id, 1, k, v) for k, v in doc.metadata.items()] +
+            [(file_id, 0, k, v) for k, v in doc.fields.items()])
+        self.conn.executemany(
+            'INSERT INTO sections (file_id, ord, heading, start_line, end_line) VALUES (?, ?, ?, ?, ?)',
+            [(file_id, i, s.heading, s.start, s.end) for i, s in enumerate(doc.sections)])
+        self.conn.executemany(
+            'INSERT INTO tracks (file_id, kind, name, value) VALUES (?, ?, ?, ?)',
+            [(file_id, 'track', k, v) for k, v in doc.tracks.items()] +
+            [(file_id, 'workstream', k, v) for k, v in doc.workstreams.items()])
+        self.conn.executemany(
+            'INSERT INTO source_refs (file_id, ord, text, href) VALUES (?, ?, ?, ?)',
+            [(file_id, i, r['text'], r['href']) for i, r in enumerate(doc.source_references)])
+        self.conn.executemany(
+            'INSERT INTO links (file_id, ord, text, url, line) VALUES (?, ?, ?, ?, ?)',
+            [(file_id, i, lk.text, lk.url, lk.line) for i, lk in enumerate(doc.links)])
+
+    def _remove_missing(self, root: Path, recursive: bool, seen: set) -> int:
+        root_key = self._key(root)
+        if Path(root).is_file():
+            return 0
+        if recursive:
+            rows = self.conn.execute(
+                "SELECT id, path FROM files WHERE path LIKE ? ESCAPE '\\'",
+                (like_prefix(root_key) + '%',)).fetchall()
+        else:
+            rows = self.conn.execute('SELECT id, path FROM files WHERE dir = ?', (root_key,)).fetchall()
+        stale = [(file_id,) for file_id, path in rows if path not in seen]
+        self.conn.executemany('DELETE FROM files WHERE id = ?', stale)
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def documents(self, root: Path, recursive: bool = True) -> Iterator[IndexedDocument]:
+        """Yield indexed documents under root, ordered by path."""
+        root_key = self._key(root)
+        if Path(root).is_file():
+            where, params = 'path = ?', (root_key,)
+        elif recursive:
+            where, params = "path LIKE ? ESCAPE '\\'", (like_prefix(root_key) + '%',)
+        else:
+            where, params = 'dir = ?', (root_key,)
+        rows = self.conn.execute(
+            f'SELECT id, path, title, context_unit_id FROM files WHERE {where} ORDER BY path', params).fetchall()
+        if not rows:
+            return
+        docs: Dict[int, IndexedDocument] = {
+            file_id: IndexedDocument(Path(path), title, cuid) for file_id, path, title, cuid in rows}
+        ids = list(docs)
+        for chunk_start in range(0, len(ids), 500):
+            chunk = ids[chunk_start:chunk_start + 500]
+            marks = ','.join('?' * len(chunk))
+            for file_id, block, k, v in self.conn.execute(
+                    f'SELECT file_id, block, key, value FROM metadata WHERE file_id IN ({marks})', chunk):
+                (docs[file_id].metadata if block else docs[file_id].fields)[k] = v
+            for file_id, heading, start, end in self.conn.execute(
+                    f'SELECT file_id, heading, start_line, end_line FROM sections '
+                    f'WHERE file_id IN ({marks}) ORDER BY file_id, ord', chunk):
+                docs[file_id].sections.append(Section(heading, start, end))
+            for file_id, kind, name, value in self.conn.execute(
+                    f'SELECT file_id, kind, name, value FROM tracks WHERE file_id IN ({marks}) ORDER BY rowid', chunk):
+                (docs[file_id].tracks if kind == 'track' else docs[file_id].workstreams)[name] = value
+            for file_id, text, href in self.conn.execute(
+                    f'SELECT file_id, text, href FROM source_refs WHERE file_id IN ({marks}) ORDER BY file_id, ord',
+                    chunk):
+                docs[file_id].source_references.append({'text': text, 'href': href})
+            for file_id, text, url, line in self.conn.execute(
+                    f'SELECT file_id, text, url, line FROM links WHERE file_id IN ({marks}) ORDER BY file_id, ord',
+                    chunk):
+                docs[file_id].links.append(Link(text, url, line))
+        for file_id, _, _, _ in rows:
+            yield docs[file_id]
+
+    def document(self, path: Path) -> Optional[IndexedDocument]:
+        return next(self.documents(path), None)
+
+    def context_ids(self, root: Path) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+        """Yield (context_unit_id, metadata Type) for every indexed document under root."""
+        root_key = self._key(root)
+        yield from self.conn.execute(
+            "SELECT f.context_unit_id, m.value FROM files f "
+            "LEFT JOIN metadata m ON m.file_id = f.id AND m.block = 1 AND m.key = 'Type' "
+            "WHERE f.path LIKE ? ESCAPE '\\'", (like_prefix(root_key) + '%',))
+
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+
+def like_prefix(root_key: str) -> str:
+    """LIKE pattern prefix (ESCAPE '\\') matching every indexed path under root_key."""
+    escaped = root_key.rstrip('/').replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + '/'
+
+
+def open_index(db_path: Optional[str]) -> MCUIndex:
+    """Open the index for a script's `--index [PATH]` option."""
+    return MCUIndex(Path(db_path) if db_path else None)
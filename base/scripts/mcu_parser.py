@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+MCU Document Parser
+
+Single-pass tokenizer shared by the MCU scripts. A document is scanned once,
+line by line, into:
+
+- a section map (H2 heading -> line range); only `## ` at column 0 outside
+  fenced code blocks starts a section,
+- the title (first H1) and `## Context Memory Unit:` id,
+- the metadata block that follows the Context Memory Unit heading,
+- every `- **Key**: value` field in the document (the validator's view),
+- `key: value` bullets of the `## Tracks` and `## Workstreams` sections,
+- `[text](url)` links with their line numbers, and the leading links of
+  `## Source References`.
+
+Consumers (validate_mcu.py, blit_convert.py, backlog_report.py,
+backlog_kanban.py) query the parsed document instead of re-splitting and
+re-scanning the Markdown themselves.
+"""
+
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from mcu_profile import active as active_timings
+
+CMU_HEADING = '## Context Memory Unit:'
+
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+SOURCE_REF_RE = re.compile(r'^- \[([^\]]+)\]\(([^\)]+)\)')
+TRACK_LINE_RE = re.compile(r'^-\s*([a-z_]+):\s*(.*)$')
+META_LINE_RE = re.compile(r'^- \*\*(.+?)\*\*:\s*(.*)$')
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+# A trailing qualifier such as `(optional)` or `(≥1)` is not part of a section's name
+SECTION_QUALIFIER_RE = re.compile(r'\s*\([^()]*\)$')
+
+# Sections whose `- key: value` bullets are collected into dicts
+_KEYED_SECTIONS = {'Tracks': 'tracks', 'Workstreams': 'workstreams'}
+
+
+class Section:
+    """An H2 section: heading text (without `## `) and its line range.
+
+    `start` is the heading line; `end` is exclusive (next H2 or EOF).
+    `name` is the heading without a trailing parenthesised qualifier, so
+    `## Tracks (authoritative on item)` is the `Tracks` section.
+    """
+
+    __slots__ = ('heading', 'name', 'start', 'end')
+
+    def __init__(self, heading: str, start: int, end: int):
+        self.heading = heading
+        self.name = SECTION_QUALIFIER_RE.sub('', heading)
+        self.start = start
+        self.end = end
+
+    def matches(self, name: str) -> bool:
+        """Whether this is the section called name (exact, with or without its qualifier)."""
+        return self.name == name or self.heading == name
+
+    @property
+    def body_start(self) -> int:
+        return self.start + 1
+
+    def __repr__(self) -> str:
+        return f"Section({self.heading!r}, {self.start}, {self.end})"
+
+
+class Link:
+    """A Markdown `[text](url)` link and the 0-based line it appears on."""
+
+    __slots__ = ('text', 'url', 'line')
+
+    def __init__(self, text: str, url: str, line: int):
+        self.text = text
+        self.url = url
+        self.line = line
+
+    def __iter__(self):
+        return iter((self.text, self.url))
+
+    def __repr__(self) -> str:
+        return f"Link({self.text!r}, {self.url!r}, line={self.line})"
+
+
+class MCUDocument:
+    """Result of parsing one Markdown document in a single pass."""
+
+    def __init__(self, text: str, path: Optional[Path] = None):
+        self.text = text
+        self.path = path
+        self.lines: List[str] = text.splitlines()
+        self.title = ''
+        self.context_unit_id: Optional[str] = None
+        self.metadata: Dict[str, str] = {}
+        self.fields: Dict[str, str] = {}
+        self.sections: List[Section] = []
+        self.tracks: Dict[str, str] = {}
+        self.workstreams: Dict[str, str] = {}
+        self.source_references: List[Dict[str, str]] = []
+        self.links: List[Link] = []
+        self._parse()
+
+    def _parse(self) -> None:
+        lines = self.lines
+        current: Optional[Section] = None
+        keyed: Optional[Dict[str, str]] = None
+        seen_names = set()
+        in_metadata = False
+        in_source_refs = False
+        title_found = False
+        fence: Optional[str] = None
+        for idx, line in enumerate(lines):
+            stripped = line.strip()
+
+            fence_match = FENCE_RE.match(line)
+            if fence_match:
+                marker = fence_match.group(1)
+                if fence is None:
+                    fence = marker[0] * 3
+                elif marker.startswith(fence):
+                    fence = None
+
+            if fence is None and line.startswith('## '):
+                if current is not None:
+                    current.end = idx
+                current = Section(line[3:].strip(), idx, len(lines))
+                self.sections.append(current)
+                # Only the first Tracks/Workstreams/Source References section counts
+                keyed = None
+                in_source_refs = False
+                attr = _KEYED_SECTIONS.get(current.name)
+                if attr is not None and current.name not in seen_names:
+                    seen_names.add(current.name)
+                    keyed = getattr(self, attr)
+                if current.name == 'Source References' and 'Source References' not in seen_names:
+                    seen_names.add('Source References')
+                    in_source_refs = True
+                in_metadata = False
+                if line.startswith(CMU_HEADING) and self.context_unit_id is None:
+                    self.context_unit_id = line[len(CMU_HEADING):].strip()
+                    in_metadata = True
+            else:
+                if not title_found and fence is None and line.startswith('# '):
+                    self.title = line[2:].strip()
+                    title_found = True
+
+                if line.startswith('- **'):
+                    if '**:' in line:
+                        key, value = line.split('**:', 1)
+                        self.fields[key.replace('- **', '').strip()] = value.strip()
+                    if in_metadata:
+                        m = META_LINE_RE.match(line)
+                        if m:
+                            self.metadata[m.group(1)] = m.group(2)
+                elif stripped or self.metadata:
+                    # Blank lines between the heading and the first entry do not end the block
+                    in_metadata = False
+
+                if keyed is not None:
+                    m = TRACK_LINE_RE.match(stripped)
+                    if m:
+                        keyed[m.group(1)] = m.group(2)
+
+                if in_source_refs:
+                    m = SOURCE_REF_RE.match(line.rstrip())
+                    if m:
+                        self.source_references.append({'text': m.group(1), 'href': m.group(2)})
+                    else:
+                        in_source_refs = False
+
+            if '](' in line:
+                for m in LINK_RE.finditer(line):
+                    self.links.append(Link(m.group(1), m.group(2), idx))
+
+    def section(self, name: str) -> Optional[Section]:
+        """Return the first H2 section called name (see Section.matches)."""
+        for sec in self.sections:
+            if sec.matches(name):
+                return sec
+        return None
+
+    def has_section(self, name: str) -> bool:
+        return self.section(name) is not None
+
+    def section_lines(self, name: str) -> List[str]:
+        """Body lines (heading excluded) of the first section called name."""
+        sec = self.section(name)
+        if sec is None:
+            return []
+        return self.lines[sec.body_start:sec.end]
+
+    def section_map(self) -> Dict[str, Tuple[int, int]]:
+        """Heading -> (start, end) line range; first occurrence wins."""
+        result: Dict[str, Tuple[int, int]] = {}
+        for sec in self.sections:
+            result.setdefault(sec.heading, (sec.start, sec.end))
+        return result
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 date or time such as `Created`; UTC unless it has an offset.
+
+    Raises ValueError for anything fromisoformat() rejects.
+    """
+    value = value.strip()
+    # fromisoformat() only accepts a trailing Z from Python 3.11 on
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def decode_text(data: bytes) -> str:
+    """Decode file bytes exactly as `Path.read_text(encoding='utf-8')` does.
+
+    Strict UTF-8 (UnicodeDecodeError on invalid bytes) with universal newlines.
+    """
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def parse_text(text: str, path: Optional[Path] = None) -> MCUDocument:
+    return MCUDocument(text, path)
+
+
+def parse_file(path: Path) -> MCUDocument:
+    path = Path(path)
+    timings = active_timings()
+    with timings.phase('read', path):
+        text = decode_text(path.read_bytes())
+    with timings.phase('parse', path):
+        return MCUDocument(text, path)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+MCU Profiling Helpers
+
+Shared `--timings` / `--profile` support for the MCU command line scripts.
+
+  --timings [N]    Print time per phase (discovery, read, parse, validation
+                   rules, emission, ...) and the N slowest files (default 10)
+                   to stderr when the command finishes.
+  --profile FILE   Run the command under cProfile and dump the stats to FILE
+                   (inspect with `python -m pstats FILE`).
+
+Instrumented code asks for the active recorder and wraps its work in phases:
+
+    timings = mcu_profile.active()
+    with timings.phase('parse', path):
+        doc = parse_text(text)
+
+Phases nest; each phase is charged only its own (exclusive) time, so the
+table adds up to the measured work. Passing a path also charges the time to
+that file for the slowest-files list.
+
+Unless a session is active, active() returns a shared no-op recorder: its
+phase() hands back one preallocated context manager (no clock reads, no
+allocation) and its wrap(name, fn) returns fn itself, so instrumented code
+keeps a single path whether or not timings are on. cProfile is only
+imported when --profile is given.
+
+Work done in worker processes (e.g. `validate_mcu.py --jobs`) is charged to
+the enclosing phase of the parent as a whole.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+DEFAULT_TOP = 10
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class NullTimings:
+    """Recorder used when timings are off; every call is a no-op."""
+
+    enabled = False
+
+    def phase(self, name: str, path=None) -> _NullPhase:
+        return _NULL_PHASE
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        return fn
+
+
+class Timings:
+    """Accumulates exclusive time per phase and per file."""
+
+    enabled = True
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.files: Dict[str, float] = defaultdict(float)
+        # Time spent in nested phases, one slot per open phase
+        self._children: List[float] = []
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str, path=None) -> Iterator[None]:
+        self._children.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            own = elapsed - self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            self.seconds[name] += own
+            self.calls[name] += 1
+            if path is not None:
+                self.files[os.path.abspath(path)] += own
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """fn, timed as phase name and charged to the file given as its first argument."""
+        def timed(path, *args, **kwargs):
+            with self.phase(name, path):
+                return fn(path, *args, **kwargs)
+        return timed
+
+    def slowest(self, limit: int = DEFAULT_TOP) -> List[tuple]:
+        return sorted(self.files.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def report(self, top: int = DEFAULT_TOP, stream: Optional[TextIO] = None) -> None:
+        stream = stream or sys.stderr
+        wall = time.perf_counter() - self.started
+        measured = sum(self.seconds.values())
+        print(f"\n⏱️  Timings: {wall:.3f}s wall, {measured:.3f}s in phases", file=stream)
+        print(f"  {'phase':<16} {'seconds':>9} {'share':>7} {'calls':>8}", file=stream)
+        rows = sorted(self.seconds.items(), key=lambda item: -item[1])
+        rows.append(('(other)', max(0.0, wall - measured)))
+        for name, seconds in rows:
+            share = seconds / wall * 100 if wall > 0 else 0.0
+            calls = self.calls.get(name, '')
+            print(f"  {name:<16} {seconds:>9.4f} {share:>6.1f}% {calls:>8}", file=stream)
+        if top and self.files:
+            print(f"  Slowest files (top {min(top, len(self.files))} of {len(self.files)}):", file=stream)
+            cwd = os.getcwd()
+            for path, seconds in self.slowest(top):
+                shown = os.path.relpath(path, cwd) if path.startswith(cwd + os.sep) else path
+                print(f"  {seconds * 1000:>10.2f} ms  {shown}", file=stream)
+
+
+NULL_TIMINGS = NullTimings()
+_active = NULL_TIMINGS
+
+
+def active():
+    """The recorder of the current session, or the no-op recorder."""
+    return _active
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --timings [N] and --profile FILE to a command's parser."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--timings', nargs='?', const=DEFAULT_TOP, default=None, type=int, metavar='N',
+                       help=f'Print time per phase and the N slowest files to stderr (default N: {DEFAULT_TOP})')
+    group.add_argument('--profile', default=None, metavar='FILE',
+                       help='Run under cProfile and write the stats to FILE (view with: python -m pstats FILE)')
+
+
+def parse_known(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """Split --timings / --profile off argv for scripts that parse their own arguments."""
+    parser = argparse.ArgumentParser(add_help=False)
+    add_arguments(parser)
+    return parser.parse_known_args(argv)
+
+
+@contextmanager
+def session(args: argparse.Namespace) -> Iterator[None]:
+    """Activate the timings / profiler requested by args for the enclosed block.
+
+    The report and the stats file are written even when the block exits
+    through sys.exit() or an exception.
+    """
+    global _active
+    top = getattr(args, 'timings', None)
+    profile_path = getattr(args, 'profile', None)
+    if top is None and not profile_path:
+        yield
+        return
+    previous = _active
+    timings = Timings() if top is not None else None
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+    if timings is not None:
+        _active = timings
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        _active = previous
+        if timings is not None:
+            timings.report(top)
+        if profiler is not None:
+            print(f"cProfile stats written to {profile_path} (view with: python -m pstats {profile_path})",
+                  file=sys.stderr)
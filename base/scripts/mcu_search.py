@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+MCU Full-Text Search
+
+Persistent inverted index over the Markdown corpus with BM25 ranking, used by
+`mcu.py search`.
+
+Each document is tokenized per section: its title, the three sections
+validate_mcu.py requires (`## Executive Summary`, `## Quick Reference`,
+`## Detailed Reference`) and everything else as `Other` (the Context Memory
+Unit block is metadata, not text). Postings are stored as
+(term, document, section, term frequency) rows in SQLite
+(`.mcu_cache/search.sqlite` by default), keyed by term, so a query reads only
+the postings of its own terms. `Type`, `Category` and `Tags` metadata are kept
+per document for filtering.
+
+Updates are incremental in the same way as mcu_index.py: files are matched on
+mtime/size (then content hash), only changed files are re-tokenized, and
+documents that disappeared are dropped. Hidden directories (`.git`,
+`.mcu_cache`) are skipped. A fingerprint of the tokenizer and section logic
+(this module and mcu_parser.py) is stored with the index; when it changes the
+index is rebuilt on open.
+
+Library usage:
+  from mcu_search import SearchIndex
+  with SearchIndex() as index:
+      index.refresh(Path('.'))
+      for hit in index.search('context switching', section='Quick Reference', mcu_type='reference'):
+          print(hit.score, hit.path, hit.section)
+"""
+
+import heapq
+import math
+import os
+import re
+import sqlite3
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import mcu_parser
+from mcu_cache import default_cache_dir, sha256_bytes, source_fingerprint
+from mcu_index import RefreshStats, like_prefix
+from mcu_parser import CMU_HEADING, MCUDocument
+
+SEARCH_FILE_NAME = 'search.sqlite'
+SCHEMA_VERSION = 1
+
+TITLE = 'Title'
+OTHER = 'Other'
+# The section headings validate_mcu.py's _validate_structure requires
+STRUCTURE_SECTIONS = ['Executive Summary', 'Quick Reference', 'Detailed Reference']
+SECTIONS = [TITLE] + STRUCTURE_SECTIONS + [OTHER]
+SECTION_ALIASES = {'title': TITLE, 'summary': 'Executive Summary', 'quick': 'Quick Reference',
+                   'detailed': 'Detailed Reference', 'other': OTHER}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has in is it its of on or that the this to was were will with'.split())
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    title TEXT NOT NULL,
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    doc_id INTEGER NOT NULL REFERENCES docs(id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (doc_id, section)
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL REFERENCES docs(id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id, section)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings(doc_id);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased alphanumeric tokens, minus single characters and stopwords."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def section_name(heading: str) -> str:
+    """Map an H2 heading to its index section (prefix match, as validate_mcu.py does)."""
+    for name in STRUCTURE_SECTIONS:
+        if heading.startswith(name):
+            return name
+    return OTHER
+
+
+def resolve_section(value: Optional[str]) -> Optional[str]:
+    """Accept a section name or alias (summary, quick, detailed, title, other)."""
+    if not value:
+        return None
+    section = SECTION_ALIASES.get(value.lower(), value)
+    if section not in SECTIONS:
+        raise ValueError(f"Unknown section {value!r}; choose from {', '.join(SECTIONS)}")
+    return section
+
+
+def parse_tags(value: str) -> List[str]:
+    """`["a", "b"]`, `['a', 'b']` or `[a, b]` -> ['a', 'b'] (lowercased)."""
+    return [t.strip().strip('\'"').strip().lower() for t in value.strip().strip('[]').split(',') if t.strip()]
+
+
+def section_tokens(doc: MCUDocument) -> Dict[str, List[str]]:
+    """Tokens per index section for a parsed document."""
+    tokens: Dict[str, List[str]] = defaultdict(list)
+    if doc.title:
+        tokens[TITLE].extend(tokenize(doc.title))
+    for sec in doc.sections:
+        if doc.lines[sec.start].startswith(CMU_HEADING):
+            continue
+        name = section_name(sec.heading)
+        tokens[name].extend(tokenize(sec.heading))
+        tokens[name].extend(tokenize('\n'.join(doc.lines[sec.body_start:sec.end])))
+    return tokens
+
+
+class SearchHit:
+    """One ranked result: document, score and the section that matched best."""
+
+    __slots__ = ('path', 'title', 'score', 'section')
+
+    def __init__(self, path: str, title: str, score: float, section: str):
+        self.path = path
+        self.title = title
+        self.score = score
+        self.section = section
+
+    def to_dict(self) -> Dict:
+        return {'path': self.path, 'title': self.title, 'score': round(self.score, 4), 'section': self.section}
+
+    def __repr__(self) -> str:
+        return f"SearchHit({self.path!r}, {self.score:.3f}, {self.section!r})"
+
+
+def search_version() -> str:
+    """Fingerprint of the tokenizer and section logic; any edit to them invalidates the index."""
+    return source_fingerprint(__file__, mcu_parser.__file__)
+
+
+def default_search_path() -> Path:
+    return default_cache_dir() / SEARCH_FILE_NAME
+
+
+class SearchIndex:
+    """SQLite-backed inverted index with BM25 queries."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else default_search_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._drop_all()
+        self.conn.executescript(SCHEMA)
+        current = search_version()
+        stored = self.conn.execute("SELECT value FROM info WHERE key = 'version'").fetchone()
+        if stored is None or stored[0] != current:
+            # Postings were produced by another tokenizer: rebuild from scratch
+            self._drop_all()
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("INSERT INTO info (key, value) VALUES ('version', ?)", (current,))
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _drop_all(self) -> None:
+        for table in ('postings', 'sections', 'docs', 'info'):
+            self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return Path(os.path.abspath(path)).as_posix()
+
+    # ------------------------------------------------------------------
+    # Incremental refresh
+    # ------------------------------------------------------------------
+    def refresh(self, root: Path) -> RefreshStats:
+        """Bring the index up to date for the Markdown files under root."""
+        root = Path(root)
+        if root.is_file():
+            paths = [root]
+        else:
+            paths = []
+            for dirpath, dirnames, files in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+                paths.extend(Path(dirpath) / name for name in files if name.endswith('.md'))
+
+        stats = RefreshStats()
+        seen = set()
+        with self.conn:
+            for path in paths:
+                key = self._key(path)
+                seen.add(key)
+                self._refresh_file(path, key, stats)
+            if not root.is_file():
+                rows = self.conn.execute("SELECT id, path FROM docs WHERE path LIKE ? ESCAPE '\\'",
+                                         (like_prefix(self._key(root)) + '%',)).fetchall()
+                stale = [(doc_id,) for doc_id, path in rows if path not in seen]
+                self.conn.executemany('DELETE FROM docs WHERE id = ?', stale)
+                stats.removed = len(stale)
+        return stats
+
+    def has_documents(self, root: Path) -> bool:
+        """Whether anything under root has been indexed yet."""
+        root_key = self._key(root)
+        row = self.conn.execute("SELECT 1 FROM docs WHERE path = ? OR path LIKE ? ESCAPE '\\' LIMIT 1",
+                                (root_key, like_prefix(root_key) + '%')).fetchone()
+        return row is not None
+
+    def _refresh_file(self, path: Path, key: str, stats: RefreshStats) -> None:
+        try:
+            st = path.stat()
+        except OSError:
+            return
+        row = self.conn.execute('SELECT id, mtime_ns, size, sha256 FROM docs WHERE path = ?', (key,)).fetchone()
+        if row is not None and row[1] == st.st_mtime_ns and row[2] == st.st_size:
+            stats.unchanged += 1
+            return
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return
+        digest = sha256_bytes(data)
+        if row is not None and row[3] == digest:
+            self.conn.execute('UPDATE docs SET mtime_ns = ?, size = ? WHERE id = ?',
+                              (st.st_mtime_ns, st.st_size, row[0]))
+            stats.unchanged += 1
+            return
+        if row is not None:
+            self.conn.execute('DELETE FROM docs WHERE id = ?', (row[0],))
+            stats.updated += 1
+        else:
+            stats.added += 1
+        self._insert(MCUDocument(data.decode('utf-8', errors='replace'), path), key, st, digest)
+
+    def _insert(self, doc: MCUDocument, key: str, st: os.stat_result, digest: str) -> None:
+        def meta(name: str) -> str:
+            return (doc.metadata.get(name) or doc.fields.get(name) or '').strip()
+
+        tokens = section_tokens(doc)
+        tags = parse_tags(meta('Tags'))
+        cur = self.conn.execute(
+            'INSERT INTO docs (path, mtime_ns, size, sha256, title, type, category, tags, length) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, st.st_mtime_ns, st.st_size, digest, doc.title, meta('Type').lower(), meta('Category').lower(),
+             '|' + '|'.join(tags) + '|' if tags else '', sum(len(t) for t in tokens.values())))
+        doc_id = cur.lastrowid
+        self.conn.executemany('INSERT INTO sections (doc_id, section, length) VALUES (?, ?, ?)',
+                              [(doc_id, name, len(toks)) for name, toks in tokens.items() if toks])
+        self.conn.executemany('INSERT INTO postings (term, doc_id, section, tf) VALUES (?, ?, ?, ?)',
+                              [(term, doc_id, name, tf) for name, toks in tokens.items()
+                               for term, tf in Counter(toks).items()])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM docs').fetchone()[0]
+
+    def _allowed(self, mcu_type: Optional[str], category: Optional[str], tags: Sequence[str]) -> Optional[set]:
+        clauses: List[str] = []
+        params: List[str] = []
+        if mcu_type:
+            clauses.append('type = ?')
+            params.append(mcu_type.lower())
+        if category:
+            clauses.append('category = ?')
+            params.append(category.lower())
+        for tag in tags:
+            clauses.append("tags LIKE ? ESCAPE '\\'")
+            escaped = tag.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f'%|{escaped}|%')
+        if not clauses:
+            return None
+        return {doc_id for (doc_id,) in self.conn.execute(
+            f'SELECT id FROM docs WHERE {" AND ".join(clauses)}', params)}
+
+    def _collection(self, section: Optional[str]) -> Tuple[int, float]:
+        """(N, average length) over whole documents or one section."""
+        if section:
+            row = self.conn.execute('SELECT COUNT(*), AVG(length) FROM sections WHERE section = ?', (section,))
+        else:
+            row = self.conn.execute('SELECT COUNT(*), AVG(length) FROM docs')
+        n, avgdl = row.fetchone()
+        return n, avgdl or 0.0
+
+    def search(self, query: str, section: Optional[str] = None, mcu_type: Optional[str] = None,
+               category: Optional[str] = None, tags: Iterable[str] = (), limit: int = 10) -> List[SearchHit]:
+        """BM25-ranked documents for query, optionally scoped to a section and filtered by metadata."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        section = resolve_section(section)
+        allowed = self._allowed(mcu_type, category, list(tags))
+        n, avgdl = self._collection(section)
+        if not n:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term in terms:
+            # Each posting carries the length BM25 normalizes by (section or document)
+            if section:
+                rows = self.conn.execute(
+                    'SELECT p.doc_id, p.section, p.tf, s.length FROM postings p '
+                    'JOIN sections s ON s.doc_id = p.doc_id AND s.section = p.section '
+                    'WHERE p.term = ? AND p.section = ?', (term, section))
+            else:
+                rows = self.conn.execute(
+                    'SELECT p.doc_id, p.section, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc_id '
+                    'WHERE p.term = ?', (term,))
+            tfs: Dict[int, int] = defaultdict(int)
+            lengths: Dict[int, int] = {}
+            for doc_id, _, tf, length in rows:
+                tfs[doc_id] += tf
+                lengths[doc_id] = length
+            idf = math.log(1 + (n - len(tfs) + 0.5) / (len(tfs) + 0.5))
+            for doc_id, tf in tfs.items():
+                norm = K1 * (1 - B + B * lengths[doc_id] / avgdl) if avgdl else K1
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + norm)
+
+        if allowed is not None:
+            scores = {doc_id: s for doc_id, s in scores.items() if doc_id in allowed}
+        ranked = heapq.nsmallest(max(1, limit), scores.items(), key=lambda item: (-item[1], item[0]))
+        if not ranked:
+            return []
+        ids = [doc_id for doc_id, _ in ranked]
+        marks = ','.join('?' * len(ids))
+        info = {doc_id: (path, title) for doc_id, path, title in self.conn.execute(
+            f'SELECT id, path, title FROM docs WHERE id IN ({marks})', ids)}
+        # The section with the most query-term occurrences, for the returned hits only
+        best: Dict[int, Counter] = defaultdict(Counter)
+        term_marks = ','.join('?' * len(terms))
+        for doc_id, sec, tf in self.conn.execute(
+                f'SELECT doc_id, section, tf FROM postings WHERE term IN ({term_marks}) AND doc_id IN ({marks})'
+                + (' AND section = ?' if section else ''), terms + ids + ([section] if section else [])):
+            best[doc_id][sec] += tf
+        return [SearchHit(info[doc_id][0], info[doc_id][1], score, best[doc_id].most_common(1)[0][0])
+                for doc_id, score in ranked]
+
+
+def open_search(db_path: Optional[str]) -> SearchIndex:
+    return SearchIndex(Path(db_path) if db_path else None)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+MCU Sequence Allocator
+
+Allocates the `[SEQ]` part of `context_unit_id`s (`<type>-<name>-<date>-<SEQ>`)
+so that concurrent generate_mcu.py processes never hand out the same number.
+
+The highest sequence handed out per (Type, date) is kept in
+`<root>/.mcu_cache/sequences.json`, next to the corpus rather than in the
+working directory or $MCU_CACHE_DIR, so every process allocating for a root
+shares one state file and one lock wherever it was started. It is seeded
+once per corpus root from the root's MCU index
+(`<root>/.mcu_cache/index.sqlite`, see mcu_index.py), which is created on
+first use. Every allocation is a
+read-increment-write under an exclusive `fcntl` lock on a sibling `.lock`
+file, so sequences are unique across processes. Before handing out a block
+the allocator refreshes the index (only changed files are re-parsed) and
+skips any sequence already used on disk for that type and date, so
+hand-written MCUs are never collided with. A sequence is reserved before its
+file is written, so a failed write leaves a gap. On platforms without
+`fcntl` allocation still works but is not serialized.
+
+`generate_mcu.py --reseed` (rebuild()) resets the stored state from the
+corpus, e.g. after MCUs were deleted.
+
+Library usage:
+  from mcu_sequence import SequenceAllocator
+  seq = SequenceAllocator(repo_root).allocate('reference', '2025-08-10')   # e.g. 3
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from mcu_cache import DEFAULT_CACHE_DIR, atomic_write_json, load_json
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+SEQUENCE_FILE_NAME = 'sequences.json'
+SEQUENCE_VERSION = 1
+
+# `<anything>-YYYY-MM-DD-<digits>`; placeholders like `[SEQ]` do not match
+CONTEXT_ID_RE = re.compile(r'-(\d{4}-\d{2}-\d{2})-(\d+)$')
+
+
+def _key(mcu_type: str, date: str) -> str:
+    return f"{mcu_type}|{date}"
+
+
+def parse_context_id(context_unit_id: Optional[str]) -> Optional[Tuple[str, int]]:
+    """Return (date, sequence) from a context_unit_id, or None."""
+    m = CONTEXT_ID_RE.search(context_unit_id or '')
+    return (m.group(1), int(m.group(2))) if m else None
+
+
+def index_sequences(index, root: Path) -> Dict[str, int]:
+    """Highest sequence per 'type|date' from an MCUIndex (refreshed for root first)."""
+    index.refresh(root)
+    return _indexed_sequences(index, root)
+
+
+def _indexed_sequences(index, root: Path) -> Dict[str, int]:
+    sequences: Dict[str, int] = {}
+    for context_unit_id, mcu_type in index.context_ids(root):
+        _record(sequences, mcu_type, context_unit_id)
+    return sequences
+
+
+def _used_sequences(index, root: Path, mcu_type: str, date: str) -> Set[int]:
+    used: Set[int] = set()
+    for context_unit_id, indexed_type in index.context_ids(root):
+        parsed = parse_context_id(context_unit_id)
+        if parsed is not None and parsed[0] == date and (indexed_type or '').strip() == mcu_type:
+            used.add(parsed[1])
+    return used
+
+
+def _record(sequences: Dict[str, int], mcu_type: Optional[str], context_unit_id: Optional[str]) -> None:
+    parsed = parse_context_id(context_unit_id)
+    if not mcu_type or parsed is None:
+        return
+    key = _key(mcu_type.strip(), parsed[0])
+    sequences[key] = max(sequences.get(key, 0), parsed[1])
+
+
+class SequenceAllocator:
+    """Hands out per-(type, date) context_unit_id sequences, safely across processes.
+
+    State, lock and the corpus index live in <root>/.mcu_cache unless
+    cache_dir (state and lock) or index_db is given.
+    """
+
+    def __init__(self, root: Path, cache_dir: Optional[Path] = None, index_db: Optional[Path] = None):
+        self.root = Path(root).resolve()
+        self.cache_path = (Path(cache_dir) if cache_dir else self.root / DEFAULT_CACHE_DIR) / SEQUENCE_FILE_NAME
+        self.lock_path = self.cache_path.with_name(SEQUENCE_FILE_NAME + '.lock')
+        self.index_db = Path(index_db) if index_db else None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _index(self):
+        from mcu_index import INDEX_FILE_NAME, MCUIndex
+        db = self.index_db or self.root / DEFAULT_CACHE_DIR / INDEX_FILE_NAME
+        db.parent.mkdir(parents=True, exist_ok=True)
+        return MCUIndex(db)
+
+    def _load(self) -> Dict:
+        state = load_json(self.cache_path)
+        if not isinstance(state, dict) or state.get('version') != SEQUENCE_VERSION:
+            state = {'version': SEQUENCE_VERSION, 'roots': {}}
+        return state
+
+    def allocate(self, mcu_type: str, date: str, count: int = 1) -> int:
+        """Reserve count consecutive sequences for (mcu_type, date) and return the first.
+
+        The block starts after the highest sequence handed out so far and
+        skips past any sequence already used by an MCU on disk.
+        """
+        count = max(1, count)
+        with self._locked(), self._index() as index:
+            index.refresh(self.root)
+            state = self._load()
+            root_key = self.root.as_posix()
+            sequences = state['roots'].get(root_key)
+            if sequences is None:
+                sequences = state['roots'][root_key] = _indexed_sequences(index, self.root)
+            key = _key(mcu_type, date)
+            used = _used_sequences(index, self.root, mcu_type, date)
+            first = sequences.get(key, 0) + 1
+            clash = used.intersection(range(first, first + count))
+            while clash:
+                first = max(clash) + 1
+                clash = used.intersection(range(first, first + count))
+            sequences[key] = first + count - 1
+            atomic_write_json(self.cache_path, state)
+            return first
+
+    def rebuild(self) -> None:
+        """Re-seed this root from the corpus, dropping sequences reserved but never written."""
+        with self._locked(), self._index() as index:
+            state = self._load()
+            state['roots'][self.root.as_posix()] = index_sequences(index, self.root)
+            atomic_write_json(self.cache_path, state)
+
+    def current(self, mcu_type: str, date: str) -> int:
+        """The highest sequence allocated so far for (mcu_type, date) (0 if none)."""
+        with self._locked():
+            sequences = self._load()['roots'].get(self.root.as_posix()) or {}
+            return sequences.get(_key(mcu_type, date), 0)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+MCU External Merge Sort
+
+Sorts a stream of JSON-serialisable records without holding them all in
+memory, for the streaming report output of backlog_report.py.
+
+Records are buffered up to `buffer_size`; a full buffer is sorted and
+spilled to a run file in a private temporary directory as one JSON line per
+record, and the file is closed. The sorted output is a heapq merge of the
+spilled runs and the final in-memory buffer, read back one line at a time.
+At most `max_runs` run files (default 64) are open at once: with more runs
+than that, consecutive groups of `max_runs` are first merged into longer
+runs, in as many passes as needed.
+
+Peak memory is therefore about `buffer_size` records plus one record per
+merged run, independent of the total number of records. The sort is
+stable: records with equal keys come out in insertion order, exactly as
+with `sorted()`.
+
+Library usage:
+  from mcu_sort import ExternalSorter
+  with ExternalSorter(key=lambda r: r['title'], buffer_size=10000) as sorter:
+      for row in rows:
+          sorter.add(row)
+      for row in sorter.sorted():
+          ...
+"""
+
+import heapq
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+DEFAULT_BUFFER_SIZE = 50_000
+MAX_MERGE_RUNS = 64
+
+
+class ExternalSorter:
+    """Accumulates records and yields them sorted by key, spilling to disk as needed."""
+
+    def __init__(self, key: Callable[[Any], Any], buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 tmp_dir: Optional[str] = None, max_runs: int = MAX_MERGE_RUNS):
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be >= 1, got {buffer_size}")
+        if max_runs < 2:
+            raise ValueError(f"max_runs must be >= 2, got {max_runs}")
+        self.key = key
+        self.buffer_size = buffer_size
+        self.tmp_dir = tmp_dir
+        self.max_runs = max_runs
+        self.count = 0
+        self._buffer: List[Any] = []
+        self._runs: List[str] = []
+        self._run_dir: Optional[str] = None
+        self._next_run = 0
+
+    @property
+    def runs(self) -> int:
+        """Number of runs spilled to disk so far."""
+        return len(self._runs)
+
+    def add(self, record: Any) -> None:
+        self._buffer.append(record)
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self._spill()
+
+    def extend(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.add(record)
+
+    def _spill(self) -> None:
+        self._buffer.sort(key=self.key)
+        self._runs.append(self._write_run(self._buffer))
+        self._buffer = []
+
+    def _write_run(self, records: Iterable[Any]) -> str:
+        if self._run_dir is None:
+            self._run_dir = tempfile.mkdtemp(prefix='mcu-sort-', dir=self.tmp_dir)
+        path = os.path.join(self._run_dir, f"run-{self._next_run}.jsonl")
+        self._next_run += 1
+        with open(path, 'w', encoding='utf-8') as run:
+            for record in records:
+                run.write(json.dumps(record))
+                run.write('\n')
+        return path
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[Any]:
+        with open(path, 'r', encoding='utf-8') as run:
+            for line in run:
+                yield json.loads(line)
+
+    def _merge_runs(self, paths: List[str]) -> str:
+        if len(paths) == 1:
+            return paths[0]
+        merged = self._write_run(heapq.merge(*(self._read_run(path) for path in paths), key=self.key))
+        for path in paths:
+            os.remove(path)
+        return merged
+
+    def sorted(self) -> Iterator[Any]:
+        """Yield every record added so far in key order (consumes the sorter)."""
+        self._buffer.sort(key=self.key)
+        if not self._runs:
+            buffer, self._buffer = self._buffer, []
+            yield from buffer
+            return
+        try:
+            # Merging consecutive groups keeps equal keys in insertion order
+            while len(self._runs) > self.max_runs:
+                self._runs = [self._merge_runs(self._runs[i:i + self.max_runs])
+                              for i in range(0, len(self._runs), self.max_runs)]
+            # Runs precede the buffer so that equal keys keep insertion order
+            sources = [self._read_run(path) for path in self._runs] + [iter(self._buffer)]
+            self._buffer = []
+            yield from heapq.merge(*sources, key=self.key)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._run_dir is not None:
+            shutil.rmtree(self._run_dir, ignore_errors=True)
+            self._run_dir = None
+        self._runs = []
+        self._buffer = []
+
+    def __enter__(self) -> 'ExternalSorter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
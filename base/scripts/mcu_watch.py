@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+MCU Directory Watcher
+
+Blocks until Markdown files in a directory change, for the `--watch` modes of
+backlog_report.py and backlog_kanban.py.
+
+- On Linux, inotify is used through ctypes (no third-party dependency), so a
+  save is reported as soon as the editor closes or renames the file.
+- Elsewhere, or when inotify is unavailable, the directory is polled and
+  files are compared by (mtime, size).
+
+Each wakeup returns the set of changed paths. A path that no longer exists
+was removed; everything else should be re-read.
+
+Library usage:
+  from mcu_watch import DirectoryWatcher
+  with DirectoryWatcher(items_dir) as watcher:
+      for changed in watcher:
+          ...
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF
+
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+# Events arriving this soon after the first one are reported together
+DEBOUNCE_SECONDS = 0.05
+
+
+def _load_inotify():
+    """Return libc if it exposes inotify, else None."""
+    if not hasattr(os, 'O_NONBLOCK'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class DirectoryWatcher:
+    """Reports changes to files matching pattern directly inside directory.
+
+    backend: 'auto' (inotify when available, else polling), 'inotify' or 'poll'.
+    Changed paths are absolute: directory is resolved once, up front.
+    """
+
+    def __init__(self, directory: Path, pattern: str = '*.md', interval: float = 0.5,
+                 backend: str = 'auto'):
+        self.directory = Path(directory).resolve()
+        self.pattern = pattern
+        self.interval = interval
+        self._fd: Optional[int] = None
+        self._snapshot: Dict[Path, Tuple[int, int]] = self._scan()
+        if backend in ('auto', 'inotify'):
+            self._fd = self._start_inotify()
+            if self._fd is None and backend == 'inotify':
+                raise OSError(errno.ENOSYS, 'inotify is not available')
+        self.backend = 'inotify' if self._fd is not None else 'poll'
+
+    def _matches(self, name: str) -> bool:
+        return fnmatch.fnmatch(name, self.pattern)
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return snapshot
+        for entry in entries:
+            if self._matches(entry.name) and entry.is_file():
+                st = entry.stat()
+                snapshot[self.directory / entry.name] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def _start_inotify(self) -> Optional[int]:
+        libc = _load_inotify()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, 'O_CLOEXEC', 0))
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(str(self.directory)), WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> 'DirectoryWatcher':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Set[Path]]:
+        while True:
+            yield self.wait()
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until something changes; returns an empty set on timeout."""
+        if self._fd is not None:
+            return self._wait_inotify(timeout)
+        return self._wait_poll(timeout)
+
+    def _wait_poll(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {p for p, sig in current.items() if self._snapshot.get(p) != sig}
+            changed.update(p for p in self._snapshot if p not in current)
+            self._snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval if deadline is None else
+                       max(0.0, min(self.interval, deadline - time.monotonic())))
+
+    def _read_events(self) -> Tuple[Set[Path], bool]:
+        changed: Set[Path] = set()
+        overflow = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, mask, _, name_len = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset:offset + name_len].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+                offset += name_len
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                elif name and self._matches(name):
+                    changed.add(self.directory / name)
+        return changed, overflow
+
+    def _wait_inotify(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed, overflow = self._read_events()
+            # Editors often save via several syscalls; collect the burst
+            while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+                more, more_overflow = self._read_events()
+                changed |= more
+                overflow = overflow or more_overflow
+            current = self._scan()
+            if overflow:
+                # Events were dropped: report everything we know about
+                changed = set(current) | set(self._snapshot)
+            self._snapshot = current
+            # Events for other files (editor temp files, *.json, ...) do not wake callers
+            if changed:
+                return changed
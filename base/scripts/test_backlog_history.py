@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from backlog_history import TrackHistory, item_metrics, main, summarize
+
+ITEM_MD = """# Item
+
+## Tracks (authoritative on item)
+- source_track: Curated
+- definition_track: AC-Ready
+- execution_track: {execution}
+"""
+DAY = 86400
+T0 = 1735689600  # 2025-01-01T00:00:00Z
+
+
+class TestTrackHistory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.repo = self.tmpdir / 'repo'
+        (self.repo / 'BACKLOGS' / 'ITEMS').mkdir(parents=True)
+        self._git('init', '-q')
+        self.cache = self.tmpdir / 'history.json'
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def _git(self, *args: str, when: int = T0) -> None:
+        env = dict(os.environ, GIT_AUTHOR_NAME='t', GIT_AUTHOR_EMAIL='t@example.com',
+                   GIT_COMMITTER_NAME='t', GIT_COMMITTER_EMAIL='t@example.com',
+                   GIT_AUTHOR_DATE=f'{when} +0000', GIT_COMMITTER_DATE=f'{when} +0000')
+        subprocess.run(['git', '-C', str(self.repo), *args], check=True, env=env, capture_output=True)
+
+    def _commit(self, name: str, execution: str, day: int) -> None:
+        (self.repo / 'BACKLOGS' / 'ITEMS' / name).write_text(ITEM_MD.format(execution=execution), encoding='utf-8')
+        self._git('add', '-A')
+        self._git('commit', '-q', '-m', f'{name} {execution}', when=T0 + day * DAY)
+
+    def test_transitions_and_metrics(self):
+        self._commit('a.md', 'Not-Started', 0)
+        self._commit('a.md', 'In-Progress', 2)
+        self._commit('a.md', 'Blocked', 3)
+        self._commit('a.md', 'In-Progress', 5)
+        self._commit('a.md', 'Completed', 6)
+        history = TrackHistory(self.repo)
+        self.assertEqual(history.update(), 5)
+        item = history.items['BACKLOGS/ITEMS/a.md']
+        executions = [(t[2], t[3]) for t in item['transitions'] if t[0] == 'execution_track']
+        self.assertEqual(executions, [('Not-Started', T0), ('In-Progress', T0 + 2 * DAY), ('Blocked', T0 + 3 * DAY),
+                                      ('In-Progress', T0 + 5 * DAY), ('Completed', T0 + 6 * DAY)])
+        metrics = item_metrics(item, T0 + 10 * DAY)
+        self.assertEqual(metrics, {'lead': 6 * DAY, 'cycle': 4 * DAY, 'in_progress': 2 * DAY, 'blocked': 2 * DAY})
+
+    def test_resumes_from_cache(self):
+        self._commit('a.md', 'Not-Started', 0)
+        history = TrackHistory(self.repo, self.cache)
+        self.assertEqual(history.update(), 1)
+        history.save()
+
+        self._commit('b.md', 'In-Progress', 1)
+        self._commit('a.md', 'In-Progress', 2)
+        resumed = TrackHistory(self.repo, self.cache)
+        self.assertEqual(resumed.update(), 2)
+        self.assertEqual(resumed.update(), 0)
+        full = TrackHistory(self.repo)
+        full.update()
+        self.assertEqual(resumed.items, full.items)
+
+        rows = summarize(resumed, as_of=T0 + 4 * DAY)
+        delivery = next(r for r in rows if r['workstream'] == 'Delivery (Execution)')
+        self.assertEqual(delivery['items'], 2)
+        self.assertEqual(delivery['in_progress_mean_days'], 2.5)
+
+    def test_rewritten_history_rebuilds(self):
+        self._commit('a.md', 'Not-Started', 0)
+        self._commit('a.md', 'In-Progress', 1)
+        history = TrackHistory(self.repo, self.cache)
+        history.update()
+        history.save()
+        self._git('reset', '-q', '--hard', 'HEAD~1')
+        self._commit('a.md', 'Blocked', 2)
+        resumed = TrackHistory(self.repo, self.cache)
+        self.assertEqual(resumed.update(), 2)
+        self.assertEqual(resumed.items['BACKLOGS/ITEMS/a.md']['tracks']['execution_track'], 'Blocked')
+
+    def test_deleted_items_are_dropped_from_summary(self):
+        self._commit('a.md', 'Not-Started', 0)
+        (self.repo / 'BACKLOGS' / 'ITEMS' / 'a.md').unlink()
+        self._git('add', '-A')
+        self._git('commit', '-q', '-m', 'rm', when=T0 + DAY)
+        history = TrackHistory(self.repo)
+        history.update()
+        self.assertEqual(summarize(history, as_of=T0)[-1]['items'], 0)
+
+
+
+class TestMain(unittest.TestCase):
+    def test_invalid_as_of_is_a_usage_error(self):
+        err = io.StringIO()
+        with redirect_stderr(err), self.assertRaises(SystemExit) as cm:
+            main(['--as-of', 'garbage'])
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn('invalid ISO 8601 date', err.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from backlog_kanban import load_item_map, load_items, main, render_board
+
+
+ITEM_MD = """# Item {n}
+
+## Tracks (authoritative on item)
+- source_track: Captured
+- execution_track: {execution}
+{extra}"""
+
+
+class TestBacklogKanbanBoard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        (self.tmpdir / 'a.md').write_text(ITEM_MD.format(n=1, execution='Not-Started', extra=''), encoding='utf-8')
+        (self.tmpdir / 'b.md').write_text(ITEM_MD.format(n=2, execution='In-Progress', extra=''), encoding='utf-8')
+        (self.tmpdir / 'c.md').write_text(
+            ITEM_MD.format(n=3, execution='In-Progress', extra='- docs_track: Docs-Added\n'), encoding='utf-8')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def test_board_counts_and_titles(self):
+        lines = render_board(load_items(self.tmpdir))
+        self.assertIn("Delivery (Execution):  Not-Started (1) | In-Progress (2) | Blocked (0) | Completed (0)", lines)
+        self.assertIn("Planning:  Waiting (1) | Plan-Accepted (2)", lines)
+        self.assertIn("  [In-Progress] Item 2", lines)
+        self.assertIn("  [In-Progress] Item 3", lines)
+        self.assertIn("Docs:  Docs-Added (1) | Examples-Linked (0)", lines)
+
+    def test_docs_lane_hidden_without_docs_track(self):
+        (self.tmpdir / 'c.md').unlink()
+        lines = render_board(load_items(self.tmpdir))
+        self.assertFalse(any(line.startswith("Docs:") for line in lines))
+
+    def test_index_matches_parser(self):
+        db = str(self.tmpdir / 'index.sqlite')
+        self.assertEqual(load_items(self.tmpdir), load_items(self.tmpdir, db))
+
+    def test_item_map_keys_are_resolved(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmpdir.parent)
+        try:
+            relative = Path(self.tmpdir.name)
+            expected = [self.tmpdir.resolve() / name for name in ('a.md', 'b.md', 'c.md')]
+            self.assertEqual(list(load_item_map(relative)), expected)
+            self.assertEqual(list(load_item_map(relative, str(self.tmpdir / 'index.sqlite'))), expected)
+        finally:
+            os.chdir(cwd)
+
+    def test_main_items_dir(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(['backlog_kanban.py', '--items-dir', str(self.tmpdir)]), 0)
+        self.assertIn("(3 item(s))", out.getvalue())
+
+
+    def test_main_without_item_prints_usage(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(['backlog_kanban.py']), 1)
+        self.assertEqual(out.getvalue(), "Usage: python3 base/scripts/backlog_kanban.py BACKLOGS/ITEMS/<file>.md\n")
+
+if __name__ == '__main__':
+    unittest.main()
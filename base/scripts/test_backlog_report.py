@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from backlog_report import TRACKS_FIELDS, WS_FIELDS, ReportWatcher, as_of_arg, main, _collect_rows, _stream_rows, _write_json
+from mcu_index import open_index
+
+
+ITEM_MD = """# Item {n}
+
+## Tracks (authoritative on item)
+- source_track: {source}
+"""
+
+
+class TestReportWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.items = self.tmpdir / 'ITEMS'
+        self.items.mkdir()
+        for n in range(3):
+            self._write(n, 'Captured')
+        self.ws_out = self.tmpdir / 'ws.csv'
+        self.tr_out = self.tmpdir / 'tr.csv'
+        self.report = ReportWatcher(self.items, self.tmpdir, [
+            ('ws', 'csv', WS_FIELDS, self.ws_out, 'Workstream'),
+            ('tr', 'csv', TRACKS_FIELDS, self.tr_out, 'Tracks'),
+        ])
+        self.report.load()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def _write(self, n: int, source: str) -> Path:
+        path = self.items / f'item{n}.md'
+        path.write_text(ITEM_MD.format(n=n, source=source), encoding='utf-8')
+        return path
+
+    def test_incremental_update_matches_full_rescan(self):
+        self.assertEqual(len(self.report.write()), 2)
+        changed = {self._write(1, 'Curated'), self._write(3, 'Captured')}
+        (self.items / 'item0.md').unlink()
+        changed.add(self.items / 'item0.md')
+        self.assertEqual(self.report.update(changed), 2)
+        self.assertEqual(self.report.rows(), _collect_rows(self.items, self.tmpdir))
+        self.report.write()
+        self.assertIn('Definition,Item 1', self.ws_out.read_text(encoding='utf-8'))
+
+    def test_relative_items_dir_with_index(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+        try:
+            report = ReportWatcher(Path('ITEMS'), self.tmpdir, self.report.outputs)
+            with open_index('index.sqlite') as index:
+                report.load(index)
+            # The watcher reports paths under the resolved directory
+            self.assertEqual(report.update({self.items.resolve() / 'item1.md'}), 1)
+            self.assertEqual(len(report.items), 3)
+            self.assertEqual([row['path'] for row in report.rows()[0]],
+                             ['ITEMS/item0.md', 'ITEMS/item1.md', 'ITEMS/item2.md'])
+        finally:
+            os.chdir(cwd)
+
+    def test_unreadable_save_keeps_previous_rows(self):
+        before = self.report.rows()
+        path = self.items / 'item1.md'
+        path.write_bytes(b'# Item 1\n\xff\xfe half-written')
+        with redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(self.report.update({path}), 0)
+        self.assertIn('item1.md', err.getvalue())
+        self.assertEqual(self.report.rows(), before)
+
+    def test_unchanged_outputs_are_not_rewritten(self):
+        self.report.write()
+        self.report.update({self._write(2, 'Captured')})
+        self.assertEqual(self.report.write(), [])
+
+
+class TestStreamingReport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        sources = ['Captured', 'Curated', '']
+        for n in range(25):
+            (self.tmpdir / f'item{n:02d}.md').write_text(
+                ITEM_MD.format(n=n % 4, source=sources[n % 3]), encoding='utf-8')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def test_external_sort_matches_in_memory_rows(self):
+        rows_ws, rows_tracks = _collect_rows(self.tmpdir, self.tmpdir)
+        sorter_ws, sorter_tracks = _stream_rows(self.tmpdir, self.tmpdir, buffer_size=4)
+        with sorter_ws, sorter_tracks:
+            self.assertGreater(sorter_ws.runs, 1)
+            self.assertEqual(list(sorter_ws.sorted()), rows_ws)
+            self.assertEqual(list(sorter_tracks.sorted()), rows_tracks)
+
+    def test_streamed_json_matches_json_dump(self):
+        rows_ws, _ = _collect_rows(self.tmpdir, self.tmpdir)
+        for rows in (rows_ws, []):
+            buf = io.StringIO()
+            _write_json(iter(rows), buf)
+            self.assertEqual(buf.getvalue(), json.dumps(rows, indent=2))
+
+
+class TestAsOf(unittest.TestCase):
+    def test_dates_default_to_utc(self):
+        self.assertEqual(as_of_arg('2025-09-01'), datetime(2025, 9, 1, tzinfo=timezone.utc))
+        self.assertEqual(as_of_arg('2025-09-01T12:00:00+02:00').utcoffset().total_seconds(), 7200)
+
+    def test_invalid_date_is_a_usage_error(self):
+        err = io.StringIO()
+        with redirect_stderr(err), self.assertRaises(SystemExit) as cm:
+            main(['--stats', '--as-of', 'garbage'])
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("invalid ISO 8601 date: 'garbage'", err.getvalue())
+
+
+
+class TestSortBuffer(unittest.TestCase):
+    def test_sort_buffer_must_be_positive(self):
+        for value in ('0', '-5'):
+            err = io.StringIO()
+            with self.subTest(value=value), redirect_stderr(err), self.assertRaises(SystemExit) as cm:
+                main(['--sort-buffer', value])
+            self.assertEqual(cm.exception.code, 2)
+            self.assertIn('--sort-buffer must be >= 1', err.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import mcu_parser
+from backlog_stats import StatsColumns, age_rows, crosstab_rows, defer_rows, np
+
+AS_OF = datetime(2025, 3, 1, tzinfo=timezone.utc)
+ITEMS = [
+    ('Discovery', {'source_track': 'Captured'}, '2025-02-19T00:00:00Z'),
+    ('Discovery', {'source_track': 'Captured', 'defer_track': 'Deferred', 'defer_until': '2025-06-15'}, '2025-02-27T00:00:00Z'),
+    ('Definition', {'source_track': 'Curated', 'definition_track': 'Sized', 'defer_until': '2025-06-01'}, None),
+    ('Release', {'source_track': 'Curated', 'validation_track': 'Explicit-Accepted'}, '2025-01-30T00:00:00Z'),
+]
+ORDER = ['Discovery', 'Definition', 'Release']
+
+
+def _columns(backend: str) -> StatsColumns:
+    cols = StatsColumns(AS_OF, backend)
+    for ws, tracks, created in ITEMS:
+        cols.append(ws, tracks, created)
+    return cols
+
+
+class _Py310Datetime(datetime):
+    """datetime whose fromisoformat() rejects a trailing Z, as on Python 3.10."""
+
+    @classmethod
+    def fromisoformat(cls, value):
+        if value.endswith('Z'):
+            raise ValueError(f"Invalid isoformat string: {value!r}")
+        return datetime.fromisoformat(value)
+
+
+class TestBacklogStats(unittest.TestCase):
+    def _backends(self):
+        return ['array'] + (['numpy'] if np is not None else [])
+
+    def test_aggregates(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                cols = _columns(backend)
+                crosstab = crosstab_rows(cols, ORDER)
+                self.assertIn({'workstream': 'Discovery', 'track': 'source_track', 'state': 'Captured', 'count': 2}, crosstab)
+                self.assertIn({'workstream': 'Definition', 'track': 'definition_track', 'state': 'Sized', 'count': 1}, crosstab)
+                self.assertEqual(defer_rows(cols), [
+                    {'defer_until_month': '2025-06', 'defer_track': '', 'count': 1},
+                    {'defer_until_month': '2025-06', 'defer_track': 'Deferred', 'count': 1},
+                ])
+                ages = age_rows(cols, ORDER)
+                self.assertEqual([r['workstream'] for r in ages], ORDER + ['(all)'])
+                self.assertEqual(ages[0], {'workstream': 'Discovery', 'items': 2, 'with_created': 2, 'min_days': 2.0,
+                                           'median_days': 6.0, 'mean_days': 6.0, 'max_days': 10.0})
+                self.assertEqual(ages[1]['with_created'], 0)
+                self.assertEqual(ages[1]['median_days'], '')
+                self.assertEqual(ages[3]['median_days'], 10.0)
+
+    def test_backends_agree(self):
+        if np is None:
+            self.skipTest('NumPy not installed')
+        array_cols, numpy_cols = _columns('array'), _columns('numpy')
+        for build in (crosstab_rows, age_rows):
+            self.assertEqual(build(array_cols, ORDER), build(numpy_cols, ORDER))
+        self.assertEqual(defer_rows(array_cols), defer_rows(numpy_cols))
+
+    def test_empty(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                cols = StatsColumns(AS_OF, backend)
+                self.assertEqual(crosstab_rows(cols), [])
+                self.assertEqual(defer_rows(cols), [])
+                self.assertEqual(age_rows(cols)[-1]['items'], 0)
+
+
+    def test_created_with_trailing_z(self):
+        with mock.patch.object(mcu_parser, 'datetime', _Py310Datetime):
+            cols = StatsColumns(AS_OF, 'array')
+            cols.append('Discovery', {'source_track': 'Captured'}, '2025-02-10T03:51:45Z')
+            cols.append('Discovery', {'source_track': 'Captured'}, '2025-02-19')
+        ages = age_rows(cols, ['Discovery'])
+        self.assertEqual(ages[0]['with_created'], 2)
+        self.assertEqual(mcu_parser.parse_timestamp('2025-08-10T03:51:45Z'),
+                         datetime(2025, 8, 10, 3, 51, 45, tzinfo=timezone.utc))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from bench_mcu import compare, generate_corpus
+from check_links import LinkChecker
+from validate_mcu import MCUValidator
+
+
+class TestBenchCorpus(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_generated_corpus_is_valid(self):
+        counts = generate_corpus(self.root / 'corpus', items=12)
+        self.assertEqual(counts, {'version': 1, 'items': 12, 'notes': 12, 'references': 1})
+        corpus = self.root / 'corpus'
+        self.assertEqual(len(list((corpus / 'BACKLOGS' / 'ITEMS').glob('BLIT_*.md'))), 12)
+
+        validator = MCUValidator()
+        files = validator.discover_files(str(corpus))
+        self.assertEqual(len(files), 15)  # items, reference, VIBE_NOTE.md, BACKLOG_MAIN.md
+        for path in files:
+            valid, errors = validator.validate_file(path)
+            self.assertTrue(valid, (path, errors))
+        self.assertEqual(LinkChecker().check_directory(str(corpus)), [])
+
+
+class TestCompare(unittest.TestCase):
+    def test_statuses(self):
+        baseline = {'results': {'a': {'seconds': 1.0}, 'b': {'seconds': 1.0}, 'c': {'seconds': 1.0},
+                                'd': {'seconds': 0.001}}}
+        current = {'results': {'a': {'seconds': 1.1}, 'b': {'seconds': 1.5}, 'c': {'seconds': 0.5},
+                               'd': {'seconds': 0.003}, 'e': {'seconds': 2.0}}}
+        statuses = {row['name']: row['status'] for row in compare(current, baseline, threshold=0.2)}
+        # d tripled but by less than min_delta
+        self.assertEqual(statuses, {'a': 'ok', 'b': 'regression', 'c': 'improved', 'd': 'ok', 'e': 'new'})
+
+
+if __name__ == '__main__':
+    unittest.main()
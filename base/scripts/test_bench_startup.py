@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import mcu
+from bench_startup import parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       900 |       1400 | site
+import time:       300 |        300 |     _yaml
+import time:      4000 |      13000 |   yaml.constructor
+import time:      2000 |      15000 | yaml
+import time:      1500 |       2500 | argparse
+"""
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_top_level_imports_only(self):
+        total, heaviest = parse_importtime(IMPORTTIME)
+        self.assertEqual(heaviest, [('yaml', 0.015), ('argparse', 0.0025)])
+        self.assertAlmostEqual(total, 0.0175)
+
+
+class TestScriptCommands(unittest.TestCase):
+    def test_validate_runs_through_mcu(self):
+        readme = Path(__file__).resolve().parent / 'README.md'
+        out = io.StringIO()
+        prog = sys.argv[0]
+        try:
+            with redirect_stdout(out):
+                code = mcu.main(['validate', str(readme)])
+        finally:
+            sys.argv[0] = prog
+        self.assertIn(code, (0, 1))
+        self.assertIn('README.md', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
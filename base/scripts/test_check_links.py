@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from check_links import HeadingIndex, LinkChecker, extract_anchors, main
+from external_links import ExternalLinkCache, ExternalLinkChecker
+
+
+class TestAnchors(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        (self.tmpdir / 'other.md').write_text(
+            '# Other Doc\n\n<a id="note-2025-01-01T00-00-00Z"></a>\n## [2025-01-01T00:00:00Z] A note\n',
+            encoding='utf-8')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def test_extract_anchors(self):
+        anchors = extract_anchors('# Quick Reference\n## Quick Reference\n```\n# Fenced\n```\n## **Essential** `Rules`\n')
+        self.assertEqual(anchors, {'quick-reference', 'quick-reference-1', 'essential-rules'})
+
+    def test_resolves_local_and_cross_file_anchors(self):
+        doc = self.tmpdir / 'doc.md'
+        doc.write_text(
+            '# Doc\n## Quick Reference\n'
+            '[ok](#quick-reference) [bad](#missing)\n'
+            '[note](other.md#note-2025-01-01T00-00-00Z) [heading](./other.md#other-doc) '
+            '[gone](other.md#nope) [nofile](missing.md#x)\n',
+            encoding='utf-8')
+        issues = LinkChecker().check_file(str(doc))
+        self.assertEqual([(i['type'], i['link_url']) for i in issues], [
+            ('broken_anchor', '#missing'),
+            ('broken_anchor', 'other.md#nope'),
+            ('broken_link', 'missing.md#x'),
+        ])
+
+    def test_anchor_cache_persists(self):
+        cache_path = self.tmpdir / 'cache' / 'anchors.json'
+        index = HeadingIndex(cache_path)
+        self.assertTrue(index.has_anchor(str(self.tmpdir / 'other.md'), 'other-doc'))
+        index.save()
+        warm = HeadingIndex(cache_path)
+        self.assertIn(os.path.abspath(self.tmpdir / 'other.md'), warm._entries)
+        self.assertTrue(warm.has_anchor(str(self.tmpdir / 'other.md'), 'note-2025-01-01T00-00-00Z'))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def _respond(self):
+        _Handler.hits.append((self.command, self.path))
+        if self.path == '/slow':
+            time.sleep(1.0)
+        if self.path == '/missing':
+            self.send_response(404)
+        elif self.path == '/nohead' and self.command == 'HEAD':
+            self.send_response(405)
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestExternalLinks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        _Handler.hits = []
+        self.tmpdir = Path(tempfile.mkdtemp())
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def test_checks_each_url_once(self):
+        base = self.base
+        for n in range(3):
+            (self.tmpdir / f"doc{n}.md").write_text(
+                f"[ok]({base}/ok) [ok again]({base}/ok#frag) [gone]({base}/missing) [nohead]({base}/nohead)\n",
+                encoding='utf-8')
+        checker = LinkChecker(external_checker=ExternalLinkChecker(max_connections=4, per_host=2, timeout=5))
+        issues = checker.check_directory(str(self.tmpdir))
+        self.assertEqual(len(issues), 3)
+        self.assertTrue(all(i['type'] == 'broken_external' and '404' in i['message'] for i in issues))
+        self.assertEqual(sorted(_Handler.hits),
+                         [('GET', '/nohead'), ('HEAD', '/missing'), ('HEAD', '/nohead'), ('HEAD', '/ok')])
+
+    def test_timeout_is_reported(self):
+        checker = ExternalLinkChecker(timeout=0.2)
+        result = checker.check_urls([f"{self.base}/slow"])[f"{self.base}/slow"]
+        self.assertFalse(result.ok)
+        self.assertIn('Request failed', result.message)
+
+    def test_ttl_cache(self):
+        cache_path = self.tmpdir / 'external.json'
+        url = f"{self.base}/ok"
+        cold = ExternalLinkCache(cache_path)
+        ExternalLinkChecker(cache=cold).check_urls([url])
+        cold.save()
+        warm = ExternalLinkChecker(cache=ExternalLinkCache(cache_path))
+        self.assertTrue(warm.check_urls([url])[url].ok)
+        self.assertEqual(warm.requests_made, 0)
+        expired = ExternalLinkChecker(cache=ExternalLinkCache(cache_path, ttl=0))
+        time.sleep(0.01)
+        expired.check_urls([url])
+        self.assertEqual(expired.requests_made, 1)
+
+
+
+class TestMain(unittest.TestCase):
+    def test_no_arguments_keeps_usage_and_status(self):
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit) as cm:
+            main([])
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(out.getvalue(), 'Usage: python check_links.py <directory>\n')
+
+if __name__ == '__main__':
+    unittest.main()
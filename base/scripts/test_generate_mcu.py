@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import io
+import json
+import re
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import generate_mcu
+from generate_mcu import METADATA_PATTERN, MCUGenerator, load_manifest
+from mcu_parser import parse_file
+from mcu_sequence import SequenceAllocator
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestGenerateMCU(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        (self.tmp / 'corpus').mkdir()
+        allocator = SequenceAllocator(self.tmp / 'corpus', cache_dir=self.tmp / 'cache')
+        self.generator = MCUGenerator(allocator)
+        self.generator.templates_dir = str(REPO_ROOT / 'templates')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_render_matches_regex_substitution(self):
+        template = (REPO_ROOT / 'templates' / 'MCU_REFERENCE_TEMPLATE.md').read_text(encoding='utf-8')
+        metadata = self.generator._generate_metadata('reference', 'demo', datetime(2025, 1, 1), 7)
+        expected = re.sub(METADATA_PATTERN.pattern, self.generator._metadata_section(metadata), template)
+        self.assertEqual(self.generator._render(self.generator._load_template('reference'), metadata), expected)
+        self.assertIn('## Context Memory Unit: reference-demo-2025-01-01-007', expected)
+
+    def test_load_manifest_formats(self):
+        csv_path = self.tmp / 'm.csv'
+        csv_path.write_text('type,name,output_dir\nreference,a,out\ninstruction,b,\n', encoding='utf-8')
+        json_path = self.tmp / 'm.json'
+        json_path.write_text(json.dumps({'mcus': [{'type': 'reference', 'name': 'a', 'output_dir': 'out'},
+                                                  {'type': 'instruction', 'name': 'b'}]}), encoding='utf-8')
+        expected = [('reference', 'a', 'out'), ('instruction', 'b', '.')]
+        self.assertEqual(load_manifest(str(csv_path)), expected)
+        self.assertEqual(load_manifest(str(json_path)), expected)
+        bad = self.tmp / 'm.json'
+        bad.write_text('[{"type": "reference"}]', encoding='utf-8')
+        with self.assertRaises(ValueError):
+            load_manifest(str(bad))
+
+    def test_generate_batch(self):
+        out = self.tmp / 'out'
+        entries = [('reference', f'ref-{i}', str(out)) for i in range(5)]
+        entries += [('instruction', 'inst-0', str(out / 'inst')), ('bogus', 'x', str(out))]
+        with redirect_stdout(io.StringIO()) as stdout:
+            generated, failed = self.generator.generate_batch(entries)
+        self.assertEqual((generated, failed), (6, 1))
+        self.assertIn('files/sec', stdout.getvalue())
+        # Each template is read once
+        self.assertEqual(sorted(self.generator._templates), ['instruction', 'reference'])
+
+        sequences = sorted(parse_file(out / f'ref-{i}.md').context_unit_id[-3:] for i in range(5))
+        self.assertEqual(sequences, ['001', '002', '003', '004', '005'])
+        doc = parse_file(out / 'inst' / 'inst-0.md')
+        self.assertTrue(doc.context_unit_id.endswith('-001'))
+        self.assertEqual(doc.metadata['Type'], 'instruction')
+
+
+    def test_reseed(self):
+        allocator = self.generator.allocator
+        self.assertEqual(allocator.allocate('reference', '2025-01-01', count=3), 1)
+        (self.tmp / 'corpus' / 'a.md').write_text(
+            '## Context Memory Unit: reference-a-2025-01-01-001\n- **Type**: reference\n', encoding='utf-8')
+        with mock.patch.object(generate_mcu, 'MCUGenerator', return_value=self.generator), \
+                redirect_stdout(io.StringIO()) as stdout:
+            generate_mcu.run(['--reseed'])
+        self.assertIn('Re-seeded', stdout.getvalue())
+        self.assertEqual(allocator.current('reference', '2025-01-01'), 1)
+
+if __name__ == '__main__':
+    unittest.main()
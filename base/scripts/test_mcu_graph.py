@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import json
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcu_graph import LinkGraph, build_graph, resolve_link
+
+FILES = {
+    'README.md': '# Root\n[Spec](docs/spec.md) [Web](https://example.com) [Self](#root)\n',
+    'docs/spec.md': '# Spec\n[Guide](guide.md) [Back](../README.md) [Missing](nope.md)\n',
+    'docs/guide.md': '# Guide\n[Spec](./spec.md#overview) [Image](img.png)\n',
+    'docs/img.png': '',
+    'lonely.md': '# Lonely\n[Note](NOTES.md#note-1) [Note](NOTES.md#note-2)\n',
+    'NOTES.md': '# Notes\n',
+    '.cache/hidden.md': '# Hidden\n[Spec](../docs/spec.md)\n',
+}
+
+
+class TestLinkGraph(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        for rel, text in FILES.items():
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding='utf-8')
+        self.graph = build_graph(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_resolve_link(self):
+        self.assertEqual(resolve_link(self.root, 'docs/guide.md', './spec.md#overview'),
+                         ('docs/spec.md', 'overview'))
+        self.assertIsNone(resolve_link(self.root, 'README.md', 'https://example.com'))
+        self.assertIsNone(resolve_link(self.root, 'README.md', '#root'))
+        self.assertIsNone(resolve_link(self.root, 'docs/spec.md', 'nope.md'))
+        self.assertIsNone(resolve_link(self.root, 'README.md', '../outside.md'))
+
+    def test_nodes_and_edges(self):
+        g = self.graph
+        self.assertEqual(g.nodes, ['NOTES.md', 'README.md', 'docs/guide.md', 'docs/img.png',
+                                   'docs/spec.md', 'lonely.md'])
+        # lonely.md links NOTES.md twice: one edge, both fragments kept
+        self.assertEqual(g.edge_count, 6)
+        self.assertEqual(g.citations('NOTES.md'), [('lonely.md', ['note-1', 'note-2'])])
+
+    def test_queries(self):
+        g = self.graph
+        roots = [g.node_id('README.md')]
+        self.assertEqual(g.orphans(roots), ['NOTES.md', 'lonely.md'])
+        self.assertEqual(g.cycles(), [['README.md', 'docs/guide.md', 'docs/spec.md']])
+        self.assertEqual(g.most_referenced(2), [('docs/spec.md', 2), ('NOTES.md', 1)])
+        self.assertEqual(g.in_degree()[g.node_id('lonely.md')], 0)
+
+    def test_exports(self):
+        g = self.graph
+        roots = [g.node_id('README.md')]
+        data = json.loads(json.dumps(g.to_json(roots)))
+        self.assertEqual(len(data['nodes']), 6)
+        self.assertEqual(len(data['edges']), 6)
+        self.assertFalse(data['nodes'][g.node_id('lonely.md')]['reachable'])
+        dot = g.to_dot(roots)
+        self.assertTrue(dot.startswith('digraph mcu_links {'))
+        self.assertIn('"lonely.md", style=filled, fillcolor="#fed7d7"', dot)
+        self.assertEqual(dot.count(' -> '), 6)
+
+    def test_self_loop_is_a_cycle(self):
+        g = LinkGraph(Path('.'), ['a.md', 'b.md'], [(0, 0), (0, 1)], documents=[0, 1])
+        self.assertEqual(g.cycles(), [['a.md']])
+
+    def test_adjacency_is_sorted_and_deduplicated(self):
+        rng = random.Random(7)
+        count = 50
+        edges = [(rng.randrange(count), rng.randrange(count)) for _ in range(400)]
+        edges += edges[:100]
+        g = LinkGraph(Path('.'), [f'{i}.md' for i in range(count)], edges)
+        unique = sorted(set(edges))
+        self.assertEqual(g.edge_count, len(unique))
+        for node in range(count):
+            self.assertEqual(list(g.successors(node)), [t for s, t in unique if s == node])
+            self.assertEqual(list(g.predecessors(node)), [s for s, t in unique if t == node])
+
+
+if __name__ == '__main__':
+    unittest.main()
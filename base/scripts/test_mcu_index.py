@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+import mcu_index
+from mcu_index import MCUIndex
+from mcu_parser import parse_file
+
+
+ITEM_MD = """# Item {n}
+
+## Context Memory Unit: backlog-item-mcu-2025-01-01-00{n}
+- **Created**: 2025-01-01T00:00:00Z
+- **Type**: backlog-item
+
+## Source References (≥1)
+- [VIBE_NOTE](../VIBE_NOTE.md#note-{n})
+
+## Tracks (authoritative on item)
+- source_track: {state}
+"""
+
+
+class TestMCUIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.items = self.tmpdir / 'ITEMS'
+        self.items.mkdir()
+        for n in range(3):
+            self._write(n, 'Captured')
+        self.index = MCUIndex(self.tmpdir / 'index.sqlite')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.index.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def _write(self, n: int, state: str) -> Path:
+        path = self.items / f"item_{n}.md"
+        path.write_text(ITEM_MD.format(n=n, state=state), encoding='utf-8')
+        return path
+
+    def test_incremental_refresh(self):
+        stats = self.index.refresh(self.items)
+        self.assertEqual((stats.added, stats.updated, stats.unchanged, stats.removed), (3, 0, 0, 0))
+
+        stats = self.index.refresh(self.items)
+        self.assertEqual((stats.added, stats.updated, stats.unchanged), (0, 0, 3))
+
+        changed = self._write(1, 'Curated')
+        os.utime(changed, ns=(1, 1))
+        (self.items / 'item_2.md').unlink()
+        stats = self.index.refresh(self.items)
+        self.assertEqual((stats.added, stats.updated, stats.unchanged, stats.removed), (0, 1, 1, 1))
+        self.assertEqual(self.index.count(), 2)
+
+    def test_parser_change_rebuilds(self):
+        self.index.refresh(self.items)
+        self.index.close()
+        self.index = MCUIndex(self.tmpdir / 'index.sqlite')
+        self.assertEqual(self.index.count(), 3)
+        self.index.close()
+        with mock.patch.object(mcu_index, 'index_version', return_value='other-parser'):
+            self.index = MCUIndex(self.tmpdir / 'index.sqlite')
+        self.assertEqual(self.index.count(), 0)
+        stats = self.index.refresh(self.items)
+        self.assertEqual(stats.added, 3)
+
+    def test_documents_round_trip(self):
+        self.index.refresh(self.items)
+        docs = list(self.index.documents(self.items, recursive=False))
+        self.assertEqual([d.path.name for d in docs], ['item_0.md', 'item_1.md', 'item_2.md'])
+        doc = docs[1]
+        self.assertEqual(doc.title, 'Item 1')
+        self.assertEqual(doc.context_unit_id, 'backlog-item-mcu-2025-01-01-001')
+        self.assertEqual(doc.metadata, {'Created': '2025-01-01T00:00:00Z', 'Type': 'backlog-item'})
+        self.assertEqual(doc.tracks, {'source_track': 'Captured'})
+        self.assertEqual(doc.source_references, [{'text': 'VIBE_NOTE', 'href': '../VIBE_NOTE.md#note-1'}])
+        self.assertEqual([tuple(link) for link in doc.links], [('VIBE_NOTE', '../VIBE_NOTE.md#note-1')])
+        self.assertIn('Tracks (authoritative on item)', doc.section_map())
+
+
+    def test_documents_match_parse_file(self):
+        crlf = self.items / 'item_crlf.md'
+        crlf.write_bytes(ITEM_MD.format(n=7, state='Curated').replace('\n', '\r\n').encode('utf-8'))
+        self.index.refresh(self.items)
+        for doc in self.index.documents(self.items, recursive=False):
+            parsed = parse_file(doc.path)
+            with self.subTest(path=doc.path.name):
+                self.assertEqual(doc.text, parsed.text)
+                self.assertEqual(doc.lines, parsed.lines)
+                self.assertEqual(doc.section_lines('Tracks'), parsed.section_lines('Tracks'))
+                self.assertEqual(doc.tracks, parsed.tracks)
+
+    def test_undecodable_file_is_not_indexed(self):
+        self.index.refresh(self.items)
+        (self.items / 'item_1.md').write_bytes(b'# Item \xff\n')
+        err = io.StringIO()
+        with redirect_stderr(err):
+            stats = self.index.refresh(self.items)
+        self.assertEqual(stats.removed, 1)
+        self.assertIn('Not indexing', err.getvalue())
+        self.assertEqual([d.path.name for d in self.index.documents(self.items)], ['item_0.md', 'item_2.md'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import unittest
+
+from mcu_parser import parse_text
+
+
+SAMPLE_MD = """# Example Item — Discovery
+
+## Context Memory Unit: backlog-item-mcu-2025-01-01-001
+- **Created**: 2025-01-01T00:00:00Z
+- **Type**: backlog-item
+
+---
+
+## Summary
+- Objective: Example objective
+- **Owner**: operator
+
+## Source References (≥1)
+- [VIBE_NOTE: 2025-01-01T00-00-00Z](../../VIBE_NOTE.md#note-2025-01-01T00-00-00Z)
+- [Spec](../../reference/MCU_NOTE_SPECIFICATION.md)
+See also [README](../../README.md).
+
+## Tracks (authoritative on item)
+- source_track: Captured
+
+- definition_track: Triaged
+- docs_track: 
+
+## Workstreams (read-only, derived from backlog)
+- current_workstream_id: 
+"""
+
+
+class TestMCUParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.doc = parse_text(SAMPLE_MD)
+        return super().setUp()
+
+    def test_header(self):
+        self.assertEqual(self.doc.title, 'Example Item — Discovery')
+        self.assertEqual(self.doc.context_unit_id, 'backlog-item-mcu-2025-01-01-001')
+        self.assertEqual(self.doc.metadata, {'Created': '2025-01-01T00:00:00Z', 'Type': 'backlog-item'})
+        # Document-wide fields include bold bullets outside the header block
+        self.assertEqual(self.doc.fields['Owner'], 'operator')
+
+    def test_metadata_after_blank_line(self):
+        doc = parse_text("# Plan\n\n## Context Memory Unit: plan-x-2024-12-19-001\n\n"
+                         "- **Created**: 2024-12-19T10:00:00Z\n- **Type**: plan\n\n"
+                         "- **Owner**: operator\n\n---\n")
+        self.assertEqual(doc.metadata, {'Created': '2024-12-19T10:00:00Z', 'Type': 'plan'})
+        self.assertEqual(doc.fields['Owner'], 'operator')
+
+    def test_section_map(self):
+        headings = [sec.heading for sec in self.doc.sections]
+        self.assertEqual(headings[0], 'Context Memory Unit: backlog-item-mcu-2025-01-01-001')
+        start, end = self.doc.section_map()['Summary']
+        self.assertEqual(self.doc.lines[start], '## Summary')
+        self.assertTrue(self.doc.lines[end].startswith('## Source References'))
+        self.assertEqual(self.doc.section_lines('Summary')[0], '- Objective: Example objective')
+        self.assertIsNone(self.doc.section('Executive Summary'))
+
+    def test_headings_outside_code_at_column_zero(self):
+        doc = parse_text("# Doc\n\n## Context\nbody\n```markdown\n## Fenced\n# Not a title\n```\n"
+                         "  ## Indented\n~~~\n## Tilde fenced\n~~~\n## Contextual notes\n")
+        self.assertEqual([sec.heading for sec in doc.sections], ['Context', 'Contextual notes'])
+        self.assertEqual(doc.section('Context').end, 12)
+
+    def test_sections_match_by_exact_name(self):
+        doc = parse_text("## Contextual notes\n## Tracks (authoritative on item)\n- source_track: Captured\n")
+        self.assertIsNone(doc.section('Context'))
+        self.assertFalse(doc.has_section('Track'))
+        self.assertEqual(doc.section('Tracks').heading, 'Tracks (authoritative on item)')
+        self.assertTrue(doc.has_section('Tracks (authoritative on item)'))
+        self.assertEqual(doc.tracks, {'source_track': 'Captured'})
+
+    def test_tracks_span_whole_section(self):
+        self.assertEqual(self.doc.tracks, {
+            'source_track': 'Captured',
+            'definition_track': 'Triaged',
+            'docs_track': '',
+        })
+        self.assertEqual(self.doc.workstreams, {'current_workstream_id': ''})
+
+    def test_links(self):
+        self.assertEqual([r['text'] for r in self.doc.source_references],
+                         ['VIBE_NOTE: 2025-01-01T00-00-00Z', 'Spec'])
+        self.assertEqual([link.url for link in self.doc.links][-1], '../../README.md')
+        self.assertEqual(self.doc.lines[self.doc.links[0].line][:3], '- [')
+
+
+if __name__ == '__main__':
+    unittest.main()
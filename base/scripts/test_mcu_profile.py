@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import argparse
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+import mcu_profile
+from validate_mcu import MCUValidator
+
+
+class TestTimings(unittest.TestCase):
+    def test_null_recorder_is_inert(self):
+        timings = mcu_profile.active()
+        self.assertFalse(timings.enabled)
+        self.assertIs(timings.phase('a'), timings.phase('b', 'x.md'))
+        self.assertIs(timings.wrap('a', len), len)
+
+    def test_nested_phases_are_exclusive(self):
+        timings = mcu_profile.Timings()
+        with timings.phase('outer', 'a.md'):
+            time.sleep(0.01)
+            with timings.phase('inner', 'a.md'):
+                time.sleep(0.02)
+        self.assertLess(timings.seconds['outer'], 0.02)
+        self.assertGreaterEqual(timings.seconds['inner'], 0.02)
+        total = timings.seconds['outer'] + timings.seconds['inner']
+        self.assertAlmostEqual(timings.files[os.path.abspath('a.md')], total)
+
+        timed_len = timings.wrap('len', len)
+        self.assertEqual(timed_len('b.md'), 4)
+        self.assertEqual(timings.calls['len'], 1)
+        self.assertEqual([Path(p).name for p, _ in timings.slowest(1)], ['a.md'])
+
+    def test_session_reports_on_exit(self):
+        tmp = Path(tempfile.mkdtemp())
+        try:
+            parser = argparse.ArgumentParser()
+            mcu_profile.add_arguments(parser)
+            args = parser.parse_args(['--timings', '3', '--profile', str(tmp / 'run.prof')])
+            err = io.StringIO()
+            with redirect_stderr(err), self.assertRaises(SystemExit):
+                with mcu_profile.session(args):
+                    self.assertTrue(mcu_profile.active().enabled)
+                    with mcu_profile.active().phase('discover'):
+                        pass
+                    raise SystemExit(1)
+            self.assertFalse(mcu_profile.active().enabled)
+            self.assertIn('discover', err.getvalue())
+            self.assertTrue((tmp / 'run.prof').exists())
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_parse_known(self):
+        args, rest = mcu_profile.parse_known(['reference', 'name', '--timings'])
+        self.assertEqual((args.timings, args.profile, rest), (mcu_profile.DEFAULT_TOP, None, ['reference', 'name']))
+
+
+class TestTimedPaths(unittest.TestCase):
+    def test_timed_validation_matches_untimed(self):
+        scripts = Path(__file__).resolve().parent
+        validator = MCUValidator()
+        paths = sorted(str(p) for p in scripts.glob('*.md'))
+        untimed = [validator.validate_file(path) for path in paths]
+        timings = mcu_profile.Timings()
+        with mock.patch.object(mcu_profile, '_active', timings):
+            self.assertEqual([validator.validate_file(path) for path in paths], untimed)
+        self.assertIn('read', timings.seconds)
+
+    def test_rule_errors_are_reported_when_timed(self):
+        tmp = Path(tempfile.mkdtemp())
+        try:
+            path = str(tmp / 'note.md')
+            Path(path).write_text('## Context Memory Unit: CMU-NOTE-20250101-001\n', encoding='utf-8')
+            validator = MCUValidator()
+            with mock.patch.object(validator, 'validate_document', side_effect=RuntimeError('boom')):
+                untimed = validator.validate_file(path)
+                with mock.patch.object(mcu_profile, '_active', mcu_profile.Timings()):
+                    timed = validator.validate_file(path)
+            self.assertEqual(timed, untimed)
+            self.assertEqual(timed, (False, [f"Error reading file {path}: boom"]))
+        finally:
+            shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    unittest.main()
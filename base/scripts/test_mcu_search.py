@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import mcu
+import mcu_search
+from mcu_search import SearchIndex, parse_tags, resolve_section, tokenize
+
+
+def _mcu(title: str, mcu_type: str, tags: str, summary: str, quick: str, detailed: str = '') -> str:
+    return f"""# {title}
+
+## Context Memory Unit: {mcu_type}-doc-2025-01-01-001
+- **Type**: {mcu_type}
+- **Category**: specification
+- **Tags**: {tags}
+
+## Executive Summary
+{summary}
+
+## Quick Reference
+{quick}
+
+## Detailed Reference
+{detailed}
+"""
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / 'a.md').write_text(
+            _mcu('Kanban Boards', 'reference', '["backlog", "kanban"]', 'Kanban lanes for the backlog.',
+                 'Board columns and lanes.', 'Kanban kanban kanban.'), encoding='utf-8')
+        (self.root / 'b.md').write_text(
+            _mcu('Context Switching', 'instruction', "['plan', 'context']", 'Switching between plans.',
+                 'Kanban is mentioned once here.'), encoding='utf-8')
+        (self.root / '.hidden').mkdir()
+        (self.root / '.hidden' / 'c.md').write_text(_mcu('Hidden', 'reference', '[]', 'kanban', ''),
+                                                    encoding='utf-8')
+        self.index = SearchIndex(self.root / 'search.sqlite')
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.root)
+
+    def _paths(self, hits):
+        return [Path(h.path).name for h in hits]
+
+    def test_helpers(self):
+        self.assertEqual(tokenize('The MCU-index, a 2nd Pass'), ['mcu', 'index', '2nd', 'pass'])
+        self.assertEqual(parse_tags('["backlog-item", "discovery"]'), ['backlog-item', 'discovery'])
+        self.assertEqual(parse_tags('[TAG1, TAG2]'), ['tag1', 'tag2'])
+        self.assertEqual(resolve_section('quick'), 'Quick Reference')
+        with self.assertRaises(ValueError):
+            resolve_section('appendix')
+
+    def test_ranking_sections_and_filters(self):
+        stats = self.index.refresh(self.root)
+        self.assertEqual((stats.added, self.index.count()), (2, 2))
+
+        hits = self.index.search('kanban')
+        self.assertEqual(self._paths(hits), ['a.md', 'b.md'])
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual(hits[0].section, 'Detailed Reference')
+
+        self.assertEqual(self._paths(self.index.search('kanban', section='quick')), ['b.md'])
+        self.assertEqual(self._paths(self.index.search('switching', section='title')), ['b.md'])
+        self.assertEqual(self._paths(self.index.search('kanban', mcu_type='instruction')), ['b.md'])
+        self.assertEqual(self._paths(self.index.search('kanban', tags=['kanban'])), ['a.md'])
+        self.assertEqual(self._paths(self.index.search('kanban', category='guide')), [])
+        self.assertEqual(self.index.search('the'), [])
+
+    def test_incremental_refresh(self):
+        self.index.refresh(self.root)
+        stats = self.index.refresh(self.root)
+        self.assertEqual((stats.added, stats.updated, stats.unchanged), (0, 0, 2))
+
+        b = self.root / 'b.md'
+        b.write_text(_mcu('Release Notes', 'instruction', '[]', 'Nothing about boards.', ''), encoding='utf-8')
+        os.utime(b, ns=(1, 1))
+        (self.root / 'a.md').unlink()
+        stats = self.index.refresh(self.root)
+        self.assertEqual((stats.updated, stats.removed), (1, 1))
+        self.assertEqual(self.index.search('kanban'), [])
+        self.assertEqual(self._paths(self.index.search('release')), ['b.md'])
+
+    def test_tokenizer_change_rebuilds(self):
+        self.index.refresh(self.root)
+        self.index.close()
+        with mock.patch.object(mcu_search, 'search_version', return_value='other-tokenizer'):
+            self.index = SearchIndex(self.root / 'search.sqlite')
+        self.assertEqual(self.index.search('kanban'), [])
+        self.assertEqual(self.index.refresh(self.root).added, 2)
+
+
+    def test_cli_refreshes_only_on_first_use_or_request(self):
+        self.index.close()
+        db = str(self.root / 'search.sqlite')
+        search = ['search', 'release', '--root', str(self.root), '--db', db, '--format', 'json']
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(mcu.main(search[:1] + ['kanban'] + search[2:]), 0)
+        (self.root / 'd.md').write_text(_mcu('Release Notes', 'instruction', '[]', 'Release.', ''), encoding='utf-8')
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(mcu.main(search), 1)
+            self.assertEqual(mcu.main(search + ['--refresh']), 0)
+        self.index = SearchIndex(self.root / 'search.sqlite')
+        self.assertTrue(self.index.has_documents(self.root))
+        self.assertFalse(self.index.has_documents(self.root / '.hidden'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from mcu_index import MCUIndex
+from mcu_sequence import SequenceAllocator, index_sequences, parse_context_id
+
+
+def _doc(context_unit_id: str, mcu_type: str) -> str:
+    return f"# Doc\n\n## Context Memory Unit: {context_unit_id}\n- **Type**: {mcu_type}\n"
+
+
+def _allocate_many(root: str, cache_dir: str, count: int):
+    allocator = SequenceAllocator(Path(root), cache_dir=Path(cache_dir))
+    return [allocator.allocate('reference', '2025-01-01') for _ in range(count)]
+
+
+class TestSequenceAllocator(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.cache = self.root / '.mcu_cache'
+        (self.root / 'docs').mkdir()
+        (self.root / 'docs' / 'a.md').write_text(_doc('reference-a-2025-01-01-004', 'reference'), encoding='utf-8')
+        (self.root / 'docs' / 'b.md').write_text(_doc('instruction-b-2025-01-01-002', 'instruction'),
+                                                 encoding='utf-8')
+        (self.root / 'template.md').write_text(_doc('reference-[tool]-[YYYY-MM-DD]-[SEQ]', 'reference'),
+                                               encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_parse_context_id(self):
+        self.assertEqual(parse_context_id('backlog-item-mcu-2025-08-10-012'), ('2025-08-10', 12))
+        self.assertIsNone(parse_context_id('note-[tool]-[YYYY-MM-DD]-[SEQ]'))
+
+    def test_index_sequences(self):
+        with MCUIndex(self.root / 'index.sqlite') as index:
+            self.assertEqual(index_sequences(index, self.root), {'reference|2025-01-01': 4, 'instruction|2025-01-01': 2})
+
+    def test_allocate_continues_after_existing_ids(self):
+        allocator = SequenceAllocator(self.root, cache_dir=self.cache)
+        self.assertEqual(allocator.allocate('reference', '2025-01-01'), 5)
+        self.assertEqual(allocator.allocate('reference', '2025-01-01'), 6)
+        self.assertEqual(allocator.allocate('reference', '2025-01-02'), 1)
+        self.assertEqual(allocator.allocate('reference', '2025-01-02', count=3), 2)
+        self.assertEqual(allocator.allocate('reference', '2025-01-02'), 5)
+        # Sequences already used on disk are skipped, singly and inside a block
+        (self.root / 'docs' / 'c.md').write_text(_doc('reference-c-2025-01-01-007', 'reference'), encoding='utf-8')
+        self.assertEqual(allocator.current('reference', '2025-01-01'), 6)
+        self.assertEqual(allocator.allocate('reference', '2025-01-01'), 8)
+        (self.root / 'docs' / 'd.md').write_text(_doc('reference-d-2025-01-01-010', 'reference'), encoding='utf-8')
+        self.assertEqual(allocator.allocate('reference', '2025-01-01', count=3), 11)
+        # rebuild() drops reservations that never reached the disk
+        allocator.rebuild()
+        self.assertEqual(allocator.current('reference', '2025-01-01'), 10)
+        self.assertEqual(allocator.current('reference', '2025-01-02'), 0)
+
+    def test_state_is_anchored_to_the_root(self):
+        elsewhere = Path(tempfile.mkdtemp())
+        cwd = os.getcwd()
+        try:
+            os.chdir(elsewhere)
+            with mock.patch.dict(os.environ, {'MCU_CACHE_DIR': str(elsewhere / 'cache')}):
+                self.assertEqual(SequenceAllocator(self.root).allocate('reference', '2025-01-01'), 5)
+            os.chdir(self.root / 'docs')
+            self.assertEqual(SequenceAllocator(self.root).allocate('reference', '2025-01-01'), 6)
+            self.assertTrue((self.cache / 'sequences.json').exists())
+            self.assertTrue((self.cache / 'index.sqlite').exists())
+            self.assertFalse((elsewhere / 'cache').exists())
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(elsewhere)
+
+    def test_seeds_from_index_when_present(self):
+        db = self.root / 'index.sqlite'
+        MCUIndex(db).close()
+        allocator = SequenceAllocator(self.root, cache_dir=self.cache, index_db=db)
+        self.assertEqual(allocator.allocate('instruction', '2025-01-01'), 3)
+
+    def test_concurrent_allocations_are_unique(self):
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(_allocate_many, str(self.root), str(self.cache), 15) for _ in range(4)]
+            allocated = [seq for f in futures for seq in f.result()]
+        self.assertEqual(sorted(allocated), list(range(5, 65)))
+
+
+if __name__ == '__main__':
+    unittest.main()
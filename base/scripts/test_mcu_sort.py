@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from mcu_sort import ExternalSorter
+
+
+class TestExternalSorter(unittest.TestCase):
+    def test_matches_sorted_and_is_stable(self):
+        rng = random.Random(7)
+        records = [{'key': rng.randrange(20), 'n': n} for n in range(1000)]
+        for buffer_size in (1, 7, 100, 5000):
+            with self.subTest(buffer_size=buffer_size), ExternalSorter(lambda r: r['key'], buffer_size) as sorter:
+                sorter.extend(records)
+                self.assertEqual(sorter.runs, len(records) // buffer_size if buffer_size < len(records) else 0)
+                self.assertEqual(list(sorter.sorted()), sorted(records, key=lambda r: r['key']))
+
+    def test_empty(self):
+        with ExternalSorter(lambda r: r, 2) as sorter:
+            self.assertEqual(list(sorter.sorted()), [])
+
+
+    def test_merges_in_passes_above_max_runs(self):
+        rng = random.Random(11)
+        records = [{'key': rng.randrange(20), 'n': n} for n in range(1000)]
+        tmp = tempfile.mkdtemp()
+        try:
+            with ExternalSorter(lambda r: r['key'], 7, tmp_dir=tmp, max_runs=3) as sorter:
+                sorter.extend(records)
+                self.assertEqual(sorter.runs, 142)
+                self.assertEqual(list(sorter.sorted()), sorted(records, key=lambda r: r['key']))
+            self.assertEqual(os.listdir(tmp), [])
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_rejects_empty_buffer(self):
+        for buffer_size in (0, -1):
+            with self.subTest(buffer_size=buffer_size), self.assertRaises(ValueError):
+                ExternalSorter(lambda r: r, buffer_size)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcu_watch import DirectoryWatcher
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        (self.tmpdir / 'a.md').write_text('a', encoding='utf-8')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def _backends(self):
+        backends = ['poll']
+        probe = DirectoryWatcher(self.tmpdir)
+        if probe.backend == 'inotify':
+            backends.append('inotify')
+        probe.close()
+        return backends
+
+    def test_reports_changes_and_removals(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend), DirectoryWatcher(self.tmpdir, interval=0.01, backend=backend) as w:
+                self.assertEqual(w.wait(timeout=0.05), set())
+                (self.tmpdir / 'b.md').write_text('b', encoding='utf-8')
+                self.assertEqual(w.wait(timeout=2), {self.tmpdir / 'b.md'})
+                (self.tmpdir / 'b.md').unlink()
+                self.assertEqual(w.wait(timeout=2), {self.tmpdir / 'b.md'})
+
+    def test_relative_directory_reports_absolute_paths(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmpdir.parent)
+        try:
+            with DirectoryWatcher(Path(self.tmpdir.name), interval=0.01, backend='poll') as w:
+                (self.tmpdir / 'a.md').write_text('changed', encoding='utf-8')
+                self.assertEqual(w.wait(timeout=2), {self.tmpdir.resolve() / 'a.md'})
+        finally:
+            os.chdir(cwd)
+
+    def test_ignores_non_matching_files(self):
+        for backend in self._backends():
+            with self.subTest(backend=backend), DirectoryWatcher(self.tmpdir, interval=0.01, backend=backend) as w:
+                (self.tmpdir / 'notes.json').write_text('{}', encoding='utf-8')
+                self.assertEqual(w.wait(timeout=0.2), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from validate_mcu import MCUValidator, ValidationCache, main
+
+
+VALID_REFERENCE = """# Example Reference
+
+## Context Memory Unit: reference-example-2025-01-01-001
+- **Created**: 2025-01-01T00:00:00Z
+- **Updated**: 2025-01-01T00:00:00Z
+- **Type**: reference
+- **Version**: 1.0
+- **Project**: MCU
+- **Tool**: EXAMPLE
+- **Category**: specification
+- **Tags**: ["reference"]
+
+## Executive Summary
+**TL;DR**: Example.
+
+## Quick Reference
+### **Essential Requirements**
+- One
+
+## Detailed Reference
+Body.
+"""
+
+
+class TestValidateDirectory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        for i in range(12):
+            sub = self.tmpdir / f"d{i % 3}"
+            sub.mkdir(exist_ok=True)
+            text = VALID_REFERENCE if i % 4 else VALID_REFERENCE.replace('## Quick Reference', '## Quick')
+            (sub / f"ref_{i:02d}.md").write_text(text, encoding='utf-8')
+        (self.tmpdir / 'plain.md').write_text('# Not an MCU\n', encoding='utf-8')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def test_parallel_matches_serial(self):
+        validator = MCUValidator()
+        serial = validator.validate_directory(str(self.tmpdir))
+        parallel = validator.validate_directory(str(self.tmpdir), jobs=3)
+        self.assertEqual(list(serial.items()), list(parallel.items()))
+        self.assertTrue(any(not ok for ok, _ in serial.values()))
+
+    def test_hidden_directories_are_skipped(self):
+        hidden = self.tmpdir / '.mcu_cache' / 'bench'
+        hidden.mkdir(parents=True)
+        (hidden / 'ref.md').write_text(VALID_REFERENCE, encoding='utf-8')
+        files = MCUValidator().discover_files(str(self.tmpdir))
+        self.assertEqual(len(files), 13)
+        self.assertFalse(any('.mcu_cache' in path for path in files))
+
+    def test_single_file(self):
+        path = str(self.tmpdir / 'd1' / 'ref_01.md')
+        results = MCUValidator().validate_directory(path, jobs=4)
+        self.assertEqual(results, {path: (True, [])})
+
+
+class TestValidationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.docs = self.tmpdir / 'docs'
+        self.docs.mkdir()
+        self.cache_dir = self.tmpdir / 'cache'
+        for name in ('a.md', 'b.md'):
+            (self.docs / name).write_text(VALID_REFERENCE, encoding='utf-8')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def _run(self):
+        cache = ValidationCache(self.cache_dir)
+        results = MCUValidator().validate_directory(str(self.docs), cache=cache)
+        cache.save()
+        return cache, results
+
+    def test_warm_run_reuses_results(self):
+        cold, cold_results = self._run()
+        self.assertEqual((cold.hits, cold.misses), (0, 2))
+        warm, warm_results = self._run()
+        self.assertEqual((warm.hits, warm.misses), (2, 0))
+        self.assertEqual(cold_results, warm_results)
+
+    def test_changed_file_is_revalidated(self):
+        self._run()
+        (self.docs / 'a.md').write_text(VALID_REFERENCE.replace('**TL;DR**', 'TLDR'), encoding='utf-8')
+        cache, results = self._run()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(results[str(self.docs / 'a.md')], (False, ['Missing TL;DR in Executive Summary']))
+
+    def test_deleted_file_is_evicted(self):
+        self._run()
+        (self.docs / 'b.md').unlink()
+        cache, _ = self._run()
+        self.assertEqual(cache.evicted, 1)
+        self.assertEqual(len(ValidationCache(self.cache_dir).entries), 1)
+
+
+
+class TestMain(unittest.TestCase):
+    def test_no_arguments_keeps_usage_and_status(self):
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit) as cm:
+            main([])
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(out.getvalue(), 'Usage: python validate_mcu.py <directory>\n')
+
+if __name__ == '__main__':
+    unittest.main()
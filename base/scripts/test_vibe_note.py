@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from vibe_note import VibeNoteIndex, scan_entries
+
+NOTE_MD = """# VIBE NOTE
+
+## How to add a note
+
+## [YYYY-MM-DDTHH:MM:SSZ] Short title
+- Scope: area/component
+
+## Notes
+
+<a id="note-2025-08-09T16-02-41Z"></a>
+## [2025-08-09T16:02:41Z] First
+- Scope: one
+
+<a id="note-2025-08-09T18-37-49Z"></a>
+## [2025-08-09T18:37:49Z] Second
+- Scope: two
+
+<a id="note-2025-08-10T00-12-24Z"></a>
+## [2025-08-10T00:12:24Z] Third
+- Scope: three
+"""
+
+
+class TestVibeNoteIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.path = self.tmpdir / 'VIBE_NOTE.md'
+        self.path.write_text(NOTE_MD, encoding='utf-8')
+        self.cache = self.tmpdir / 'cache.json'
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        return super().tearDown()
+
+    def _full_scan(self):
+        with open(self.path, 'rb') as f:
+            return [e.to_list() for e in scan_entries(f)]
+
+    def test_lookup_by_timestamp_and_anchor(self):
+        notes = VibeNoteIndex(self.path, self.cache)
+        self.assertEqual([e.title for e in notes.entries], ['First', 'Second', 'Third'])
+        text = notes.get('note-2025-08-09T18-37-49Z')
+        self.assertTrue(text.startswith('<a id="note-2025-08-09T18-37-49Z"></a>\n## [2025-08-09T18:37:49Z] Second\n'))
+        self.assertIn('- Scope: two', text)
+        self.assertNotIn('Third', text)
+        self.assertEqual(notes.get('2025-08-09T18:37:49Z'), text)
+        self.assertIsNone(notes.get('2025-01-01T00:00:00Z'))
+        with self.assertRaises(ValueError):
+            notes.get('yesterday')
+
+    def test_range(self):
+        notes = VibeNoteIndex(self.path)
+        self.assertEqual([e.title for e in notes.range('2025-08-09')], ['First', 'Second', 'Third'])
+        self.assertEqual([e.title for e in notes.range(None, '2025-08-09')], ['First', 'Second'])
+        self.assertEqual([e.title for e in notes.range('2025-08-09T17', '2025-08-10T00:12:24Z')], ['Second', 'Third'])
+
+    def test_cache_and_incremental_refresh(self):
+        VibeNoteIndex(self.path, self.cache)
+        self.assertEqual(VibeNoteIndex(self.path, self.cache).last_refresh, 'cached')
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('- More: three\n\n<a id="note-2025-08-11T09-00-00Z"></a>\n## [2025-08-11T09:00:00Z] Fourth\n- x\n')
+        notes = VibeNoteIndex(self.path, self.cache)
+        self.assertEqual(notes.last_refresh, 'appended')
+        self.assertEqual([e.to_list() for e in notes.entries], self._full_scan())
+
+        self.path.write_text(NOTE_MD.replace('First', 'Erste'), encoding='utf-8')
+        notes = VibeNoteIndex(self.path, self.cache)
+        self.assertEqual(notes.last_refresh, 'rebuilt')
+        self.assertEqual(notes.entries[0].title, 'Erste')
+
+    def test_append(self):
+        notes = VibeNoteIndex(self.path, self.cache)
+        entry = notes.append('Fourth', '- Scope: four\n', timestamp='2025-08-11T09:00:00Z')
+        self.assertEqual(entry.anchor, 'note-2025-08-11T09-00-00Z')
+        self.assertEqual([e.to_list() for e in notes.entries], self._full_scan())
+        self.assertEqual(notes.get('2025-08-11T09:00:00Z'),
+                         '<a id="note-2025-08-11T09-00-00Z"></a>\n## [2025-08-11T09:00:00Z] Fourth\n- Scope: four\n')
+        self.assertEqual(VibeNoteIndex(self.path, self.cache).last_refresh, 'cached')
+
+
+if __name__ == '__main__':
+    unittest.main()
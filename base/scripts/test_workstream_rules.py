@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+import builtins
+import io
+import itertools
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+import workstream_rules
+from workstream_rules import DEFAULT_RULES, RULES_PATH, RulesError, WorkstreamRules, get_rules, load_rules_document
+
+TRACKS = ('source_track', 'definition_track', 'execution_track', 'validation_track')
+STATES = (
+    ['', 'Captured', 'Curated', 'Typo'],
+    ['', 'Triaged', 'AC-Ready', 'Typo'],
+    ['', 'Not-Started', 'In-Progress', 'Blocked', 'Completed', 'Typo'],
+    ['', 'Implicit-Validated', 'Explicit-Accepted', 'Typo'],
+)
+
+
+class TestWorkstreamRules(unittest.TestCase):
+    def test_shipped_yaml_matches_defaults(self):
+        try:
+            import yaml  # noqa: F401
+        except ImportError:
+            self.skipTest('PyYAML not installed')
+        document, source = load_rules_document(RULES_PATH)
+        self.assertEqual(source, RULES_PATH)
+        self.assertEqual(document, DEFAULT_RULES)
+
+    def test_table_lookup_matches_rule_evaluation(self):
+        rules = WorkstreamRules(DEFAULT_RULES)
+        for name in ('workstream', 'planning', 'release'):
+            classifier = rules[name]
+            for values in itertools.product(*STATES):
+                tracks = {t: v for t, v in zip(TRACKS, values) if v}
+                self.assertEqual(classifier.lookup(tracks), classifier.evaluate(tracks), (name, tracks))
+
+    def test_unknown_states_do_not_grow_the_table(self):
+        classifier = WorkstreamRules(DEFAULT_RULES)['workstream']
+        size = len(classifier.table)
+        with mock.patch.object(workstream_rules, 'MAX_MEMO_SIZE', 8):
+            classifier = WorkstreamRules(DEFAULT_RULES)['workstream']
+            for n in range(20):
+                self.assertEqual(classifier.lookup({'execution_track': f'Typo{n}'}), 'Unassigned')
+        self.assertEqual(len(classifier.table), size)
+        self.assertLessEqual(len(classifier.memo), 8)
+
+    def test_missing_pyyaml_warns(self):
+        real_import = builtins.__import__
+
+        def no_yaml(name, *args, **kwargs):
+            if name == 'yaml':
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        err = io.StringIO()
+        with mock.patch('builtins.__import__', no_yaml), redirect_stderr(err):
+            document, source = load_rules_document(RULES_PATH)
+        self.assertEqual((document, source), (DEFAULT_RULES, None))
+        self.assertIn(str(RULES_PATH), err.getvalue())
+
+    def test_examples(self):
+        rules = get_rules()
+        self.assertEqual(rules.classify('workstream', {'source_track': 'Captured'}), 'Discovery')
+        self.assertEqual(rules.classify('workstream', {'definition_track': 'AC-Ready'}), 'Planning')
+        self.assertEqual(rules.classify('workstream', {'execution_track': 'Paused'}), 'Unassigned')
+        self.assertEqual(rules.classify('planning', {'execution_track': 'Blocked'}), 'Plan-Accepted')
+        self.assertEqual(rules.classify('release', {}), 'Waiting')
+
+    def test_custom_rules_file(self):
+        tmpdir = Path(tempfile.mkdtemp())
+        try:
+            path = tmpdir / 'rules.yaml'
+            path.write_text(
+                "classifiers:\n"
+                "  workstream:\n"
+                "    default: Other\n"
+                "    rules:\n"
+                "      - result: Parked\n"
+                "        when: {defer_track: [Deferred, Permanently-Deferred]}\n",
+                encoding='utf-8')
+            try:
+                import yaml  # noqa: F401
+            except ImportError:
+                self.skipTest('PyYAML not installed')
+            rules = get_rules(path)
+            self.assertEqual(rules.classify('workstream', {'defer_track': 'Deferred'}), 'Parked')
+            self.assertEqual(rules.classify('workstream', {'source_track': 'Captured'}), 'Other')
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_malformed_rules(self):
+        with self.assertRaises(RulesError):
+            WorkstreamRules({})
+        with self.assertRaises(RulesError):
+            WorkstreamRules({'classifiers': {'x': {'rules': [{'when': {}}]}}})
+        with self.assertRaises(RulesError):
+            WorkstreamRules({'classifiers': {'x': {'rules': [{'result': 'A', 'when': {'t': {'is': 'B'}}}]}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,17 +6,33 @@ This script validates MCU files for compliance with the MCU specification.
 It checks metadata completeness, content structure, and quality standards.
 """
 
+import argparse
 import os
 import sys
 import re
-import yaml
+import time
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from mcu_parser import MCUDocument, parse_text
+from mcu_cache import atomic_write_json, default_cache_dir, load_json, sha256_file, source_fingerprint
+import mcu_profile
+from mcu_cli import jobs_arg
+
 NON_MCU_PREFIXES = (
     "__vibew-",
 )
 
+NOTE_HEADING_RE = re.compile(r'^\[\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z\]')
+
+CACHE_FILE_NAME = 'validate.json'
+
+
+def validator_version() -> str:
+    """Fingerprint of the validator rules; any edit to this file or the parser invalidates cached results."""
+    import mcu_parser
+    return source_fingerprint(__file__, mcu_parser.__file__)
+
 class MCUValidator:
     """Validates MCU files against the specification."""
     
@@ -36,32 +52,51 @@ class MCUValidator:
         self.valid_types = ['reference', 'instruction', 'instruction-agent', 'specification', 'note', 'backlog', 'backlog-item']
         self.valid_categories = ['framework', 'specification', 'template', 'example', 'governance']
         
+    def _read_mcu(self, file_path: str) -> Optional[str]:
+        """Return the content of file_path, or None if it is not an MCU to validate."""
+        # Skip known non-MCU families by filename prefix
+        base = os.path.basename(file_path)
+        for prefix in NON_MCU_PREFIXES:
+            if base.startswith(prefix):
+                return None
+        
+        # Skip templates from strict validation
+        if os.path.abspath(file_path).replace('\\', '/').find('/templates/') != -1:
+            return None
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+            
+        if not file_path.endswith('.md'):
+            return None  # ignore non-markdown files
+            
+        # Only validate files that declare themselves as MCUs
+        if '## Context Memory Unit:' not in content:
+            return None
+        return content
+        
     def validate_file(self, file_path: str) -> Tuple[bool, List[str]]:
         """Validate a single MCU file."""
-        errors: List[str] = []
-        
+        timings = mcu_profile.active()
         try:
-            # Skip known non-MCU families by filename prefix
-            base = os.path.basename(file_path)
-            for prefix in NON_MCU_PREFIXES:
-                if base.startswith(prefix):
-                    return True, []
-            
-            # Skip templates from strict validation
-            if os.path.abspath(file_path).replace('\\', '/').find('/templates/') != -1:
+            with timings.phase('read', file_path):
+                content = self._read_mcu(file_path)
+            if content is None:
                 return True, []
+            with timings.phase('parse', file_path):
+                doc = parse_text(content)
+            with timings.phase('rules', file_path):
+                return self.validate_document(file_path, doc)
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            if not file_path.endswith('.md'):
-                return True, []  # ignore non-markdown files
-                
-            # Only validate files that declare themselves as MCUs
-            if '## Context Memory Unit:' not in content:
-                return True, []
-                
-            metadata = self._extract_metadata(content)
+        except Exception as e:
+            return False, [f"Error reading file {file_path}: {str(e)}"]
+    
+    def validate_document(self, file_path: str, doc: MCUDocument) -> Tuple[bool, List[str]]:
+        """Apply the validation rules to an already-parsed MCU document."""
+        errors: List[str] = []
+        
+        try:
+            metadata = self._extract_metadata(doc)
             if not metadata:
                 errors.append("No metadata section found")
                 return False, errors
@@ -77,14 +112,14 @@ class MCUValidator:
             
             # Structure rules vary by type
             if mcu_type == 'note':
-                errors.extend(self._validate_note_structure(content))
+                errors.extend(self._validate_note_structure(doc))
             elif mcu_type == 'backlog':
-                errors.extend(self._validate_backlog_structure(content))
+                errors.extend(self._validate_backlog_structure(doc))
             elif mcu_type == 'backlog-item':
-                errors.extend(self._validate_backlog_item_structure(content))
+                errors.extend(self._validate_backlog_item_structure(doc))
             else:
-                errors.extend(self._validate_structure(content))
-                errors.extend(self._validate_sections(content))
+                errors.extend(self._validate_structure(doc))
+                errors.extend(self._validate_sections(doc))
             
             return len(errors) == 0, errors
             
@@ -92,20 +127,16 @@ class MCUValidator:
             errors.append(f"Error reading file {file_path}: {str(e)}")
             return False, errors
     
-    def _extract_metadata(self, content: str) -> Optional[Dict]:
-        """Extract metadata from MCU file."""
-        header_match = re.search(r'^## Context Memory Unit: (.+)$', content, re.MULTILINE)
-        if not header_match:
+    def _extract_metadata(self, doc: MCUDocument) -> Optional[Dict]:
+        """Extract metadata from MCU file.
+
+        Every `- **Key**: value` line in the document contributes, so body
+        fields can satisfy (or override) header fields.
+        """
+        if not doc.context_unit_id:
             return None
-        context_unit_id = header_match.group(1).strip()
-        lines = content.split('\n')
-        metadata: Dict[str, str] = {'context_unit_id': context_unit_id}
-        for line in lines:
-            if line.startswith('- **') and '**:' in line:
-                key, value = line.split('**:', 1)
-                key = key.replace('- **', '').strip()
-                value = value.strip()
-                metadata[key] = value
+        metadata: Dict[str, str] = {'context_unit_id': doc.context_unit_id}
+        metadata.update(doc.fields)
         return metadata
     
     def _validate_metadata(self, metadata: Dict) -> List[str]:
@@ -126,53 +157,50 @@ class MCUValidator:
                 errors.append("Invalid context_unit_id format. Expected: type-[tool]-YYYY-MM-DD-SEQ")
         return errors
     
-    def _validate_structure(self, content: str) -> List[str]:
+    def _validate_structure(self, doc: MCUDocument) -> List[str]:
         errors: List[str] = []
         required_sections = [
-            '## Executive Summary',
-            '## Quick Reference',
-            '## Detailed Reference'
+            'Executive Summary',
+            'Quick Reference',
+            'Detailed Reference'
         ]
         for section in required_sections:
-            if section not in content:
-                errors.append(f"Missing required section: {section}")
+            if not doc.has_section(section):
+                errors.append(f"Missing required section: ## {section}")
         return errors
     
-    def _validate_sections(self, content: str) -> List[str]:
+    def _validate_sections(self, doc: MCUDocument) -> List[str]:
         errors: List[str] = []
-        if '## Executive Summary' in content and '**TL;DR**:' not in content:
+        if doc.has_section('Executive Summary') and '**TL;DR**:' not in doc.text:
             errors.append("Missing TL;DR in Executive Summary")
-        if '## Quick Reference' in content and '### **Essential' not in content:
+        if doc.has_section('Quick Reference') and '### **Essential' not in doc.text:
             errors.append("Missing Essential Requirements in Quick Reference")
         return errors
     
-    def _validate_note_structure(self, content: str) -> List[str]:
+    def _validate_note_structure(self, doc: MCUDocument) -> List[str]:
         """Validate minimal structure for Note MCUs."""
         errors: List[str] = []
-        if '## Notes' not in content:
+        if not doc.has_section('Notes'):
             errors.append('Missing required section: ## Notes')
-        timestamp_heading_re = re.compile(r'^## \[\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z\]', re.MULTILINE)
-        if not timestamp_heading_re.search(content):
+        if not any(NOTE_HEADING_RE.match(sec.heading) for sec in doc.sections):
             errors.append('No timestamped note entries found (expected headings like ## [YYYY-MM-DDTHH:MM:SSZ])')
         return errors
 
-    def _validate_backlog_structure(self, content: str) -> List[str]:
+    def _validate_backlog_structure(self, doc: MCUDocument) -> List[str]:
         """Validate minimal structure for Backlog MCUs."""
         errors: List[str] = []
-        if '## Items Index' not in content:
+        if not doc.has_section('Items Index'):
             errors.append('Missing required section: ## Items Index')
         return errors
 
-    def _validate_backlog_item_structure(self, content: str) -> List[str]:
+    def _validate_backlog_item_structure(self, doc: MCUDocument) -> List[str]:
         """Validate minimal structure for Backlog Item MCUs."""
         errors: List[str] = []
-        if '## Source References' not in content:
+        if not doc.has_section('Source References'):
             errors.append('Missing required section: ## Source References')
-        else:
-            # Require at least one markdown link in the Source References section
-            # Rough check for a [text](link) pattern anywhere in the doc
-            if not re.search(r'\[[^\]]+\]\([^\)]+\)', content):
-                errors.append('No source references found (expected at least one [text](link))')
+        elif not doc.links:
+            # Require at least one markdown link (rough check: anywhere in the doc)
+            errors.append('No source references found (expected at least one [text](link))')
         return errors
 
     def _validate_backlog_item_filename(self, file_path: str) -> List[str]:
@@ -197,43 +225,212 @@ class MCUValidator:
             errors.append('Invalid systemID in filename. Allowed: alphanumeric and underscore (^[A-Za-z0-9_]+$)')
         return errors
 
-    def validate_directory(self, directory: str) -> Dict[str, Tuple[bool, List[str]]]:
-        results: Dict[str, Tuple[bool, List[str]]] = {}
+    def discover_files(self, directory: str) -> List[str]:
+        """Return the markdown files under directory in os.walk order.
+
+        Hidden directories (`.git`, `.mcu_cache`, ...) are skipped.
+        """
         if os.path.isfile(directory):
-            is_valid, errors = self.validate_file(directory)
-            results[directory] = (is_valid, errors)
-            return results
-        for root, _, files in os.walk(directory):
+            return [directory]
+        file_paths: List[str] = []
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
             for file in files:
                 if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    is_valid, errors = self.validate_file(file_path)
-                    results[file_path] = (is_valid, errors)
-        return results
+                    file_paths.append(os.path.join(root, file))
+        return file_paths
 
-def main():
-    validator = MCUValidator()
-    if len(sys.argv) < 2:
+    def validate_directory(self, directory: str, jobs: int = 1,
+                           cache: Optional['ValidationCache'] = None) -> Dict[str, Tuple[bool, List[str]]]:
+        """Validate every markdown file under directory.
+
+        With jobs > 1 files are spread across a process pool; results are
+        merged back in discovery order so output matches a serial run.
+        When a cache is given, unchanged files reuse their previous result
+        and only the misses are validated.
+        """
+        timings = mcu_profile.active()
+        with timings.phase('discover'):
+            file_paths = self.discover_files(directory)
+        results: Dict[str, Tuple[bool, List[str]]] = {}
+        pending = file_paths
+        if cache is not None:
+            pending = []
+            with timings.phase('cache'):
+                for file_path in file_paths:
+                    cached = cache.lookup(file_path)
+                    if cached is None:
+                        pending.append(file_path)
+                    else:
+                        results[file_path] = cached
+        if jobs > 1 and len(pending) > 1:
+            with timings.phase('validate (pool)'):
+                outcomes = _validate_parallel(pending, jobs)
+        else:
+            outcomes = [self.validate_file(file_path) for file_path in pending]
+        for file_path, outcome in zip(pending, outcomes):
+            results[file_path] = outcome
+        if cache is not None:
+            with timings.phase('cache'):
+                for file_path, outcome in zip(pending, outcomes):
+                    cache.store(file_path, outcome)
+                cache.evict_missing(directory, file_paths)
+        return {file_path: results[file_path] for file_path in file_paths}
+
+
+class ValidationCache:
+    """Persistent per-file validation results keyed by path, mtime, content hash and validator version.
+
+    A file whose mtime and size are unchanged is a hit without being read.
+    If the mtime moved, the content hash decides: identical bytes still
+    reuse the stored result. The whole cache is dropped when the validator
+    version changes.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.path = Path(cache_dir or default_cache_dir()) / CACHE_FILE_NAME
+        self.version = validator_version()
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._dirty = False
+        data = load_json(self.path, default={})
+        if isinstance(data, dict) and data.get('version') == self.version:
+            self.entries = data.get('entries') or {}
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    def lookup(self, file_path: str) -> Optional[Tuple[bool, List[str]]]:
+        entry = self.entries.get(self._key(file_path))
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            st = os.stat(file_path)
+            if entry['mtime_ns'] != st.st_mtime_ns or entry['size'] != st.st_size:
+                if entry['sha256'] != sha256_file(Path(file_path)):
+                    self.misses += 1
+                    return None
+                entry['mtime_ns'] = st.st_mtime_ns
+                entry['size'] = st.st_size
+                self._dirty = True
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['is_valid'], list(entry['errors'])
+
+    def store(self, file_path: str, outcome: Tuple[bool, List[str]]) -> None:
+        try:
+            st = os.stat(file_path)
+            digest = sha256_file(Path(file_path))
+        except OSError:
+            return  # unreadable files are revalidated next run
+        is_valid, errors = outcome
+        self.entries[self._key(file_path)] = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'sha256': digest,
+            'is_valid': is_valid,
+            'errors': list(errors),
+        }
+        self._dirty = True
+
+    def evict_missing(self, directory: str, seen: List[str]) -> None:
+        """Drop entries under directory that were not seen in this run (deleted or renamed files)."""
+        root = os.path.abspath(directory)
+        prefix = root if os.path.isfile(root) else root.rstrip(os.sep) + os.sep
+        seen_keys = {self._key(p) for p in seen}
+        stale = [k for k in self.entries if (k == root or k.startswith(prefix)) and k not in seen_keys]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.evicted += len(stale)
+            self._dirty = True
+
+    def save(self) -> None:
+        if self._dirty:
+            atomic_write_json(self.path, {'version': self.version, 'entries': self.entries})
+            self._dirty = False
+
+
+_worker_validator: Optional[MCUValidator] = None
+
+
+def _init_worker() -> None:
+    global _worker_validator
+    _worker_validator = MCUValidator()
+
+
+def _validate_in_worker(file_path: str) -> Tuple[bool, List[str]]:
+    assert _worker_validator is not None
+    return _worker_validator.validate_file(file_path)
+
+
+def _validate_parallel(file_paths: List[str], jobs: int) -> List[Tuple[bool, List[str]]]:
+    """Validate files in a process pool, preserving input order."""
+    from concurrent.futures import ProcessPoolExecutor
+    workers = min(jobs, len(file_paths))
+    # Batch files per task so IPC overhead stays small on large trees
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(_validate_in_worker, file_paths, chunksize=chunksize))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Validate MCU files against the specification.')
+    parser.add_argument('directory', nargs='?', help='File or directory to validate')
+    parser.add_argument('--jobs', '-j', type=jobs_arg, default=1,
+                        help='Number of worker processes (default: 1; 0 = one per CPU)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse results for unchanged files from a persistent cache')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Cache directory (default: $MCU_CACHE_DIR or ./.mcu_cache)')
+    mcu_profile.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.directory is None:
+        # Same message and status as before the argparse rewrite; hooks check $?
         print("Usage: python validate_mcu.py <directory>")
         sys.exit(1)
-    directory = sys.argv[1]
+    with mcu_profile.session(args):
+        run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    validator = MCUValidator()
+    directory = args.directory
     if not os.path.exists(directory):
         print(f"Directory not found: {directory}")
         sys.exit(1)
     print(f"Validating MCU files in: {directory}")
     print("=" * 50)
-    results = validator.validate_directory(directory)
+    cache = ValidationCache(Path(args.cache_dir) if args.cache_dir else None) if args.cache else None
+    started = time.perf_counter()
+    results = validator.validate_directory(directory, jobs=args.jobs, cache=cache)
+    elapsed = time.perf_counter() - started
+    timings = mcu_profile.active()
+    if cache is not None:
+        with timings.phase('cache'):
+            cache.save()
     valid_count = sum(1 for _, (ok, _) in results.items() if ok)
     total_count = len(results)
-    for file_path, (is_valid, errors) in results.items():
-        if is_valid:
-            print(f"✅ {file_path}")
-        else:
-            print(f"❌ {file_path}")
-            for error in errors:
-                print(f"   - {error}")
+    with timings.phase('emit'):
+        for file_path, (is_valid, errors) in results.items():
+            if is_valid:
+                print(f"✅ {file_path}")
+            else:
+                print(f"❌ {file_path}")
+                for error in errors:
+                    print(f"   - {error}")
     print("=" * 50)
     print(f"Validation complete: {valid_count}/{total_count} files valid")
+    if cache is not None:
+        state = 'warm' if cache.misses == 0 and total_count else 'cold' if cache.hits == 0 else 'partial'
+        print(f"Cache ({state}): {cache.hits} hit(s), {cache.misses} miss(es), "
+              f"{cache.evicted} evicted in {elapsed:.3f}s")
     if any(not ok for ok, _ in results.values()):
         sys.exit(1)
     else:
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+VIBE_NOTE Library
+
+Random access to the append-only operator log `VIBE_NOTE.md`, whose entries
+look like:
+
+    <a id="note-2025-08-09T16-18-55Z"></a>
+    ## [2025-08-09T16:18:55Z] Alignment Observations
+    - Scope: ...
+
+The file is scanned once into a byte-offset index (timestamp, title, start,
+end) that is cached in `.mcu_cache/vibe_note_index.json` together with the
+file's size, mtime and a hash of its last bytes:
+
+- unchanged size/mtime: the cached index is used as is;
+- the file only grew (the old tail is intact): only the bytes from the last
+  indexed entry onward are scanned;
+- anything else: the index is rebuilt.
+
+Fetching a note by timestamp (or `#note-...` anchor) or a timestamp range
+seeks straight to the entry. `append()` writes a new entry and extends the
+index without rescanning.
+
+Usage:
+  python3 base/scripts/vibe_note.py list
+  python3 base/scripts/vibe_note.py show 2025-08-09T16:18:55Z
+  python3 base/scripts/vibe_note.py show note-2025-08-09T16-18-55Z
+  python3 base/scripts/vibe_note.py range 2025-08-09 2025-08-10
+  python3 base/scripts/vibe_note.py add "Short title" --body "- Scope: ..."
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from mcu_cache import atomic_write_json, default_cache_dir, load_json, sha256_bytes
+import mcu_profile
+
+NOTE_INDEX_FILE_NAME = 'vibe_note_index.json'
+NOTE_INDEX_VERSION = 1
+# Bytes hashed at the end of the file to tell an append from a rewrite
+TAIL_BYTES = 4096
+
+NOTE_HEADING_RE = re.compile(rb'^## \[(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)\][ \t]*(.*?)\s*$')
+NOTE_ANCHOR_RE = re.compile(rb'^<a id="note-[^"]*"></a>\s*$')
+TIMESTAMP_RE = re.compile(r'^(?:note-)?(\d{4}-\d{2}-\d{2})T(\d{2})[:-](\d{2})[:-](\d{2})Z$')
+
+
+def normalize_timestamp(value: str) -> str:
+    """Accept `2025-08-09T16:18:55Z`, `2025-08-09T16-18-55Z` or `note-...`; return the heading form."""
+    m = TIMESTAMP_RE.match(value.strip().lstrip('#'))
+    if not m:
+        raise ValueError(f"Not a note timestamp: {value!r}")
+    return f"{m.group(1)}T{m.group(2)}:{m.group(3)}:{m.group(4)}Z"
+
+
+def note_anchor(timestamp: str) -> str:
+    return 'note-' + timestamp.replace(':', '-')
+
+
+class NoteEntry:
+    """One indexed note: heading timestamp/title and its [start, end) byte range."""
+
+    __slots__ = ('timestamp', 'title', 'start', 'end')
+
+    def __init__(self, timestamp: str, title: str, start: int, end: int):
+        self.timestamp = timestamp
+        self.title = title
+        self.start = start
+        self.end = end
+
+    @property
+    def anchor(self) -> str:
+        return note_anchor(self.timestamp)
+
+    def to_list(self) -> List:
+        return [self.timestamp, self.title, self.start, self.end]
+
+    def __repr__(self) -> str:
+        return f"NoteEntry({self.timestamp!r}, {self.title!r}, {self.start}, {self.end})"
+
+
+def scan_entries(f, offset: int = 0) -> List[NoteEntry]:
+    """Scan a binary file from offset (a line start) and return its entries.
+
+    An entry starts at its `<a id="note-...">` line when that directly precedes
+    the heading, and ends where the next entry or non-note H2 section starts.
+    """
+    f.seek(offset)
+    entries: List[NoteEntry] = []
+    pos = offset
+    anchor_at: Optional[int] = None
+    current: Optional[NoteEntry] = None
+    for line in f:
+        if line.startswith(b'## '):
+            m = NOTE_HEADING_RE.match(line)
+            start = anchor_at if anchor_at is not None else pos
+            if current is not None:
+                current.end = start
+                current = None
+            if m:
+                current = NoteEntry(m.group(1).decode('ascii'), m.group(2).decode('utf-8', 'replace'), start, start)
+                entries.append(current)
+            anchor_at = None
+        elif NOTE_ANCHOR_RE.match(line):
+            anchor_at = pos
+        elif line.strip():
+            anchor_at = None
+        pos += len(line)
+    if current is not None:
+        current.end = pos if anchor_at is None else anchor_at
+    return entries
+
+
+class VibeNoteIndex:
+    """Byte-offset index of a VIBE_NOTE file, cached and refreshed incrementally."""
+
+    def __init__(self, path: Path, cache_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.cache_path = cache_path
+        self.entries: List[NoteEntry] = []
+        self._by_timestamp: Dict[str, NoteEntry] = {}
+        self._sorted: List[str] = []
+        self._signature: Optional[Dict] = None
+        self.last_refresh = ''
+        if cache_path is not None:
+            data = load_json(cache_path, default={})
+            cached = data.get('files', {}).get(self._key()) if isinstance(data, dict) and \
+                data.get('version') == NOTE_INDEX_VERSION else None
+            if cached:
+                self._signature = cached['signature']
+                self._set_entries([NoteEntry(*e) for e in cached['entries']])
+        self.refresh()
+
+    def _key(self) -> str:
+        return self.path.resolve().as_posix()
+
+    def _set_entries(self, entries: List[NoteEntry]) -> None:
+        self.entries = entries
+        self._by_timestamp = {}
+        for entry in entries:
+            self._by_timestamp.setdefault(entry.timestamp, entry)
+        self._sorted = sorted(self._by_timestamp)
+
+    def _file_signature(self, f, size: int, mtime_ns: int) -> Dict:
+        f.seek(max(0, size - TAIL_BYTES))
+        return {'size': size, 'mtime_ns': mtime_ns, 'tail': sha256_bytes(f.read(TAIL_BYTES))}
+
+    def _tail_matches(self, f, signature: Dict) -> bool:
+        old_size = signature['size']
+        f.seek(max(0, old_size - TAIL_BYTES))
+        return sha256_bytes(f.read(old_size - max(0, old_size - TAIL_BYTES))) == signature['tail']
+
+    def refresh(self) -> str:
+        """Bring the index up to date; returns 'cached', 'appended' or 'rebuilt'."""
+        st = os.stat(self.path)
+        old = self._signature
+        if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+            self.last_refresh = 'cached'
+            return self.last_refresh
+        with open(self.path, 'rb') as f:
+            if old and st.st_size > old['size'] and self._tail_matches(f, old):
+                # Append: the last entry may have grown, so rescan from its start
+                keep = self.entries[:-1]
+                offset = self.entries[-1].start if self.entries else self._resume_offset(old['size'])
+                self._set_entries(keep + scan_entries(f, offset))
+                self.last_refresh = 'appended'
+            else:
+                self._set_entries(scan_entries(f))
+                self.last_refresh = 'rebuilt'
+            self._signature = self._file_signature(f, st.st_size, st.st_mtime_ns)
+        self.save()
+        return self.last_refresh
+
+    def _resume_offset(self, old_size: int) -> int:
+        # No entries yet: the appended bytes start after the old end, which
+        # may be mid-line if the file lacked a trailing newline
+        with open(self.path, 'rb') as f:
+            f.seek(max(0, old_size - 1))
+            return old_size if f.read(1) == b'\n' else 0
+
+    def save(self) -> None:
+        if self.cache_path is None or self._signature is None:
+            return
+        data = load_json(self.cache_path, default={})
+        if not isinstance(data, dict) or data.get('version') != NOTE_INDEX_VERSION:
+            data = {'version': NOTE_INDEX_VERSION, 'files': {}}
+        data.setdefault('files', {})[self._key()] = {
+            'signature': self._signature,
+            'entries': [e.to_list() for e in self.entries],
+        }
+        atomic_write_json(self.cache_path, data)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def entry(self, timestamp: str) -> Optional[NoteEntry]:
+        """The first entry with this timestamp (any accepted form), or None."""
+        return self._by_timestamp.get(normalize_timestamp(timestamp))
+
+    def read(self, entry: NoteEntry) -> str:
+        """The entry's text (anchor, heading and body), read by seeking."""
+        with open(self.path, 'rb') as f:
+            f.seek(entry.start)
+            return f.read(entry.end - entry.start).decode('utf-8')
+
+    def get(self, timestamp: str) -> Optional[str]:
+        entry = self.entry(timestamp)
+        return self.read(entry) if entry is not None else None
+
+    def range(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[NoteEntry]:
+        """Entries with start <= timestamp <= end, in timestamp order.
+
+        Bounds may be any prefix of a timestamp, e.g. `2025-08` or `2025-08-09T16`;
+        an `end` prefix includes every timestamp that starts with it.
+        """
+        lo = bisect.bisect_left(self._sorted, start) if start else 0
+        hi = bisect.bisect_right(self._sorted, end + '\uffff') if end else len(self._sorted)
+        for ts in self._sorted[lo:hi]:
+            yield self._by_timestamp[ts]
+
+    def append(self, title: str, body: str, timestamp: Optional[str] = None) -> NoteEntry:
+        """Append a note to the file and extend the index without rescanning."""
+        self.refresh()
+        timestamp = normalize_timestamp(timestamp) if timestamp else \
+            datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        with open(self.path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 2))
+            tail = f.read(2)
+            # Separate from the previous entry by a blank line
+            if not size or tail.endswith(b'\n\n'):
+                prefix = b''
+            elif tail.endswith(b'\n'):
+                prefix = b'\n'
+            else:
+                prefix = b'\n\n'
+            text = f'<a id="{note_anchor(timestamp)}"></a>\n## [{timestamp}] {title.strip()}\n{body.rstrip()}\n'
+            data = prefix + text.encode('utf-8')
+            f.seek(0, os.SEEK_END)
+            f.write(data)
+            new_size = size + len(data)
+        if self.entries and self.entries[-1].end == size:
+            # The separator belongs to the previous entry, as a rescan would find
+            self.entries[-1].end = size + len(prefix)
+        entry = NoteEntry(timestamp, title.strip(), size + len(prefix), new_size)
+        self._set_entries(self.entries + [entry])
+        st = os.stat(self.path)
+        with open(self.path, 'rb') as f:
+            self._signature = self._file_signature(f, st.st_size, st.st_mtime_ns)
+        self.save()
+        return entry
+
+
+def open_notes(path: Optional[Path] = None, cache: bool = True, cache_dir: Optional[Path] = None) -> VibeNoteIndex:
+    """Open the repository VIBE_NOTE.md (or path) with its cached index."""
+    path = Path(path) if path else Path(__file__).resolve().parents[2] / 'VIBE_NOTE.md'
+    cache_path = ((Path(cache_dir) if cache_dir else default_cache_dir()) / NOTE_INDEX_FILE_NAME) if cache else None
+    return VibeNoteIndex(path, cache_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Indexed access to VIBE_NOTE.md entries.')
+    parser.add_argument('--file', default=None, help='Note file (default: repo VIBE_NOTE.md)')
+    parser.add_argument('--cache-dir', default=None, help='Cache directory (default: .mcu_cache or $MCU_CACHE_DIR)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the index cache')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_list = sub.add_parser('list', help='List entries (timestamp, anchor, title)')
+    p_show = sub.add_parser('show', help='Print one entry')
+    p_show.add_argument('timestamp', help='YYYY-MM-DDTHH:MM:SSZ or note-YYYY-MM-DDTHH-MM-SSZ')
+    p_range = sub.add_parser('range', help='Print entries between two timestamps (prefixes allowed)')
+    p_range.add_argument('start', nargs='?', default=None)
+    p_range.add_argument('end', nargs='?', default=None)
+    p_add = sub.add_parser('add', help='Append a new entry')
+    p_add.add_argument('title')
+    p_add.add_argument('--body', default='', help='Entry body (default: read from stdin)')
+    p_add.add_argument('--timestamp', default=None, help='Entry timestamp (default: now, UTC)')
+    for p_command in (p_list, p_show, p_range, p_add):
+        mcu_profile.add_arguments(p_command)
+    args = parser.parse_args(argv)
+    with mcu_profile.session(args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    path = Path(args.file) if args.file else None
+    try:
+        with mcu_profile.active().phase('index'):
+            notes = open_notes(path, cache=not args.no_cache,
+                               cache_dir=Path(args.cache_dir) if args.cache_dir else None)
+    except FileNotFoundError as e:
+        print(f"❌ Note file not found: {e.filename}")
+        return 1
+
+    if args.command == 'list':
+        for entry in notes.entries:
+            print(f"{entry.timestamp}  {entry.anchor}  {entry.title}")
+    elif args.command == 'show':
+        try:
+            text = notes.get(args.timestamp)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        if text is None:
+            print(f"❌ No note at {args.timestamp}")
+            return 1
+        sys.stdout.write(text)
+    elif args.command == 'range':
+        for entry in notes.range(args.start, args.end):
+            sys.stdout.write(notes.read(entry))
+    else:
+        body = args.body if args.body else sys.stdin.read()
+        entry = notes.append(args.title, body, args.timestamp)
+        print(f"✅ Added {entry.anchor}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
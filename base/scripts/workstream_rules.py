@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Workstream Inference Rules
+
+Loads the declarative classifiers in backlog-item/workstream_rules.yaml
+(workstream, planning and release) and compiles each one into a dictionary
+keyed by the tuple of track states its rules look at, e.g.
+(source_track, definition_track, execution_track, validation_track).
+
+Compilation enumerates every state named in the rules, plus one "any other
+state" placeholder per track, and evaluates the ordered rules once for each
+combination. Classifying an item is then a single dict lookup, so
+backlog_report.py and backlog_kanban.py stay consistent and O(1) per item.
+
+Track tuples with states the rules do not name are folded into the OTHER
+placeholders; their answers are memoized in a separate dict of at most
+MAX_MEMO_SIZE entries, so free-form values seen by a long --watch session
+cannot grow the table.
+
+When the rules file is missing, DEFAULT_RULES (identical to the shipped YAML,
+see test_workstream_rules.py) is used. When the file exists but PyYAML is not
+installed, DEFAULT_RULES is used too and a warning is printed to stderr,
+since edits to the file are then ignored.
+
+Library usage:
+  from workstream_rules import get_rules
+  rules = get_rules()
+  rules.classify('workstream', tracks)   # e.g. 'Planning'
+  rules['planning'](tracks)              # e.g. 'Waiting'
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+RULES_PATH = Path(__file__).resolve().parents[2] / 'backlog-item' / 'workstream_rules.yaml'
+
+# Refuse to build absurdly large tables from a misconfigured rules file
+MAX_TABLE_SIZE = 1_000_000
+
+# Memoized lookups of track tuples with states not named in the rules
+MAX_MEMO_SIZE = 4096
+
+DEFAULT_RULES: Dict = {
+    'classifiers': {
+        'workstream': {
+            'default': 'Unassigned',
+            'rules': [
+                {'result': 'Discovery', 'when': {'source_track': 'Captured'}},
+                {'result': 'Definition', 'when': {'source_track': 'Curated', 'definition_track': {'not': 'AC-Ready'}}},
+                {'result': 'Planning', 'when': {'definition_track': 'AC-Ready', 'execution_track': ['', 'Not-Started']}},
+                {'result': 'Delivery (Execution)', 'when': {'execution_track': ['In-Progress', 'Blocked']}},
+                {'result': 'Validation', 'when': {'execution_track': 'Completed', 'validation_track': {'not': 'Explicit-Accepted'}}},
+                {'result': 'Release', 'when': {'validation_track': 'Explicit-Accepted'}},
+            ],
+        },
+        'planning': {
+            'default': 'Waiting',
+            'rules': [
+                {'result': 'Plan-Accepted', 'when': {'execution_track': ['In-Progress', 'Blocked', 'Completed']}},
+            ],
+        },
+        'release': {
+            'default': 'Waiting',
+            'rules': [
+                {'result': 'Released', 'when': {'validation_track': 'Explicit-Accepted'}},
+            ],
+        },
+    },
+}
+
+
+class RulesError(ValueError):
+    """Raised when a rules file is malformed."""
+
+
+class _Other:
+    """Placeholder for any track state not named in the rules."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return '<other>'
+
+
+OTHER = _Other()
+
+
+def _states(value) -> List[str]:
+    values = value if isinstance(value, list) else [value]
+    for v in values:
+        if not isinstance(v, str):
+            raise RulesError(f"Track states must be strings, got {v!r}")
+    return values
+
+
+def _compile_condition(cond) -> Tuple[bool, frozenset]:
+    """Return (negated, states) for a `when` condition."""
+    if isinstance(cond, dict):
+        if set(cond) != {'not'}:
+            raise RulesError(f"Unsupported condition: {cond!r}")
+        return True, frozenset(_states(cond['not']))
+    if cond is None:
+        cond = ''
+    return False, frozenset(_states(cond))
+
+
+class Classifier:
+    """One compiled classifier: tracks -> result via a dict lookup."""
+
+    def __init__(self, name: str, spec: Mapping):
+        if not isinstance(spec, Mapping) or 'rules' not in spec:
+            raise RulesError(f"Classifier {name!r} needs a 'rules' list")
+        self.name = name
+        self.default: str = spec.get('default', 'Unassigned')
+        rules: List[Tuple[str, Dict[str, Tuple[bool, frozenset]]]] = []
+        for rule in spec['rules'] or []:
+            if not isinstance(rule, Mapping) or 'result' not in rule:
+                raise RulesError(f"Classifier {name!r}: each rule needs a 'result'")
+            when = rule.get('when') or {}
+            rules.append((rule['result'], {track: _compile_condition(c) for track, c in when.items()}))
+        self.rules = rules
+
+        # Key tracks in first-mention order; each domain gets an OTHER slot
+        self.tracks: Tuple[str, ...] = tuple(dict.fromkeys(t for _, when in rules for t in when))
+        self.domains: Tuple[frozenset, ...] = tuple(
+            frozenset(s for _, when in rules if t in when for s in when[t][1]) for t in self.tracks)
+        size = 1
+        for domain in self.domains:
+            size *= len(domain) + 1
+        if size > MAX_TABLE_SIZE:
+            raise RulesError(f"Classifier {name!r} would need {size} table entries")
+        self.table: Dict[Tuple, str] = {
+            key: self.evaluate(dict(zip(self.tracks, key)))
+            for key in itertools.product(*(sorted(d) + [OTHER] for d in self.domains))
+        }
+        # Answers for tuples outside the table (see _make_lookup)
+        self.memo: Dict[Tuple, str] = {}
+        self.lookup = self._make_lookup()
+
+    def evaluate(self, tracks: Mapping[str, str]) -> str:
+        """Apply the rules in order without the table (used to build it)."""
+        for result, when in self.rules:
+            if all((tracks.get(t, '') in states) != negated for t, (negated, states) in when.items()):
+                return result
+        return self.default
+
+    def _make_lookup(self):
+        table, memo, tracks, domains = self.table, self.memo, self.tracks, self.domains
+        blanks = ('',) * len(tracks)
+
+        def lookup(item_tracks: Mapping[str, str]) -> str:
+            key = tuple(map(item_tracks.get, tracks, blanks))
+            result = table.get(key)
+            if result is None:
+                result = memo.get(key)
+            if result is None:
+                # Some state is not named in the rules: fold it into OTHER and
+                # remember the answer for this exact tuple, within bounds
+                result = table[tuple([v if v in d else OTHER for v, d in zip(key, domains)])]
+                if len(memo) >= MAX_MEMO_SIZE:
+                    memo.clear()
+                memo[key] = result
+            return result
+        return lookup
+
+    def __call__(self, tracks: Mapping[str, str]) -> str:
+        return self.lookup(tracks)
+
+    def results(self) -> List[str]:
+        """Every result this classifier can return, in rule order."""
+        return list(dict.fromkeys([r for r, _ in self.rules] + [self.default]))
+
+
+class WorkstreamRules:
+    """The compiled set of classifiers from a rules document."""
+
+    def __init__(self, document: Mapping, source: Optional[Path] = None):
+        classifiers = document.get('classifiers') if isinstance(document, Mapping) else None
+        if not isinstance(classifiers, Mapping) or not classifiers:
+            raise RulesError(f"{source or 'rules'}: missing 'classifiers' mapping")
+        self.source = source
+        self.classifiers: Dict[str, Classifier] = {
+            name: Classifier(name, spec) for name, spec in classifiers.items()}
+
+    def __getitem__(self, name: str) -> Classifier:
+        return self.classifiers[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.classifiers
+
+    def classify(self, name: str, tracks: Mapping[str, str]) -> str:
+        return self.classifiers[name].lookup(tracks)
+
+    def classify_many(self, name: str, items: Iterable[Mapping[str, str]]) -> List[str]:
+        lookup = self.classifiers[name].lookup
+        return [lookup(tracks) for tracks in items]
+
+
+def load_rules_document(path: Path = RULES_PATH) -> Tuple[Dict, Optional[Path]]:
+    """Return (document, source path); DEFAULT_RULES when the file or PyYAML is missing."""
+    path = Path(path)
+    if not path.exists():
+        return DEFAULT_RULES, None
+    try:
+        import yaml
+    except ImportError:
+        print(f"⚠️  PyYAML is not installed: ignoring {path} and using the built-in workstream rules",
+              file=sys.stderr)
+        return DEFAULT_RULES, None
+    try:
+        document = yaml.safe_load(path.read_text(encoding='utf-8'))
+    except yaml.YAMLError as e:
+        raise RulesError(f"{path}: {e}") from e
+    return document, path
+
+
+@lru_cache(maxsize=None)
+def get_rules(path: Path = RULES_PATH) -> WorkstreamRules:
+    """Return the process-wide compiled rules for path."""
+    document, source = load_rules_document(path)
+    return WorkstreamRules(document, source)